@@ -11,8 +11,11 @@ from src.data.views import data_bp
 from src.errors.handlers import error_bp
 from src.certs.views import cert_bp
 from src.content.views import content_bp
+from src.commands import snapshot_command
 
-from src.db import db
+from src.db import db, migrate
+from src.json_provider import JSONProvider
+from src.services.search import search_index
 
 
 def create_app() -> Flask:
@@ -24,6 +27,7 @@ def create_app() -> Flask:
         Flask: Flask app instance
     """
     application = Flask(__name__)
+    application.json = JSONProvider(application)
     app_config = Config()
     application.config.from_object(app_config)
     application.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
@@ -36,10 +40,16 @@ def create_app() -> Flask:
     application.register_blueprint(cert_bp)
     application.register_blueprint(content_bp)
 
-    # create DB tables
+    # register CLI commands
+    application.cli.add_command(snapshot_command)
+
+    # create or upgrade DB tables
     with application.app_context():
         db.init_app(application)
-        db.create_all()
+        migrate()
+    # the search index is built by the first search or write,
+    # so CLI commands such as flask snapshot never load it
+    search_index.clear()
 
     # additional security headers in responses
     @application.after_request
@@ -2,16 +2,28 @@
 Module defining an API for all CRUD operations
 """
 
+import base64
+import binascii
+import functools
+import hashlib
 import os
 
-from datetime import datetime
+from typing import Callable
 
-from flask import Blueprint, jsonify, Response, request
+from flask import Blueprint, current_app, jsonify, Response, request, url_for
 
-from src.db import db
-from src.models.cert import Cert
-from src.models.resource import Resource
-from src.models.section import Section
+from src.models.version import TableVersion
+from src.services.cert import CertService
+from src.services.dates import parse_date, parse_datetime
+from src.services.ingest import IngestService, parse_urls
+from src.services.resource import ResourceService
+from src.services.scraper import scrape_queue
+from src.services.planner import PlannerService
+from src.services.section import SectionService
+from src.services.snapshot import SnapshotService
+from src.services.stats import StatsService
+from src.services.suggest import DEFAULT_SUGGESTIONS, MAX_SUGGESTIONS, suggest_index
+from src.services.tag import TagService
 
 api_bp = Blueprint(
     name="api",
@@ -19,22 +31,164 @@ api_bp = Blueprint(
     url_prefix=f"/api/v{os.getenv("API_VERSION")}"
 )
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def to_bool(value: str) -> bool:
+    """
+    Converts a query string value to a boolean
+
+    Args:
+        value (str): query string value
+
+    Raises:
+        ValueError: if the value is not a boolean string
+
+    Returns:
+        bool: converted value
+    """
+    if value.lower() in ("true", "1"):
+        return True
+    if value.lower() in ("false", "0"):
+        return False
+    raise ValueError(f"Invalid boolean value '{value}'")
+
+
+def encode_cursor(last_id: int) -> str:
+    """
+    Encodes the ID of the last item on a page as an
+    opaque cursor string
+
+    Args:
+        last_id (int): ID of the last item on the page
+
+    Returns:
+        str: cursor string
+    """
+    return base64.urlsafe_b64encode(f"id:{last_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Decodes a cursor string created by encode_cursor
+
+    Args:
+        cursor (str): cursor string
+
+    Raises:
+        ValueError: if the cursor is malformed
+
+    Returns:
+        int: ID of the last item on the previous page
+    """
+    try:
+        prefix, last_id = base64.urlsafe_b64decode(cursor).decode().split(":")
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor '{cursor}'") from e
+    if prefix != "id":
+        raise ValueError(f"Invalid cursor '{cursor}'")
+    return int(last_id)
+
+
+def etag(*tables: str) -> Callable:
+    """
+    Decorator adding a strong ETag to a GET route built from
+    the request path and the versions of the tables the route
+    reads. Requests with a matching If-None-Match header get
+    a 304 Not Modified response without the route being run
+
+    Args:
+        *tables (str): names of the tables the route reads
+
+    Returns:
+        Callable: route decorator
+    """
+    def decorator(view: Callable) -> Callable:
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs) -> Response:
+            # versions are read before the data so a write in between
+            # can only make the ETag older than the data, never newer
+            versions = TableVersion.get(tables)
+            key = f"{request.full_path}|{sorted(versions.items())}"
+            tag = hashlib.sha1(key.encode()).hexdigest()
+            if tag in request.if_none_match:
+                response = Response(status=304)
+            else:
+                response = view(*args, **kwargs)
+            response.set_etag(tag)
+            return response
+        return wrapper
+    return decorator
+
+
+def paginate(get_all: Callable, **filters) -> Response:
+    """
+    Returns a page of items ordered by ID using keyset
+    pagination. The page is controlled by the optional
+    query parameters:
+
+    - limit: number of items per page
+    - after: cursor returned in the 'next' link of the previous page
+
+    A 'Link' header with rel="next" is set if more items exist
+
+    Args:
+        get_all (Callable): service method returning the items
+        **filters: filters to pass to the service method
+
+    Returns:
+        Response: Flask Response object
+    """
+    limit = request.args.get("limit", default=DEFAULT_PAGE_SIZE, type=int)
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    after = None
+    if "after" in request.args:
+        try:
+            after = decode_cursor(request.args["after"])
+        except ValueError:
+            return jsonify({
+                "message": "Invalid cursor",
+                "status": 400,
+            })
+    # fetch one extra item to find out if there is a next page
+    items = get_all(after=after, limit=limit + 1, **filters)
+    response = jsonify(items[:limit])
+    if len(items) > limit:
+        args = request.args.to_dict()
+        args["limit"] = limit
+        args["after"] = encode_cursor(items[limit - 1]["id"])
+        next_url = url_for(request.endpoint, _external=True, **args)
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+    return response
+
 
 # =============== Cert CRUD Ops ===============
 
 @api_bp.route("/cert")
+@etag("certs", "tags", "tag_association")
 def get_all_certs() -> Response:
     """
-    Gets all Certs from the database
+    Gets a page of Certs from the database. Results can be
+    filtered with the optional query parameters:
+
+    - tag: repeat to only get Certs with all of the given tags
+    - exam_from: yyyy-mm-dd, exams on or after this date
+    - exam_to: yyyy-mm-dd, exams on or before this date
 
     Returns:
         Response: Flask Response object
     """
-    certs = Cert.query.all()
-    return jsonify(certs)
+    return paginate(
+        CertService.get_all,
+        tags=request.args.getlist("tag"),
+        exam_from=request.args.get("exam_from", type=parse_date),
+        exam_to=request.args.get("exam_to", type=parse_date),
+    )
 
 
 @api_bp.route("/cert/<int:cert_id>")
+@etag("certs")
 def get_cert(cert_id: int) -> Response:
     """
     Gets a Cert from the database by ID
@@ -45,8 +199,24 @@ def get_cert(cert_id: int) -> Response:
     Returns:
         Response: Flask Response object
     """
-    cert = Cert.query.filter_by(id=cert_id).first()
-    return jsonify(cert)
+    return jsonify(CertService.get(cert_id))
+
+
+@api_bp.route("/cert/<int:cert_id>/bundle")
+@etag("certs", "resources", "sections")
+def get_cert_bundle(cert_id: int) -> Response:
+    """
+    Gets a Cert from the database by ID along with its
+    Resources grouped by type and its Sections grouped
+    by Resource ID
+
+    Args:
+        int (cert_id): id of cert
+
+    Returns:
+        Response: Flask Response object
+    """
+    return jsonify(CertService.get_bundle(cert_id))
 
 
 @api_bp.route("/cert", methods=["POST"])
@@ -58,22 +228,7 @@ def post_cert() -> Response:
     Returns:
         Response: Flask Response object
     """
-    data = request.get_json()
-    cert = Cert(
-        name=data["name"],
-        code=data["code"],
-        head_img=data["head_img"],
-        badge_img=data["badge_img"],
-        exam_date=data["exam_date"],
-        tags=data["tags"],
-        created=datetime.now().strftime("%d/%m/%Y"),
-    )
-    db.session.add(cert)
-    db.session.commit()
-    return jsonify({
-        "message": "Cert created successfully",
-        "status": 200,
-    })
+    return jsonify(CertService.create(request.get_json()))
 
 
 @api_bp.route("/cert/<int:cert_id>", methods=["PUT"])
@@ -88,25 +243,22 @@ def put_cert(cert_id: int) -> Response:
     Returns:
         Response: Flask Response object
     """
-    cert = Cert.query.filter_by(id=cert_id).first()
-    if not cert:
-        return jsonify({
-            "message": "Cert not found",
-            "status": 404,
-        })
-    data = request.get_json()
-    cert.name = data["name"]
-    cert.code = data["code"]
-    cert.head_img = data["head_img"]
-    cert.badge_img = data["badge_img"]
-    cert.exam_date = data["exam_date"]
-    cert.tags = data["tags"]
-    db.session.add(cert)
-    db.session.commit()
-    return jsonify({
-        "message": "Cert updated successfully",
-        "status": 200,
-    })
+    return jsonify(CertService.update(cert_id, request.get_json()))
+
+
+@api_bp.route("/cert/<int:cert_id>", methods=["PATCH"])
+def patch_cert(cert_id: int) -> Response:
+    """
+    Updates only the provided fields of a Cert
+    in the database
+
+    Args:
+        int (cert_id): id of cert
+
+    Returns:
+        Response: Flask Response object
+    """
+    return jsonify(CertService.patch(cert_id, request.get_json()))
 
 
 @api_bp.route("/cert/<int:cert_id>", methods=["DELETE"])
@@ -120,35 +272,177 @@ def delete_cert(cert_id: int) -> Response:
     Returns:
         Response: Flask Response object
     """
-    cert = Cert.query.filter_by(id=cert_id).first()
-    if not cert:
+    return jsonify(CertService.delete(cert_id))
+
+
+# =============== Tag Ops ===============
+
+@api_bp.route("/tag")
+@etag("tags", "tag_association")
+def get_tags() -> Response:
+    """
+    Gets every tag in use with the number of Certs
+    that have it, most used first
+
+    Returns:
+        Response: Flask Response object
+    """
+    return jsonify(TagService.get_counts())
+
+
+# =============== Stats Ops ===============
+
+@api_bp.route("/stats")
+@etag("certs", "resource_stats", "weekly_resource_stats")
+def get_stats() -> Response:
+    """
+    Gets section progress, Resource completion by type,
+    and Resources added per week across every Cert
+
+    Returns:
+        Response: Flask Response object
+    """
+    return jsonify(StatsService.get())
+
+
+@api_bp.route("/cert/<int:cert_id>/stats")
+@etag("certs", "resource_stats", "weekly_resource_stats")
+def get_cert_stats(cert_id: int) -> Response:
+    """
+    Gets section progress, Resource completion by type,
+    and Resources added per week for a Cert
+
+    Args:
+        int (cert_id): id of cert
+
+    Returns:
+        Response: Flask Response object
+    """
+    return jsonify(StatsService.get(cert_id))
+
+
+# not cached with an ETag as the default range moves with the date
+@api_bp.route("/cert/<int:cert_id>/snapshots")
+def get_cert_snapshots(cert_id: int) -> Response:
+    """
+    Gets a Cert's daily progress for charting from its
+    snapshots. The range can be set with the optional
+    query parameters:
+
+    - start: yyyy-mm-dd, first day, 30 days before end by default
+    - end: yyyy-mm-dd, last day, today by default
+
+    Args:
+        int (cert_id): id of cert
+
+    Returns:
+        Response: Flask Response object
+    """
+    return jsonify(SnapshotService.get_series(
+        cert_id,
+        start=request.args.get("start"),
+        end=request.args.get("end"),
+    ))
+
+
+@api_bp.route("/plan")
+def get_plans() -> Response:
+    """
+    Gets the study plan of every Cert with the Sections per
+    day needed to finish before the exam, the recent pace,
+    the projected completion date, and an on track status
+
+    Returns:
+        Response: Flask Response object
+    """
+    return jsonify(list(PlannerService.get_all().values()))
+
+
+@api_bp.route("/cert/<int:cert_id>/plan")
+def get_cert_plan(cert_id: int) -> Response:
+    """
+    Gets the study plan of a Cert with a day by day schedule
+    of its incomplete Sections for up to 60 days before the exam
+
+    Args:
+        int (cert_id): id of cert
+
+    Returns:
+        Response: Flask Response object
+    """
+    return jsonify(PlannerService.get(cert_id))
+
+
+# =============== Open Graph Ops ===============
+
+@api_bp.route("/og/<token>")
+def get_og_job(token: str) -> Response:
+    """
+    Gets the status of a queued Open Graph lookup and the
+    scraped properties once it is done
+
+    Args:
+        token (str): job token
+
+    Returns:
+        Response: Flask Response object
+    """
+    return jsonify(scrape_queue.status(token))
+
+
+@api_bp.route("/og", methods=["POST"])
+def post_og_lookup() -> Response:
+    """
+    Looks up the Open Graph metadata of the URL in the
+    provided JSON data string. Cached metadata is returned
+    straight away, otherwise the page is queued for scraping
+    and the status URL can be polled for the result
+
+    Returns:
+        Response: Flask Response object
+    """
+    url = (request.get_json(silent=True) or {}).get("url")
+    try:
+        # pylint: disable=protected-access
+        job = scrape_queue.lookup(current_app._get_current_object(), url)
+    except ValueError:
         return jsonify({
-            "message": "Cert not found",
-            "status": 404,
+            "message": "Invalid URL",
+            "status": 400,
         })
-    Cert.query.filter_by(id=cert_id).delete()
-    db.session.commit()
-    return jsonify({
-        "message": "Cert deleted successfully",
-        "status": 200
-    })
+    if job["token"]:
+        job["status_url"] = url_for("api.get_og_job", token=job["token"])
+    return jsonify(job)
 
 
 # =============== Resource CRUD Ops ===============
 
 @api_bp.route("/resource")
+@etag("resources")
 def get_all_resources() -> Response:
     """
-    Gets all Resources from the database
+    Gets a page of Resources from the database. Results can be
+    filtered with the optional query parameters:
+
+    - cert_id
+    - resource_type
+    - complete
+    - updated_since: ISO 8601 time, Resources updated at or after this
 
     Returns:
         Response: Flask Response object
     """
-    resources = Resource.query.all()
-    return jsonify(resources)
+    return paginate(
+        ResourceService.get_all,
+        updated_since=request.args.get("updated_since", type=parse_datetime),
+        cert_id=request.args.get("cert_id", type=int),
+        resource_type=request.args.get("resource_type"),
+        complete=request.args.get("complete", type=to_bool),
+    )
 
 
 @api_bp.route("/resource/<int:resource_id>")
+@etag("resources")
 def get_resource(resource_id: int) -> Response:
     """
     Gets a Resource from the database by ID
@@ -159,8 +453,7 @@ def get_resource(resource_id: int) -> Response:
     Returns:
         Response: Flask Response object
     """
-    resource = Resource.query.filter_by(id=resource_id).first()
-    return jsonify(resource)
+    return jsonify(ResourceService.get(resource_id))
 
 
 @api_bp.route("/resource", methods=["POST"])
@@ -168,32 +461,51 @@ def post_resource() -> Response:
     """
     Creates a Resource
 
+    Returns:
+        Response: Flask Response object
+    """
+    return jsonify(ResourceService.create(request.get_json()))
+
+
+@api_bp.route("/resource/import", methods=["POST"])
+def import_resources() -> Response:
+    """
+    Copies Resources onto a Cert. Expects JSON with
+    the target 'cert_id' and a list of 'resource_ids'
+
     Returns:
         Response: Flask Response object
     """
     data = request.get_json()
-    # add default images if none provided
-    image = data["image"] if data["image"] else "default_image.jpg"
-    logo = data["site_logo"] if data["site_logo"] else "default_logo.png"
-    resource = Resource(
-        cert_id=data["cert_id"],
-        resource_type=data["resource_type"],
-        url=data["url"],
-        title=data["title"],
-        image=image,
-        description=data["description"],
-        site_logo=logo,
-        site_name=data["site_name"],
-        has_og_data=data["has_og_data"],
-        complete=data["complete"],
-        created=datetime.now().strftime("%m/%d/%Y:%H:%M:%S"),
-    )
-    db.session.add(resource)
-    db.session.commit()
-    return jsonify({
-        "message": "Resource created successfully",
-        "status": 200,
-    })
+    return jsonify(ResourceService.import_resources(
+        data.get("cert_id"),
+        data.get("resource_ids", []),
+    ))
+
+
+@api_bp.route("/resource/bulk", methods=["POST"])
+def post_resources_bulk() -> Response:
+    """
+    Creates Resources on a Cert from a list of URLs,
+    fetching the metadata of every page concurrently.
+    Expects JSON with the target 'cert_id', a
+    'resource_type', and either a list of 'urls' or the
+    'text' of a bookmarks export or pasted URLs
+
+    Returns:
+        Response: Flask Response object
+    """
+    data = request.get_json()
+    links = data.get("urls")
+    if links is None:
+        links = parse_urls(data.get("text"))
+    # pylint: disable=protected-access
+    return jsonify(IngestService.ingest(
+        current_app._get_current_object(),
+        data.get("cert_id"),
+        data.get("resource_type"),
+        links,
+    ))
 
 
 @api_bp.route("/resource/<int:resource_id>", methods=["PUT"])
@@ -207,30 +519,22 @@ def put_resource(resource_id: int) -> Response:
     Returns:
         Response: Flask Response object
     """
-    data = request.get_json()
-    resource = Resource.query.filter_by(id=resource_id).first()
-    if not resource:
-        return jsonify({
-            "message": "Resource not found",
-            "status": 404,
-        })
-    # add default images if none provided
-    image = data["image"] if data["image"] else "default_image.jpg"
-    logo = data["site_logo"] if data["site_logo"] else "default_logo.png"
-    resource.resource_type = data["resource_type"]
-    resource.url = data["url"]
-    resource.title = data["title"]
-    resource.image = image
-    resource.description = data["description"]
-    resource.site_logo = logo
-    resource.site_name = data["site_name"]
-    resource.complete = data["complete"]
-    resource.updated = datetime.now().strftime("%m/%d/%Y:%H:%M:%S")
-    db.session.commit()
-    return jsonify({
-        "message": "Resource updated successfully",
-        "status": 200,
-    })
+    return jsonify(ResourceService.update(resource_id, request.get_json()))
+
+
+@api_bp.route("/resource/<int:resource_id>", methods=["PATCH"])
+def patch_resource(resource_id: int) -> Response:
+    """
+    Updates only the provided fields of a Resource
+    in the database
+
+    Args:
+        int (resource_id): id of resource
+
+    Returns:
+        Response: Flask Response object
+    """
+    return jsonify(ResourceService.patch(resource_id, request.get_json()))
 
 
 @api_bp.route("/resource/<int:resource_id>", methods=["DELETE"])
@@ -244,34 +548,35 @@ def delete_resource(resource_id: int) -> Response:
     Returns:
         Response: Flask Response object
     """
-    deletions = Resource.query.filter_by(id=resource_id).delete()
-    if deletions > 0:
-        db.session.commit()
-        return jsonify({
-            "message": "Resource deleted successfully",
-            "status": 200
-        })
-    return jsonify({
-        "message": "Resource not found",
-        "status": 404,
-    })
+    return jsonify(ResourceService.delete(resource_id))
 
 
 # =============== Section CRUD Ops ===============
 
 @api_bp.route("/section")
+@etag("sections")
 def get_all_sections() -> Response:
     """
-    Gets all Sections from the database
+    Gets a page of Sections from the database. Results can be
+    filtered with the optional query parameters:
+
+    - cert_id
+    - resource_id
+    - complete
 
     Returns:
         Response: Flask Response object
     """
-    sections = Section.query.all()
-    return jsonify(sections)
+    return paginate(
+        SectionService.get_all,
+        cert_id=request.args.get("cert_id", type=int),
+        resource_id=request.args.get("resource_id", type=int),
+        complete=request.args.get("complete", type=to_bool),
+    )
 
 
 @api_bp.route("/section/<int:section_id>")
+@etag("sections")
 def get_section(section_id: int) -> Response:
     """
     Gets a Section from the database by ID
@@ -282,8 +587,7 @@ def get_section(section_id: int) -> Response:
     Returns:
         Response: Flask Response object
     """
-    section = Section.query.filter_by(id=section_id).first()
-    return jsonify(section)
+    return jsonify(SectionService.get(section_id))
 
 
 @api_bp.route("/section", methods=["POST"])
@@ -294,20 +598,19 @@ def post_section() -> Response:
     Returns:
         Response: Flask Response object
     """
-    data = request.get_json()
-    section = Section(
-        cert_id=data["cert_id"],
-        resource_id=data["resource_id"],
-        number=data["number"],
-        title=data["title"],
-        created=datetime.now().strftime("%m/%d/%Y:%H:%M:%S"),
-    )
-    db.session.add(section)
-    db.session.commit()
-    return jsonify({
-        "message": "Section created successfully",
-        "status": 200,
-    })
+    return jsonify(SectionService.create(request.get_json()))
+
+
+@api_bp.route("/section/bulk", methods=["POST"])
+def post_sections() -> Response:
+    """
+    Creates multiple Sections from a JSON list in
+    a single transaction
+
+    Returns:
+        Response: Flask Response object
+    """
+    return jsonify(SectionService.create_bulk(request.get_json()))
 
 
 @api_bp.route("/section/<int:section_id>", methods=["PUT"])
@@ -321,23 +624,22 @@ def put_section(section_id: int) -> Response:
     Returns:
         Response: Flask Response object
     """
-    data = request.get_json()
-    section = Section.query.filter_by(id=section_id).first()
-    if not section:
-        return jsonify({
-            "message": "Section not found",
-            "status": 404,
-        })
-    section.number = data["number"]
-    section.title = data["title"]
-    section.cards_made = data["cards_made"]
-    section.complete = data["complete"]
-    section.updated = datetime.now().strftime("%m/%d/%Y:%H:%M:%S")
-    db.session.commit()
-    return jsonify({
-        "message": "Section updated successfully",
-        "status": 200,
-    })
+    return jsonify(SectionService.update(section_id, request.get_json()))
+
+
+@api_bp.route("/section/<int:section_id>", methods=["PATCH"])
+def patch_section(section_id: int) -> Response:
+    """
+    Updates only the provided fields of a Section
+    in the database
+
+    Args:
+        int (section_id): id of section
+
+    Returns:
+        Response: Flask Response object
+    """
+    return jsonify(SectionService.patch(section_id, request.get_json()))
 
 
 @api_bp.route("/section/<int:section_id>", methods=["DELETE"])
@@ -351,14 +653,21 @@ def delete_section(section_id: int) -> Response:
     Returns:
         Response: Flask Response object
     """
-    deletions = Section.query.filter_by(id=section_id).delete()
-    if deletions > 0:
-        db.session.commit()
-        return jsonify({
-            "message": "Section deleted successfully",
-            "status": 200
-        })
-    return jsonify({
-        "message": "Section not found",
-        "status": 404,
-    })
+    return jsonify(SectionService.delete(section_id))
+
+
+# =============== Search Ops ===============
+
+@api_bp.route("/suggest")
+def suggest() -> Response:
+    """
+    Gets cert names, codes, and tags with a word starting
+    with the 'q' query parameter. The optional 'limit'
+    parameter sets the number of suggestions returned
+
+    Returns:
+        Response: Flask Response object
+    """
+    limit = request.args.get("limit", default=DEFAULT_SUGGESTIONS, type=int)
+    limit = max(1, min(limit, MAX_SUGGESTIONS))
+    return jsonify(suggest_index.suggest(request.args.get("q", ""), limit))
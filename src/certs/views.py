@@ -2,14 +2,13 @@
 Post app views module
 """
 
-import os
-
-import requests
-
 from flask import Blueprint, redirect, render_template, Response, request, url_for
 
 from src.content.forms import CertForm
 from src.models.cert import Cert
+from src.services.cert import CertService
+from src.services.planner import PlannerService
+from src.services.search import search_index
 
 cert_bp = Blueprint(
     "certs",
@@ -17,8 +16,6 @@ cert_bp = Blueprint(
     template_folder="templates"
 )
 
-API_URL = f"http://127.0.0.1:5000/api/v{os.environ["API_VERSION"]}"
-
 
 @cert_bp.route("/certs")
 def certs() -> Response:
@@ -30,9 +27,13 @@ def certs() -> Response:
         Response: app response object
     """
     form = CertForm()
-    response = requests.get(f"{API_URL}/cert", timeout=2)
-    data = response.json()
-    return render_template("certs.html", certs=data, form=form, title="CT: Certs")
+    data = CertService.get_all()
+    return render_template(
+        "certs.html",
+        certs=data,
+        plans=PlannerService.get_all(),
+        form=form,
+        title="CT: Certs")
 
 
 @cert_bp.route("/search", methods=["GET", "POST"])
@@ -48,14 +49,17 @@ def search() -> Response:
         if not params:
             message = "Please provide a term to search for"
             return render_template("search.html", message=message, title="CT: Search")
-        return redirect(url_for("certs.results", search=params), code=307)
+        mode = request.form.get("mode", "certs")
+        return redirect(url_for("certs.results", search=params, mode=mode), code=307)
     return render_template("search.html", title="CT: Search")
 
 
 @cert_bp.route("/results", methods=["GET", "POST"])
 def results() -> Response:
     """
-    Returns the results template
+    Returns the results template. Searches certs
+    unless the mode is 'all', which searches certs,
+    resources, and sections together
 
     Args:
         result (list): list of search results
@@ -65,6 +69,12 @@ def results() -> Response:
     form = CertForm()
     if request.method == "POST":
         query = request.args.get("search")
+        if request.args.get("mode") == "all":
+            return render_template(
+                "results.html",
+                query=query,
+                matches=search_index.search(query),
+                title="CT: Results")
         result = Cert.find(query)
         return render_template(
             "results.html",
@@ -0,0 +1,28 @@
+"""
+Module defining the app's Flask CLI commands
+"""
+
+import click
+
+from flask.cli import with_appcontext
+
+from src.services.dates import parse_date
+from src.services.snapshot import SnapshotService
+
+
+@click.command("snapshot")
+@click.option("--day", default=None, help="Day to record as yyyy-mm-dd, today by default")
+@with_appcontext
+def snapshot_command(day: str) -> None:
+    """
+    Records the daily progress snapshot of every cert. Run
+    once a day from a scheduler such as cron
+    """
+    try:
+        day = parse_date(day)
+    except ValueError as error:
+        raise click.BadParameter(str(error), param_hint="--day") from error
+    result = SnapshotService.take(day)
+    click.echo(result["message"])
+    if result["status"] != 200:
+        raise SystemExit(1)
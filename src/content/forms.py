@@ -3,7 +3,8 @@ Form module for new cert creation
 """
 
 from flask_wtf import FlaskForm
-from wtforms import BooleanField, RadioField, StringField, TextAreaField, validators
+from flask_wtf.file import FileField
+from wtforms import BooleanField, RadioField, SelectField, StringField, TextAreaField, validators
 
 
 class CertForm(FlaskForm):
@@ -49,6 +50,22 @@ class ResourceForm(FlaskForm):
     )
 
 
+class ResourceBulkForm(FlaskForm):
+    """
+    Defines a form for adding many resources to a cert
+    from a list of URLs or a bookmarks export
+    """
+    resource_type = SelectField("Resource type", choices=[
+        ("course", "Course"),
+        ("video", "Video"),
+        ("article", "Article"),
+        ("documentation", "Documentation")],
+        validators=[validators.DataRequired()],
+    )
+    urls = TextAreaField("URLs, one per line")
+    bookmarks = FileField("Bookmarks export")
+
+
 class SectionForm(FlaskForm):
     """
     Defines a form for adding a section to a course
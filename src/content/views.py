@@ -5,19 +5,31 @@ View module for new cert creation
 # pylint: disable=inconsistent-return-statements
 
 import json
-import os
 
-from urllib.error import HTTPError, URLError
-
-import opengraph_py3
-import requests
-
-from flask import Blueprint, flash, redirect, render_template, request, Response, url_for
+from flask import (
+    Blueprint,
+    current_app,
+    flash,
+    redirect,
+    render_template,
+    request, Response,
+    url_for
+)
 
-from src.content.forms import CertForm, ResourceForm, SectionForm, SectionImportForm
+from src.content.forms import (
+    CertForm,
+    ResourceBulkForm,
+    ResourceForm,
+    SectionForm,
+    SectionImportForm
+)
 from src.models.cert import Cert
 from src.models.resource import Resource
-from src.models.section import Section
+from src.services.cert import CertService
+from src.services.ingest import IngestService, parse_urls
+from src.services.resource import ResourceService
+from src.services.scraper import scrape_queue
+from src.services.section import SectionService
 
 
 content_bp = Blueprint(
@@ -26,14 +38,15 @@ content_bp = Blueprint(
     template_folder="templates"
 )
 
-API_URL = f"http://127.0.0.1:5000/api/v{os.environ["API_VERSION"]}"
-
-
 def handle_og_data(cert_id: int, url: str) -> Response:
     """
     Uses the Open Graph protocol to attempt to 
     populate the resource data fields in the 
-    ResourceForm
+    ResourceForm. Cached metadata is read by the cert page
+    from the URL straight away and a cached failure returns
+    no content. Otherwise the page is scraped by the
+    background workers and the cert page is given the job
+    token to fill the form from
 
     Args:
         cert_id (int): Cert object ID
@@ -43,30 +56,16 @@ def handle_og_data(cert_id: int, url: str) -> Response:
         Response: Flask Response object
     """
     try:
-        og_data = opengraph_py3.OpenGraph(url)
-        # just return if OG search is empty
-        og_list = list(og_data.items())
-        base_og_data = "scrape" in og_list[0] and "_url" in og_list[1]
-        if len(og_list) == 2 and base_og_data:
-            return Response(status=204)
-        # get OG data as dict to send back to template
-        og_dict = {}
-        for key, value in og_data.items():
-            og_dict[key] = value
-        return redirect(
-            url_for(
-                'data.cert_data',
-                cert_id=cert_id,
-                og_data=json.dumps([og_dict]),
-                has_og_data=True),
-            307
-        )
-    except HTTPError:
-        return Response(status=204)
+        # pylint: disable=protected-access
+        job = scrape_queue.lookup(current_app._get_current_object(), url)
     except ValueError:
         return Response(status=204)
-    except URLError:
+    # a recently failed lookup is not retried until it expires
+    if job["status"] == "failed":
         return Response(status=204)
+    if job["token"]:
+        return redirect(url_for('data.cert_data', cert_id=cert_id, og_job=job["token"]), 307)
+    return redirect(url_for('data.cert_data', cert_id=cert_id, og_url=url), 307)
 
 
 @content_bp.route("/create/cert", methods=["GET", "POST"])
@@ -89,13 +88,7 @@ def create_cert() -> Response:
                 failed=failed_constraint,
                 title="CT: Create"
             )
-        response = requests.post(
-            url=f"{API_URL}/cert",
-            data=json.dumps(form.data),
-            headers={"Content-Type": "application/json"},
-            timeout=2
-        )
-        data = response.json()
+        data = CertService.create(form.data)
         if data["status"] == 200:
             flash(f"{data["message"]}", "message")
         else:
@@ -117,13 +110,7 @@ def update_cert(cert_id: int) -> Response:
     """
     form = CertForm()
     if request.method == "POST" and form.validate_on_submit():
-        response = requests.put(
-            url=f"{API_URL}/cert/{cert_id}",
-            data=json.dumps(form.data),
-            headers={"Content-Type": "application/json"},
-            timeout=2
-        )
-        data = response.json()
+        data = CertService.update(cert_id, form.data)
         if data["status"] == 200:
             flash(f"{data["message"]}", "message")
         else:
@@ -145,19 +132,7 @@ def update_cert_exam_date() -> Response:
     if not exam_date:
         flash("Please provide a valid date", "error")
         return redirect(url_for('data.cert_data', cert_id=cert_id), 302)
-    # set new date
-    cert = requests.get(f"{API_URL}/cert/{cert_id}", timeout=2)
-    data = cert.json()
-    date_values = exam_date.split("-")
-    date_values.reverse()
-    data["exam_date"] = "/".join(date_values)
-    response = requests.put(
-        url=f"{API_URL}/cert/{cert_id}",
-        data=json.dumps(data),
-        headers={"Content-Type": "application/json"},
-        timeout=2
-    )
-    data = response.json()
+    data = CertService.patch(cert_id, {"exam_date": exam_date})
     if data["status"] == 200:
         flash(f"{data["message"]}", "message")
     else:
@@ -189,13 +164,7 @@ def create_resource() -> None:
             "complete": False,
             **form.data
         }
-        response = requests.post(
-            url=f"{API_URL}/resource",
-            data=json.dumps(cert_data),
-            headers={"Content-Type": "application/json"},
-            timeout=2
-        )
-        data = response.json()
+        data = ResourceService.create(cert_data)
         if data["status"] == 200:
             flash(f"{data["message"]}", "message")
         else:
@@ -204,6 +173,36 @@ def create_resource() -> None:
     return handle_og_data(cert_id, form.url.data)
 
 
+@content_bp.route("/create/resource/bulk", methods=["POST"])
+def create_resource_bulk() -> Response:
+    """
+    Creates resources on a Cert object from a list of
+    URLs and/or an uploaded bookmarks export
+
+    Returns:
+        Response: Flask Response object
+    """
+    form = ResourceBulkForm()
+    cert_id = request.form["cert_id"]
+    if not form.validate_on_submit():
+        flash("Please choose a resource type", "error")
+        return redirect(url_for('data.cert_data', cert_id=cert_id), 302)
+    links = parse_urls(form.urls.data)
+    if form.bookmarks.data:
+        links += parse_urls(form.bookmarks.data.read().decode("utf-8", errors="replace"))
+    # pylint: disable=protected-access
+    app = current_app._get_current_object()
+    data = IngestService.ingest(app, cert_id, form.resource_type.data, links)
+    if data["status"] != 200:
+        flash(f"{data["message"]}", "error")
+        return redirect(url_for('data.cert_data', cert_id=cert_id), 302)
+    flash(f"{data["message"]}", "message")
+    skipped = [f"{r["url"]} ({r["status"]})" for r in data["results"] if r["status"] != "created"]
+    if skipped:
+        flash(f"Not added: {", ".join(skipped)}", "error")
+    return redirect(url_for('data.cert_data', cert_id=cert_id), 302)
+
+
 @content_bp.route("/import/resource", methods=["POST"])
 def import_resource() -> Response:
     """
@@ -223,21 +222,14 @@ def import_resource() -> Response:
         if not resources:
             flash("No resources selected for import", "error")
             return redirect(url_for('data.cert_data', cert_id=cert_id), 302)
-        # get resources and create new entries with the new cert ID
-        for resource_id in resources:
-            response = requests.get(
-                f"{API_URL}/resource/{resource_id}",
-                timeout=2
-            )
-            data = response.json()
-            data["cert_id"] = cert_id
-            requests.post(
-                f"{API_URL}/resource",
-                data=json.dumps(data),
-                headers={"Content-Type": "application/json"},
-                timeout=2
-            )
-        flash("Resources imported successfully", "message")
+        # copy the resources onto the cert in one statement
+        data = ResourceService.import_resources(cert_id, resources)
+        if data["status"] != 200:
+            flash(f"{data["message"]}", "error")
+        elif data["skipped"]:
+            flash(f"{data["message"]}, {len(data["skipped"])} skipped as duplicates", "message")
+        else:
+            flash("Resources imported successfully", "message")
         return redirect(url_for('data.cert_data', cert_id=cert_id), 302)
 
 
@@ -253,27 +245,21 @@ def update_resource(resource_id: int) -> Response:
         Response: Flask Response object
     """
     form = ResourceForm()
-    # get the existing data to update - API requires all attributes present
-    response = requests.get(
-        f"{API_URL}/resource/{resource_id}",
-        timeout=2
-    )
-    db_data = response.json()
-    # merge the updated form data
-    db_data.update(form.data)
     if request.method == "POST" and form.validate_on_submit():
-        response = requests.put(
-            url=f"{API_URL}/resource/{resource_id}",
-            data=json.dumps(db_data),
-            headers={"Content-Type": "application/json"},
-            timeout=2
-        )
-        data = response.json()
-        if data["status"] == 200:
-            flash(f"{data["message"]}", "message")
-        else:
+        data = ResourceService.patch(resource_id, {
+            "resource_type": form.resource_type.data,
+            "url": form.url.data,
+            "title": form.title.data,
+            "image": form.image.data,
+            "description": form.description.data,
+            "site_logo": form.site_logo.data,
+            "site_name": form.site_name.data,
+        })
+        if data["status"] != 200:
             flash(f"{data["message"]}", "error")
-        return redirect(url_for("data.cert_data", cert_id=db_data["cert_id"]), 302)
+            return redirect(url_for("certs.certs"), 302)
+        flash(f"{data["message"]}", "message")
+        return redirect(url_for("data.cert_data", cert_id=data["data"]["cert_id"]), 302)
 
 
 @content_bp.route("/update/resource/complete", methods=["POST"])
@@ -290,18 +276,13 @@ def update_resource_complete() -> Response:
         flash("Only course type resources can be marked complete", "error")
         return redirect(url_for('data.cert_data', cert_id=cert_id), 302)
     resource_id = request.form["resource_id"]
-    response = requests.get(url=f"{API_URL}/resource/{resource_id}", timeout=2)
-    resource_data = response.json()
-    resource_data["complete"] = bool(request.form["complete"] == 'True')
-    response = requests.put(
-        url=f"{API_URL}/resource/{resource_id}",
-        data=json.dumps(resource_data),
-        headers={"Content-Type": "application/json"},
-        timeout=2,
-    )
-    data = response.json()
+    data = ResourceService.patch(resource_id, {
+        "complete": bool(request.form["complete"] == 'True')
+    })
     if data["status"] == 200:
         flash(f"{data["message"]}", "message")
+    elif data["status"] == 400:
+        flash(f"{data["message"]}", "error")
     else:
         flash("Failed to update cert", "error")
     return redirect(url_for('data.cert_data', cert_id=cert_id), 302)
@@ -332,21 +313,19 @@ def create_section() -> None:
                 if "number" not in section or "title" not in section:
                     flash("Incorrect section fields found", "error")
                     return redirect(url_for('data.cert_data', cert_id=cert_id), 302)
-            # if all tests pass create each section
-            for section in sections:
-                data = {
+            # if all tests pass create all sections in one transaction
+            data = SectionService.create_bulk([
+                {
                     "cert_id": cert_id,
                     "resource_id": request.form["resource_id"],
                     "number": section["number"],
                     "title": section["title"]
-                }
-                requests.post(
-                    url=f"{API_URL}/section",
-                    data=json.dumps(data),
-                    headers={"Content-Type": "application/json"},
-                    timeout=2
-                )
-            flash("JSON imported successfully", "message")
+                } for section in sections
+            ])
+            if data["status"] == 200:
+                flash("JSON imported successfully", "message")
+            else:
+                flash(f"{data["message"]}", "error")
             return redirect(url_for('data.cert_data', cert_id=cert_id), 302)
         except json.JSONDecodeError:
             flash("JSON improperly formatted", "error")
@@ -359,13 +338,7 @@ def create_section() -> None:
             "resource_id": request.form["resource_id"],
             **form.data
         }
-        response = requests.post(
-            url=f"{API_URL}/section",
-            data=json.dumps(resource_data),
-            headers={"Content-Type": "application/json"},
-            timeout=2
-        )
-        data = response.json()
+        data = SectionService.create(resource_data)
         if data["status"] == 200:
             flash(f"{data["message"]}", "message")
         else:
@@ -381,22 +354,19 @@ def update_section() -> Response:
     form = SectionForm()
     if request.method == "POST" and form.validate_on_submit():
         section_id = request.form["section-id"]
-        section = requests.get(f"{API_URL}/section/{section_id}", timeout=2)
-        section_data = section.json()
-        section_data["number"] = form.number.data
-        section_data["title"] = form.title.data
-        section_data["cards_made"] = form.cards_made.data
-        section_data["complete"] = form.complete.data
-        requests.put(
-            url=f"{API_URL}/section/{section_id}",
-            data=json.dumps(section_data),
-            headers={"Content-Type": "application/json"},
-            timeout=2
-        )
+        data = SectionService.patch(section_id, {
+            "number": form.number.data,
+            "title": form.title.data,
+            "cards_made": form.cards_made.data,
+            "complete": form.complete.data,
+        })
+        if data["status"] != 200:
+            flash(f"{data["message"]}", "error")
+            return redirect(url_for("certs.certs"), 302)
         updated = request.form.get("updated", None)
         if updated == "true":
             flash("Section updated successfully", "message")
-            return redirect(url_for("data.cert_data", cert_id=section_data["cert_id"]), 302)
+            return redirect(url_for("data.cert_data", cert_id=data["data"]["cert_id"]), 302)
         return Response(status=204)
 
 
@@ -415,11 +385,11 @@ def delete(resource_id: int) -> Response:
     if request.method == "POST":
         resource_type = request.form["type"]
         if resource_type == "cert":
-            response = Cert.delete(resource_id)
+            response = CertService.delete(resource_id)
         elif resource_type == "section":
-            response = Section.delete(resource_id)
+            response = SectionService.delete(resource_id)
         else:
-            response = Resource.delete(resource_id)
+            response = ResourceService.delete(resource_id)
         flash(
             f"{response["message"]}",
             "message" if response["status"] == 200 else "error"
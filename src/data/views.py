@@ -4,15 +4,16 @@ User created routes for new certs
 
 # pylint: disable=line-too-long
 
-import json
-import os
-
-import requests
-
 from flask import abort, Blueprint, render_template, Response, request
 
-from src.content.forms import ResourceForm, SectionForm, SectionImportForm
+from src.content.forms import ResourceBulkForm, ResourceForm, SectionForm, SectionImportForm
 from src.models.cert import Cert
+from src.services.cert import CertService
+from src.services.opengraph import OpenGraphService
+from src.services.resource import ResourceService
+from src.services.scraper import scrape_queue
+from src.services.section import SectionService
+from src.services.stats import StatsService
 
 data_bp = Blueprint(
     "data",
@@ -21,12 +22,10 @@ data_bp = Blueprint(
     url_prefix="/certs/data"
 )
 
-API_URL = f"http://127.0.0.1:5000/api/v{os.environ["API_VERSION"]}"
-
 
 def get_cert_resources(cert: Cert, resource_type: str) -> dict:
     """
-    Requests resources of type <resource_type> from the API
+    Gets resources of type <resource_type> for the given cert
 
     Args:
         cert (Cert): cert to fetch resources for
@@ -36,17 +35,13 @@ def get_cert_resources(cert: Cert, resource_type: str) -> dict:
         dict: JSON response
     """
     if resource_type == "section":
-        response = requests.get(f"{API_URL}/section", timeout=2)
-        return response.json()
-    response = requests.get(f"{API_URL}/resource", timeout=2)
-    data = response.json()
-    return [r for r in data if r["cert_id"] == cert["id"] and r["resource_type"] == resource_type]
+        return SectionService.get_all(cert_id=cert["id"])
+    return ResourceService.get_all(cert_id=cert["id"], resource_type=resource_type)
 
 
 def get_importable_resources(cert: Cert) -> list:
     """
-    Gets all resources from the API and returns those whose
-    which match the following criteria:
+    Gets the resources which match the following criteria:
 
     - do not have a matching cert ID to the cert passed in
     - do not exist on the cert already
@@ -59,73 +54,49 @@ def get_importable_resources(cert: Cert) -> list:
     Returns:
         list: list of available resources to import into a cert
     """
-    # get all resources
-    response = requests.get(f"{API_URL}/resource", timeout=2)
-    data = response.json()
-    # get this certs resources
-    cert_r = [r for r in data if r["cert_id"] == cert["id"]]
-    # exclude resources already on this cert
-    not_cert_r = [r for r in data if r["cert_id"] != cert["id"]]
-    # remove duplicates
-    r_dict = {}
-    for i, r in enumerate(not_cert_r):
-        if r["title"] not in r_dict:
-            r_dict[r["title"]] = i
-    # filtered list of unique resources
-    filtered = [not_cert_r[i] for i in r_dict.values()]
-    # return remaining resources
-    importable = []
-    for fr in filtered:
-        # check if resource is in cert_r
-        exists = False
-        for r in cert_r:
-            if fr["title"] == r["title"]:
-                exists = True
-                break
-        if not exists:
-            importable.append(fr)
-    return importable
-
-
-def fetch_cert(cert: Cert, tags: list, forms: tuple, og_data=None) -> str:
+    return ResourceService.get_importable(cert["id"])
+
+
+def fetch_cert(bundle: dict, forms: tuple, og_job=None, og_url=None) -> str:
     """
     Fetches the cert data and returns the template with
     the data fields updated
 
     Args:
-        cert (Cert): Cert object
-        tags (list): list of Cert tags
+        bundle (dict): Cert bundle from CertService.get_bundle
         forms (tuple): creation forms
-        og_data (None | dict): data pulled from opengraph
+        og_job (None | str): token of a queued Open Graph lookup
+        og_url (None | str): URL of a cached Open Graph lookup
 
     Returns:
         str: template string
     """
-    if og_data:
-        og_result = json.loads(og_data)
-        og_data_sent = True
-    else:
-        og_result = None
-        og_data_sent = None
-    courses = get_cert_resources(cert, "course")
-    sections = get_cert_resources(cert, "section")
-    videos = get_cert_resources(cert, "video")
-    articles = get_cert_resources(cert, "article")
-    documents = get_cert_resources(cert, "documentation")
+    job = (scrape_queue.status(og_job) if og_job else None) or {}
+    og_result = job.get("data")
+    if og_url and not og_job:
+        try:
+            # only reads the caches so a link cannot trigger a scrape
+            _, og_result = OpenGraphService.cached(og_url)
+        except ValueError:
+            og_result = None
+    cert = bundle["cert"]
+    resources = bundle["resources"]
     importable_resources = get_importable_resources(cert)
-    resource_form, section_form, section_import_form = forms
+    resource_form, section_form, section_import_form, resource_bulk_form = forms
     return render_template(
         template_name_or_list="cert_data.html",
         resource_form=resource_form,
+        resource_bulk_form=resource_bulk_form,
         section_form=section_form,
         section_import_form=section_import_form,
         cert=cert,
-        tags=tags,
-        course_data=courses,
-        section_data=sections,
-        video_data=videos,
-        article_data=articles,
-        document_data=documents,
+        cert_stats=StatsService.get(cert["id"]),
+        tags=cert["tags"],
+        course_data=resources["course"],
+        section_data=bundle["sections"],
+        video_data=resources["video"],
+        article_data=resources["article"],
+        document_data=resources["documentation"],
         resources={
             # courses are excluded as duplicating the section data is not beneficial
             "videos": [r for r in importable_resources if r["resource_type"] == "video"],
@@ -134,7 +105,8 @@ def fetch_cert(cert: Cert, tags: list, forms: tuple, og_data=None) -> str:
         },
         title=f"CT: {cert["name"]}",
         og_data=og_result,
-        has_og_data=og_data_sent,
+        # the page polls for lookups still being scraped
+        og_job=og_job if job.get("status") == "pending" else None,
     )
 
 
@@ -153,21 +125,13 @@ def cert_data(cert_id: int) -> Response:
     resource_form = ResourceForm()
     section_form = SectionForm()
     section_import_form = SectionImportForm()
-    cert = requests.get(f"{API_URL}/cert/{cert_id}", timeout=2)
-    data = cert.json()
-    if not data:
+    resource_bulk_form = ResourceBulkForm()
+    bundle = CertService.get_bundle(cert_id)
+    if not bundle:
         abort(404)
-    og_data = request.args.get("og_data", None)
-    cert_obj = Cert.query.filter_by(id=data["id"]).first()
-    if og_data:
-        return fetch_cert(
-            cert=data,
-            tags=cert_obj.tags,
-            forms=(resource_form, section_form, section_import_form),
-            og_data=og_data
-        )
     return fetch_cert(
-        cert=data,
-        tags=cert_obj.tags,
-        forms=(resource_form, section_form, section_import_form),
+        bundle=bundle,
+        forms=(resource_form, section_form, section_import_form, resource_bulk_form),
+        og_job=request.args.get("og_job", None),
+        og_url=request.args.get("og_url", None)
     )
@@ -2,6 +2,33 @@
 Module creating SQLAlchemy instance
 """
 
+import os
+
+from alembic import command
+from alembic.config import Config as AlembicConfig
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import inspect
 
 db = SQLAlchemy()
+
+ALEMBIC_INI = os.path.join(os.path.dirname(__file__), "alembic.ini")
+
+# revision matching the schema db.create_all built before migrations
+BASELINE_REVISION = "0001"
+
+
+def migrate() -> None:
+    """
+    Upgrades the app's database to the latest migration.
+    Databases created before migrations existed are first
+    stamped with the baseline revision so their tables are
+    evolved in place rather than recreated. Must be called
+    inside an app context
+    """
+    config = AlembicConfig(ALEMBIC_INI)
+    with db.engine.begin() as connection:
+        config.attributes["connection"] = connection
+        tables = inspect(connection).get_table_names()
+        if "certs" in tables and "alembic_version" not in tables:
+            command.stamp(config, BASELINE_REVISION)
+        command.upgrade(config, "head")
@@ -0,0 +1,29 @@
+"""
+Module defining the JSON provider used for API responses
+"""
+
+from datetime import date
+
+from flask.json.provider import DefaultJSONProvider
+
+
+class JSONProvider(DefaultJSONProvider):
+    """
+    JSON provider serializing dates and datetimes
+    in ISO 8601 format
+    """
+
+    @staticmethod
+    def default(o: object) -> object:
+        """
+        Converts objects the json module can't serialize
+
+        Args:
+            o (object): object to convert
+
+        Returns:
+            object: JSON serializable value
+        """
+        if isinstance(o, date):
+            return o.isoformat()
+        return DefaultJSONProvider.default(o)
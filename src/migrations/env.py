@@ -0,0 +1,71 @@
+"""
+Alembic environment for the cert_track database.
+
+Migrations run against the connection passed in by
+src.db.migrate when the app starts, or against the
+database at DATABASE_URL when run from the alembic CLI
+"""
+
+# pylint: disable=no-member
+
+import os
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine
+
+from src.db import db
+# pylint: disable=unused-import
+from src.models.cert import Cert  # noqa: F401
+from src.models.resource import Resource  # noqa: F401
+from src.models.og_cache import OpenGraphCache  # noqa: F401
+from src.models.og_job import OpenGraphJob  # noqa: F401
+from src.models.section import Section  # noqa: F401
+from src.models.snapshot import ProgressSnapshot  # noqa: F401
+from src.models.stats import ResourceStats  # noqa: F401
+from src.models.tag import Tag  # noqa: F401
+from src.models.version import TableVersion  # noqa: F401
+
+config = context.config
+target_metadata = db.metadata
+
+# database specific objects created by migrations but not mapped by models
+UNMAPPED = {"search_vector", "ix_certs_search_vector"}
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    """
+    Excludes unmapped database objects from autogenerate
+
+    Returns:
+        bool: True if the object should be compared
+    """
+    # pylint: disable=unused-argument
+    return not (reflected and compare_to is None and name in UNMAPPED)
+
+
+def run_migrations(connection) -> None:
+    """
+    Runs the migrations on the given connection
+
+    Args:
+        connection (Connection): database connection
+    """
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        render_as_batch=True
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if "connection" in config.attributes:
+    run_migrations(config.attributes["connection"])
+else:
+    if config.config_file_name is not None:
+        fileConfig(config.config_file_name)
+    engine = create_engine(os.environ["DATABASE_URL"])
+    with engine.connect() as cli_connection:
+        run_migrations(cli_connection)
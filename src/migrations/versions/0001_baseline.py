@@ -0,0 +1,78 @@
+"""Baseline schema created by db.create_all before migrations
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+
+# pylint: disable=invalid-name, missing-function-docstring, no-member
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "certs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("code", sa.String(length=255), nullable=False),
+        sa.Column("head_img", sa.String(length=255), nullable=False),
+        sa.Column("badge_img", sa.String(length=255), nullable=False),
+        sa.Column("exam_date", sa.String(length=64), nullable=True),
+        sa.Column("complete", sa.Boolean(), nullable=True),
+        sa.Column("tags", sa.Text(), nullable=True),
+        sa.Column("created", sa.String(length=64), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("code"),
+        sa.UniqueConstraint("name")
+    )
+    op.create_table(
+        "resources",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("cert_id", sa.Integer(), nullable=True),
+        sa.Column("resource_type", sa.String(length=64), nullable=False),
+        sa.Column("url", sa.Text(), nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("image", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("site_logo", sa.String(length=255), nullable=False),
+        sa.Column("site_name", sa.String(length=255), nullable=False),
+        sa.Column("has_og_data", sa.Boolean(), nullable=True),
+        sa.Column("complete", sa.Boolean(), nullable=True),
+        sa.Column("created", sa.String(length=64), nullable=True),
+        sa.Column("updated", sa.String(length=64), nullable=True),
+        sa.ForeignKeyConstraint(["cert_id"], ["certs.id"]),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_table(
+        "sections",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("cert_id", sa.Integer(), nullable=True),
+        sa.Column("resource_id", sa.Integer(), nullable=True),
+        sa.Column("number", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("cards_made", sa.Boolean(), nullable=True),
+        sa.Column("complete", sa.Boolean(), nullable=True),
+        sa.Column("created", sa.String(length=64), nullable=True),
+        sa.Column("updated", sa.String(length=64), nullable=True),
+        sa.ForeignKeyConstraint(["cert_id"], ["certs.id"]),
+        sa.ForeignKeyConstraint(["resource_id"], ["resources.id"]),
+        sa.PrimaryKeyConstraint("id")
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("sections")
+    op.drop_table("resources")
+    op.drop_table("certs")
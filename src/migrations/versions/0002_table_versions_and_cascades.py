@@ -0,0 +1,65 @@
+"""Add table_versions and ON DELETE CASCADE foreign keys
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 09:10:00.000000
+
+"""
+
+# pylint: disable=invalid-name, missing-function-docstring, no-member
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, referenced table) for each foreign key
+FOREIGN_KEYS = (
+    ("resources", "cert_id", "certs"),
+    ("sections", "cert_id", "certs"),
+    ("sections", "resource_id", "resources"),
+)
+
+
+def replace_foreign_keys(ondelete: Union[str, None]) -> None:
+    """
+    Recreates the foreign keys with the given ON DELETE
+    action. The naming convention names the unnamed keys
+    SQLite reflects when batch mode copies its tables,
+    matching the names PostgreSQL generated for them
+
+    Args:
+        ondelete (str): ON DELETE action or None
+    """
+    for table, column, referent in FOREIGN_KEYS:
+        name = f"{table}_{column}_fkey"
+        with op.batch_alter_table(
+            table,
+            naming_convention={"fk": "%(table_name)s_%(column_0_name)s_fkey"}
+        ) as batch_op:
+            batch_op.drop_constraint(name, type_="foreignkey")
+            batch_op.create_foreign_key(
+                name, referent, [column], ["id"], ondelete=ondelete
+            )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "table_versions",
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("name")
+    )
+    replace_foreign_keys("CASCADE")
+
+
+def downgrade() -> None:
+    replace_foreign_keys(None)
+    op.drop_table("table_versions")
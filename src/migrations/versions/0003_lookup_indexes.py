@@ -0,0 +1,47 @@
+"""Add composite indexes for the foreign key lookup paths
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 09:20:00.000000
+
+"""
+
+# pylint: disable=invalid-name, missing-function-docstring, no-member
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # resources of a cert, optionally of one type
+    op.create_index(
+        "ix_resources_cert_id_resource_type",
+        "resources",
+        ["cert_id", "resource_type"]
+    )
+    # sections of a cert grouped by course in order
+    op.create_index(
+        "ix_sections_cert_id_resource_id_number",
+        "sections",
+        ["cert_id", "resource_id", "number"]
+    )
+    # sections of a course in order
+    op.create_index(
+        "ix_sections_resource_id_number",
+        "sections",
+        ["resource_id", "number"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sections_resource_id_number", table_name="sections")
+    op.drop_index("ix_sections_cert_id_resource_id_number", table_name="sections")
+    op.drop_index("ix_resources_cert_id_resource_type", table_name="resources")
@@ -0,0 +1,42 @@
+"""Add indexes for the cert and resource existence checks
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+# pylint: disable=invalid-name, missing-function-docstring, no-member
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # case-insensitive cert name and code checks
+    op.create_index("ix_certs_lower_name", "certs", [sa.text("lower(name)")])
+    op.create_index("ix_certs_lower_code", "certs", [sa.text("lower(code)")])
+    # case-insensitive resource title check within a cert
+    op.create_index(
+        "ix_resources_cert_id_lower_title",
+        "resources",
+        ["cert_id", sa.text("lower(title)")]
+    )
+    # resource url check within a cert
+    op.create_index("ix_resources_cert_id_url", "resources", ["cert_id", "url"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resources_cert_id_url", table_name="resources")
+    op.drop_index("ix_resources_cert_id_lower_title", table_name="resources")
+    op.drop_index("ix_certs_lower_code", table_name="certs")
+    op.drop_index("ix_certs_lower_name", table_name="certs")
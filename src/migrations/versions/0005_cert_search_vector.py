@@ -0,0 +1,47 @@
+"""Add a full-text search vector over cert name, code and tags
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+# pylint: disable=invalid-name, missing-function-docstring, no-member
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # only PostgreSQL has tsvector, Cert.find falls back to LIKE elsewhere
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("""
+        ALTER TABLE certs ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(code, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(tags, '')), 'B')
+        ) STORED
+    """)
+    op.create_index(
+        "ix_certs_search_vector",
+        "certs",
+        ["search_vector"],
+        postgresql_using="gin"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("ix_certs_search_vector", table_name="certs")
+    op.drop_column("certs", "search_vector")
@@ -0,0 +1,71 @@
+"""Normalize cert tags into tags and tag_association tables
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+# pylint: disable=invalid-name, missing-function-docstring, no-member
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    tags = op.create_table(
+        "tags",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name")
+    )
+    associations = op.create_table(
+        "tag_association",
+        sa.Column("cert_id", sa.Integer(), nullable=False),
+        sa.Column("tag_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["cert_id"], ["certs.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["tag_id"], ["tags.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("cert_id", "tag_id")
+    )
+    op.create_index(
+        "ix_tag_association_tag_id_cert_id",
+        "tag_association",
+        ["tag_id", "cert_id"]
+    )
+    # split the existing comma separated tag strings
+    certs = sa.table("certs", sa.column("id"), sa.column("tags"))
+    cert_tags = {}
+    for cert_id, text in op.get_bind().execute(sa.select(certs.c.id, certs.c.tags)):
+        names = (tag.strip().lower() for tag in (text or "").split(","))
+        cert_tags[cert_id] = list(dict.fromkeys(name for name in names if name))
+    names = sorted({name for names in cert_tags.values() for name in names})
+    if not names:
+        return
+    op.bulk_insert(tags, [
+        {"id": i, "name": name} for i, name in enumerate(names, start=1)
+    ])
+    tag_ids = {name: i for i, name in enumerate(names, start=1)}
+    op.bulk_insert(associations, [
+        {"cert_id": cert_id, "tag_id": tag_ids[name]}
+        for cert_id, cert_names in cert_tags.items()
+        for name in cert_names
+    ])
+    if op.get_bind().dialect.name == "postgresql":
+        # move the id sequence past the explicitly inserted ids
+        op.execute("SELECT setval('tags_id_seq', (SELECT max(id) FROM tags))")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tag_association_tag_id_cert_id", table_name="tag_association")
+    op.drop_table("tag_association")
+    op.drop_table("tags")
@@ -0,0 +1,253 @@
+"""Convert created, updated and exam_date strings to date/time columns
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+# pylint: disable=invalid-name, missing-function-docstring, no-member
+
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMP = "%m/%d/%Y:%H:%M:%S"
+DATE = "%d/%m/%Y"
+
+# table -> column -> (new type, string format written before this revision)
+COLUMNS = {
+    "certs": {
+        "created": (sa.DateTime(timezone=True), DATE),
+        "exam_date": (sa.Date(), DATE),
+    },
+    "resources": {
+        "created": (sa.DateTime(timezone=True), TIMESTAMP),
+        "updated": (sa.DateTime(timezone=True), TIMESTAMP),
+    },
+    "sections": {
+        "created": (sa.DateTime(timezone=True), TIMESTAMP),
+        "updated": (sa.DateTime(timezone=True), TIMESTAMP),
+    },
+}
+
+# indexed columns, the rest are only converted
+INDEXES = {
+    "ix_certs_exam_date": ("certs", "exam_date"),
+    "ix_resources_updated": ("resources", "updated"),
+    "ix_sections_updated": ("sections", "updated"),
+}
+
+# expression indexes SQLite loses when batch mode copies a table
+EXPRESSION_INDEXES = {
+    "certs": (
+        "CREATE INDEX IF NOT EXISTS ix_certs_lower_name ON certs (lower(name))",
+        "CREATE INDEX IF NOT EXISTS ix_certs_lower_code ON certs (lower(code))",
+    ),
+    "resources": (
+        "CREATE INDEX IF NOT EXISTS ix_resources_cert_id_lower_title "
+        "ON resources (cert_id, lower(title))",
+    ),
+    "sections": (),
+}
+
+
+# PostgreSQL patterns and formats matching each string format
+PG_FORMATS = {
+    TIMESTAMP: (r"^\d{1,2}/\d{1,2}/\d{4}:\d{1,2}:\d{1,2}:\d{1,2}$", "MM/DD/YYYY:HH24:MI:SS"),
+    "%Y-%m-%d": (r"^\d{4}-\d{1,2}-\d{1,2}$", "YYYY-MM-DD"),
+    DATE: (r"^\d{1,2}/\d{1,2}/\d{4}$", "DD/MM/YYYY"),
+}
+
+
+def parse(value: str, new_type: sa.types.TypeEngine, string_format: str) -> object:
+    """
+    Parses a stored string, trying ISO format if the
+    original format does not match
+
+    Returns:
+        object: date, UTC datetime, or None if unparseable
+    """
+    if not value:
+        return None
+    parsed = None
+    for candidate in (string_format, "%Y-%m-%d", DATE):
+        try:
+            parsed = datetime.strptime(value.strip(), candidate)
+            break
+        except ValueError:
+            continue
+    if parsed is None:
+        return None
+    if isinstance(new_type, sa.Date):
+        return parsed.date()
+    return parsed.replace(tzinfo=timezone.utc)
+
+
+def format_value(value: object, string_format: str) -> str:
+    """
+    Formats a date or datetime back to its stored string
+
+    Returns:
+        str: formatted value or None
+    """
+    return value.strftime(string_format) if value else None
+
+
+def pg_parse(column: str, new_type: sa.types.TypeEngine, string_format: str) -> str:
+    """
+    Builds a PostgreSQL expression parsing a stored string
+    with the same formats tried by parse
+
+    Returns:
+        str: SQL expression, NULL if the string is unparseable
+    """
+    cases = []
+    for candidate in dict.fromkeys((string_format, "%Y-%m-%d", DATE)):
+        pattern, pg_string_format = PG_FORMATS[candidate]
+        if isinstance(new_type, sa.Date):
+            parsed = f"to_date(btrim({column}), '{pg_string_format}')"
+        else:
+            parsed = (
+                f"(to_timestamp(btrim({column}), '{pg_string_format}')::timestamp "
+                "AT TIME ZONE 'UTC')"
+            )
+        cases.append(f"WHEN btrim({column}) ~ '{pattern}' THEN {parsed}")
+    return f"CASE {' '.join(cases)} END"
+
+
+def pg_format(column: str, new_type: sa.types.TypeEngine, string_format: str) -> str:
+    """
+    Builds a PostgreSQL expression formatting a date or
+    datetime back to its stored string
+
+    Returns:
+        str: SQL expression
+    """
+    pg_string_format = PG_FORMATS[string_format][1]
+    if isinstance(new_type, sa.Date):
+        return f"to_char({column}, '{pg_string_format}')"
+    return f"to_char({column} AT TIME ZONE 'UTC', '{pg_string_format}')"
+
+
+def alter_in_place(table: str, columns: dict, to_type: bool) -> None:
+    """
+    Converts every column of a table with one set-based
+    ALTER TABLE ... TYPE ... USING statement on PostgreSQL
+
+    Args:
+        table (str): table name
+        columns (dict): column -> (new type, string format)
+        to_type (bool): True to convert strings to dates
+    """
+    dialect = op.get_bind().dialect
+    clauses = []
+    for column, (new_type, string_format) in columns.items():
+        if to_type:
+            target = new_type.compile(dialect=dialect)
+            using = pg_parse(column, new_type, string_format)
+            # created is required on certs
+            if table == "certs" and column == "created":
+                using = f"COALESCE({using}, now())"
+        else:
+            target = sa.String(length=64).compile(dialect=dialect)
+            using = pg_format(column, new_type, string_format)
+        clauses.append(f"ALTER COLUMN {column} TYPE {target} USING {using}")
+    if table == "certs":
+        clauses.append("ALTER COLUMN created SET NOT NULL")
+    op.execute(f"ALTER TABLE {table} {', '.join(clauses)}")
+
+
+def copy_values(table: str, columns: dict, to_type: bool) -> None:
+    """
+    Fills the added copy of each column from the original
+    with a single executemany UPDATE
+
+    Args:
+        table (str): table name
+        columns (dict): column -> (new type, string format)
+        to_type (bool): True to convert strings to dates
+    """
+    bind = op.get_bind()
+    string = sa.String(length=64)
+    old, new = [], []
+    for column, (new_type, _) in columns.items():
+        old.append(sa.column(column, string if to_type else new_type))
+        new.append(sa.column(f"{column}_new", new_type if to_type else string))
+    copy = sa.table(table, sa.column("id"), *old, *new)
+    now = datetime.now(timezone.utc)
+    values = []
+    for row in bind.execute(sa.select(copy.c.id, *old)).mappings():
+        converted = {"row_id": row["id"]}
+        for column, (new_type, string_format) in columns.items():
+            if not to_type:
+                converted[f"{column}_new"] = format_value(row[column], string_format)
+                continue
+            converted[f"{column}_new"] = parse(row[column], new_type, string_format)
+            # created is required on certs
+            if converted[f"{column}_new"] is None and table == "certs" and column == "created":
+                converted[f"{column}_new"] = now
+        values.append(converted)
+    if values:
+        bind.execute(
+            sa.update(copy)
+            .where(copy.c.id == sa.bindparam("row_id"))
+            .values({f"{column}_new": sa.bindparam(f"{column}_new") for column in columns}),
+            values
+        )
+
+
+def convert(table: str, columns: dict, to_type: bool) -> None:
+    """
+    Converts each column to the other type. PostgreSQL
+    alters the columns in place, while SQLite, which cannot
+    change a column type, adds a copy of each column, fills
+    it, and renames it over the original
+
+    Args:
+        table (str): table name
+        columns (dict): column -> (new type, string format)
+        to_type (bool): True to convert strings to dates
+    """
+    if op.get_bind().dialect.name == "postgresql":
+        alter_in_place(table, columns, to_type)
+        return
+    string = sa.String(length=64)
+    with op.batch_alter_table(table) as batch_op:
+        for column, (new_type, _) in columns.items():
+            batch_op.add_column(sa.Column(f"{column}_new", new_type if to_type else string))
+    copy_values(table, columns, to_type)
+    with op.batch_alter_table(table) as batch_op:
+        for column, (new_type, _) in columns.items():
+            batch_op.drop_column(column)
+            batch_op.alter_column(
+                f"{column}_new",
+                new_column_name=column,
+                existing_type=new_type if to_type else string,
+                nullable=not (table == "certs" and column == "created")
+            )
+    for statement in EXPRESSION_INDEXES[table]:
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    for table, columns in COLUMNS.items():
+        convert(table, columns, to_type=True)
+    for name, (table, column) in INDEXES.items():
+        op.create_index(name, table, [column])
+
+
+def downgrade() -> None:
+    for name, (table, _) in INDEXES.items():
+        op.drop_index(name, table_name=table)
+    for table, columns in COLUMNS.items():
+        convert(table, columns, to_type=False)
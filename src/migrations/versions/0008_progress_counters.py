@@ -0,0 +1,78 @@
+"""Add section and course progress counters to resources and certs
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+# pylint: disable=invalid-name, missing-function-docstring, no-member
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTERS = {
+    "resources": ("section_count", "sections_complete", "sections_cards_made"),
+    "certs": (
+        "section_count", "sections_complete", "sections_cards_made",
+        "course_count", "courses_complete",
+    ),
+}
+
+
+def upgrade() -> None:
+    for table, columns in COUNTERS.items():
+        for column in columns:
+            op.add_column(table, sa.Column(
+                column,
+                sa.Integer(),
+                nullable=False,
+                server_default="0"
+            ))
+    # count the existing rows and propagate complete flags upward
+    op.execute(
+        "UPDATE resources SET "
+        "section_count = (SELECT count(*) FROM sections "
+        "WHERE sections.resource_id = resources.id), "
+        "sections_complete = (SELECT count(*) FROM sections "
+        "WHERE sections.resource_id = resources.id AND sections.complete), "
+        "sections_cards_made = (SELECT count(*) FROM sections "
+        "WHERE sections.resource_id = resources.id AND sections.cards_made)"
+    )
+    op.execute(
+        "UPDATE resources SET complete = (sections_complete = section_count) "
+        "WHERE section_count > 0"
+    )
+    op.execute(
+        "UPDATE certs SET "
+        "section_count = (SELECT count(*) FROM sections "
+        "WHERE sections.cert_id = certs.id), "
+        "sections_complete = (SELECT count(*) FROM sections "
+        "WHERE sections.cert_id = certs.id AND sections.complete), "
+        "sections_cards_made = (SELECT count(*) FROM sections "
+        "WHERE sections.cert_id = certs.id AND sections.cards_made), "
+        "course_count = (SELECT count(*) FROM resources "
+        "WHERE resources.cert_id = certs.id AND resources.resource_type = 'course'), "
+        "courses_complete = (SELECT count(*) FROM resources "
+        "WHERE resources.cert_id = certs.id AND resources.resource_type = 'course' "
+        "AND resources.complete)"
+    )
+    op.execute(
+        "UPDATE certs SET complete = (courses_complete = course_count) "
+        "WHERE course_count > 0"
+    )
+
+
+def downgrade() -> None:
+    for table, columns in COUNTERS.items():
+        for column in reversed(columns):
+            op.drop_column(table, column)
@@ -0,0 +1,65 @@
+"""Add resource_stats and weekly_resource_stats rollup tables
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+# pylint: disable=invalid-name, missing-function-docstring, no-member
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "resource_stats",
+        sa.Column("cert_id", sa.Integer(), nullable=False),
+        sa.Column("resource_type", sa.String(length=64), nullable=False),
+        sa.Column("total", sa.Integer(), nullable=False),
+        sa.Column("complete", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["cert_id"], ["certs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("cert_id", "resource_type")
+    )
+    op.create_table(
+        "weekly_resource_stats",
+        sa.Column("cert_id", sa.Integer(), nullable=False),
+        sa.Column("week", sa.Date(), nullable=False),
+        sa.Column("added", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["cert_id"], ["certs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("cert_id", "week")
+    )
+    # roll up the existing resources
+    op.execute(
+        "INSERT INTO resource_stats (cert_id, resource_type, total, complete) "
+        "SELECT cert_id, resource_type, count(*), "
+        "sum(CASE WHEN complete THEN 1 ELSE 0 END) "
+        "FROM resources WHERE cert_id IS NOT NULL "
+        "GROUP BY cert_id, resource_type"
+    )
+    if op.get_bind().dialect.name == "postgresql":
+        week = "CAST(date_trunc('week', timezone('UTC', created)) AS DATE)"
+    else:
+        # step back to the Tuesday before and forward to the next Monday
+        week = "date(created, '-6 days', 'weekday 1')"
+    op.execute(
+        "INSERT INTO weekly_resource_stats (cert_id, week, added) "
+        f"SELECT cert_id, {week}, count(*) "
+        "FROM resources WHERE cert_id IS NOT NULL AND created IS NOT NULL "
+        f"GROUP BY cert_id, {week}"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("weekly_resource_stats")
+    op.drop_table("resource_stats")
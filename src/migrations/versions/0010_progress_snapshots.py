@@ -0,0 +1,40 @@
+"""Add progress_snapshots table
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+# pylint: disable=invalid-name, missing-function-docstring, no-member
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "progress_snapshots",
+        sa.Column("cert_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("section_count", sa.Integer(), nullable=False),
+        sa.Column("sections_complete", sa.Integer(), nullable=False),
+        sa.Column("sections_cards_made", sa.Integer(), nullable=False),
+        sa.Column("course_count", sa.Integer(), nullable=False),
+        sa.Column("courses_complete", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["cert_id"], ["certs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("cert_id", "day")
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("progress_snapshots")
@@ -0,0 +1,35 @@
+"""Add og_cache table
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+
+# pylint: disable=invalid-name, missing-function-docstring, no-member
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "og_cache",
+        sa.Column("url", sa.String(length=2048), nullable=False),
+        sa.Column("data", sa.Text(), nullable=True),
+        sa.Column("expires", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("url")
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("og_cache")
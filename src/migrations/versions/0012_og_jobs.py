@@ -0,0 +1,41 @@
+"""Add og_jobs table
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+# pylint: disable=invalid-name, missing-function-docstring, no-member
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "og_jobs",
+        sa.Column("token", sa.String(length=32), nullable=False),
+        sa.Column("url", sa.String(length=2048), nullable=False),
+        sa.Column("key", sa.String(length=2048), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("expires", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("token")
+    )
+    op.create_index("ix_og_jobs_key", "og_jobs", ["key"])
+    op.create_index("ix_og_jobs_expires", "og_jobs", ["expires"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_og_jobs_expires", table_name="og_jobs")
+    op.drop_index("ix_og_jobs_key", table_name="og_jobs")
+    op.drop_table("og_jobs")
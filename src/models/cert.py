@@ -4,16 +4,17 @@ Module creating the Cert model
 
 # pylint: disable=too-many-instance-attributes
 
+import re
+
 from dataclasses import dataclass
-import os
+from datetime import date, datetime
 
-import requests
+from sqlalchemy import and_, case, exists, func, literal_column, or_, select
 
 from src.db import db
-from src.models.resource import Resource
-from src.models.section import Section
 
-API_URL = f"http://127.0.0.1:5000/api/v{os.environ["API_VERSION"]}"
+# text search configuration used to build certs.search_vector
+SEARCH_CONFIG = "simple"
 
 
 @dataclass
@@ -30,17 +31,25 @@ class Cert(db.Model):
     code: str = db.Column(db.String(255), nullable=False, unique=True)
     head_img: str = db.Column(db.String(255), nullable=False)
     badge_img: str = db.Column(db.String(255), nullable=False)
-    exam_date: str = db.Column(db.String(64))
+    exam_date: date = db.Column(db.Date, index=True)
     complete: bool = db.Column(db.Boolean)
     tags: str = db.Column(db.Text())
-    created: str = db.Column(db.String(64), nullable=False)
+    created: datetime = db.Column(db.DateTime(timezone=True), nullable=False)
+
+    # progress counters maintained by ProgressService
+    section_count: int = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    sections_complete: int = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    sections_cards_made: int = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    course_count: int = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    courses_complete: int = db.Column(db.Integer, nullable=False, default=0, server_default="0")
 
     @classmethod
     def exists(cls, name: str, code: str) -> str:
         """
         Checks to see if a Cert exists in the database
         that would cause this creation to raise an 
-        integrity violation
+        integrity violation. Names and codes are compared
+        case-insensitively using the lower() indexes
 
         Args:
             name (str): form name value
@@ -49,22 +58,30 @@ class Cert(db.Model):
         Returns:
             str: first value causing an integrity violation
         """
-        certs = Cert.query.all()
-        for cert in certs:
-            if cert.name == name:
-                return "Name"
-            if cert.code == code:
-                return "Code"
+        row = db.session.execute(select(
+            exists().where(func.lower(cls.name) == name.lower()),
+            exists().where(func.lower(cls.code) == code.lower())
+        )).one()
+        if row[0]:
+            return "Name"
+        if row[1]:
+            return "Code"
         return None
 
     @classmethod
     def find(cls, query: str) -> list:
         """
         Runs a query against this model to find
-        all entries that match the query string.
+        all entries that match every word in the
+        query string, best matches first.
+
+        On PostgreSQL words are matched as prefixes
+        against the GIN indexed search_vector column
+        and ranked with ts_rank. Other databases fall
+        back to case-insensitive substring matching
+        ranked by the number of matching fields.
 
         Searched fields are:
-        - path
         - name
         - code
         - tags
@@ -75,36 +92,31 @@ class Cert(db.Model):
         Returns:
             list: matching entries
         """
-        certs = Cert.query.all()
-        results = []
-        for cert in certs:
-            if query in cert.name:
-                results.append(cert)
-                continue
-            if query in cert.code:
-                results.append(cert)
-                continue
-            if query in cert.tags:
-                results.append(cert)
-                break
-        return results
-
-    @classmethod
-    def delete(cls, cert_id: int) -> str:
-        """
-        Deletes the Cert with the given ID
-
-        Args:
-            cert_id (int): Cert ID
-        """
-        # delete sections
-        sections = Section.query.filter_by(cert_id=cert_id).all()
-        for section in sections:
-            requests.delete(f"{API_URL}/section/{section.id}", timeout=2)
-        # delete resources
-        resources = Resource.query.filter_by(cert_id=cert_id).all()
-        for resource in resources:
-            requests.delete(f"{API_URL}/resource/{resource.id}", timeout=2)
-        # delete the cert
-        response = requests.delete(f"{API_URL}/cert/{cert_id}", timeout=2)
-        return response.json()
+        terms = re.findall(r"[^\W_]+", query or "")
+        if not terms:
+            return []
+        if db.session.get_bind().dialect.name == "postgresql":
+            vector = literal_column("certs.search_vector")
+            tsquery = func.to_tsquery(
+                SEARCH_CONFIG,
+                " & ".join(f"{term}:*" for term in terms)
+            )
+            matches = vector.op("@@")(tsquery)
+            rank = func.ts_rank(vector, tsquery)
+        else:
+            fields = (cls.name, cls.code, cls.tags)
+            matches = and_(*[
+                or_(*[field.icontains(term, autoescape=True) for field in fields])
+                for term in terms
+            ])
+            rank = sum(
+                case((field.icontains(term, autoescape=True), 1), else_=0)
+                for field in fields
+                for term in terms
+            )
+        return db.session.scalars(
+            select(cls).where(matches).order_by(rank.desc(), cls.name)
+        ).all()
+
+db.Index("ix_certs_lower_name", func.lower(Cert.name))
+db.Index("ix_certs_lower_code", func.lower(Cert.code))
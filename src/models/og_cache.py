@@ -0,0 +1,23 @@
+"""
+Module creating the OpenGraphCache model
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.db import db
+
+
+@dataclass
+class OpenGraphCache(db.Model):
+    """
+    Model defining the Open Graph metadata scraped from a
+    canonical URL. Failed lookups are stored without data
+    so they are not retried until they expire
+    """
+
+    __tablename__ = "og_cache"
+
+    url: str = db.Column(db.String(2048), primary_key=True)
+    data: str = db.Column(db.Text())  # JSON object, None if the lookup failed
+    expires: datetime = db.Column(db.DateTime(timezone=True), nullable=False)
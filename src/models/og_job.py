@@ -0,0 +1,26 @@
+"""
+Module creating the OpenGraphJob model
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.db import db
+
+
+@dataclass
+class OpenGraphJob(db.Model):
+    """
+    Model defining a queued Open Graph lookup polled by
+    its token. Jobs are kept in the database so any worker
+    process can answer a poll, and the scraped properties
+    are read from the og_cache row of the URL
+    """
+
+    __tablename__ = "og_jobs"
+
+    token: str = db.Column(db.String(32), primary_key=True)
+    url: str = db.Column(db.String(2048), nullable=False)
+    key: str = db.Column(db.String(2048), nullable=False, index=True)  # canonical URL
+    status: str = db.Column(db.String(16), nullable=False)  # pending, done, or failed
+    expires: datetime = db.Column(db.DateTime(timezone=True), nullable=False, index=True)
@@ -4,16 +4,12 @@ Module creating the Resource model
 
 # pylint: disable=too-many-instance-attributes
 
-import os
-
 from dataclasses import dataclass
+from datetime import datetime
 
-import requests
+from sqlalchemy import exists, func, select
 
 from src.db import db
-from src.models.section import Section
-
-API_URL = f"http://127.0.0.1:5000/api/v{os.environ["API_VERSION"]}"
 
 
 @dataclass
@@ -23,9 +19,16 @@ class Resource(db.Model):
     """
 
     __tablename__ = "resources"
+    __table_args__ = (
+        db.Index("ix_resources_cert_id_resource_type", "cert_id", "resource_type"),
+        db.Index("ix_resources_cert_id_url", "cert_id", "url"),
+    )
 
     id: int = db.Column(db.Integer, primary_key=True)
-    cert_id: int = db.Column('cert_id', db.ForeignKey('certs.id'))
+    cert_id: int = db.Column(
+        'cert_id',
+        db.ForeignKey('certs.id', ondelete="CASCADE")
+    )
     resource_type: str = db.Column(db.String(64), nullable=False)
     url: str = db.Column(db.Text(), nullable=False)
     title: str = db.Column(db.String(255), nullable=False)
@@ -35,50 +38,46 @@ class Resource(db.Model):
     site_name: str = db.Column(db.String(255), nullable=False)
     has_og_data: bool = db.Column(db.Boolean)
     complete: bool = db.Column(db.Boolean)  # applies to course type resources
-    created: str = db.Column(db.String(64))
-    updated: str = db.Column(db.String(64))
+    created: datetime = db.Column(db.DateTime(timezone=True))
+    updated: datetime = db.Column(db.DateTime(timezone=True), index=True)
+
+    # progress counters maintained by ProgressService, applies to course type resources
+    section_count: int = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    sections_complete: int = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    sections_cards_made: int = db.Column(db.Integer, nullable=False, default=0, server_default="0")
 
     @classmethod
     def exists(cls, cert_id: int, title: str, url: str) -> str:
         """
         Checks to see if a Resource exists in the database
         that would cause this creation to raise an 
-        integrity violation
+        integrity violation. Titles are compared
+        case-insensitively using the lower() index
 
         Args:
             cert_id (int): Cert object ID
-            name (str): form name value
-            code (str): form code value
+            title (str): form title value
+            url (str): form url value
 
         Returns:
             str: first value causing an integrity violation
         """
-        resources = Resource.query.filter_by(cert_id=cert_id).all()
-        for resource in resources:
-            if resource.title == title:
-                return "Title"
-            if resource.url == url:
-                return "URL"
+        row = db.session.execute(select(
+            exists().where(
+                cls.cert_id == cert_id,
+                func.lower(cls.title) == title.lower()
+            ),
+            exists().where(cls.cert_id == cert_id, cls.url == url)
+        )).one()
+        if row[0]:
+            return "Title"
+        if row[1]:
+            return "URL"
         return None
 
-    @classmethod
-    def delete(cls, resource_id: int) -> None:
-        """
-        Deletes the Resource with the given ID
 
-        Args:
-            resource_id (int): Resource ID
-        """
-        # check if resource is a course
-        resource = Resource.query.filter_by(id=resource_id).first()
-        if resource.resource_type == "course":
-            # delete associated sections
-            sections = Section.query.filter_by(resource_id=resource_id).all()
-            for section in sections:
-                requests.delete(f"{API_URL}/section/{section.id}", timeout=2)
-        # delete Resource object
-        response = requests.delete(
-            f"{API_URL}/resource/{resource.id}",
-            timeout=2
-        )
-        return response.json()
+db.Index(
+    "ix_resources_cert_id_lower_title",
+    Resource.cert_id,
+    func.lower(Resource.title)
+)
@@ -5,14 +5,10 @@ Module creating the Section model
 # pylint: disable=too-many-instance-attributes
 
 from dataclasses import dataclass
-import os
-
-import requests
+from datetime import datetime
 
 from src.db import db
 
-API_URL = f"http://127.0.0.1:5000/api/v{os.environ["API_VERSION"]}"
-
 
 @dataclass
 class Section(db.Model):
@@ -21,27 +17,23 @@ class Section(db.Model):
     """
 
     __tablename__ = "sections"
+    __table_args__ = (
+        db.Index("ix_sections_cert_id_resource_id_number", "cert_id", "resource_id", "number"),
+        db.Index("ix_sections_resource_id_number", "resource_id", "number"),
+    )
 
     id: int = db.Column(db.Integer, primary_key=True)
-    cert_id: int = db.Column('cert_id', db.ForeignKey('certs.id'))
-    resource_id: int = db.Column('resource_id', db.ForeignKey('resources.id'))
+    cert_id: int = db.Column(
+        'cert_id',
+        db.ForeignKey('certs.id', ondelete="CASCADE")
+    )
+    resource_id: int = db.Column(
+        'resource_id',
+        db.ForeignKey('resources.id', ondelete="CASCADE")
+    )
     number: int = db.Column(db.Integer, nullable=False)
     title: str = db.Column(db.String(255), nullable=False)
     cards_made: bool = db.Column(db.Boolean)
     complete: bool = db.Column(db.Boolean)
-    created: str = db.Column(db.String(64))
-    updated: str = db.Column(db.String(64))
-
-    @classmethod
-    def delete(cls, section_id: int) -> None:
-        """
-        Deletes the given section
-
-        Args:
-            section_id (int): Section ID
-        """
-        response = requests.delete(
-            f"{API_URL}/section/{section_id}",
-            timeout=2
-        )
-        return response.json()
+    created: datetime = db.Column(db.DateTime(timezone=True))
+    updated: datetime = db.Column(db.DateTime(timezone=True), index=True)
@@ -0,0 +1,32 @@
+"""
+Module creating the ProgressSnapshot model
+"""
+
+from dataclasses import dataclass
+from datetime import date
+
+from src.db import db
+
+
+@dataclass
+class ProgressSnapshot(db.Model):
+    """
+    Model defining the progress counters of a cert at the
+    end of a day. Rows are only ever appended and a day is
+    only written when the counters changed since the cert's
+    previous snapshot
+    """
+
+    __tablename__ = "progress_snapshots"
+
+    cert_id: int = db.Column(
+        "cert_id",
+        db.ForeignKey("certs.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    day: date = db.Column(db.Date, primary_key=True)
+    section_count: int = db.Column(db.Integer, nullable=False)
+    sections_complete: int = db.Column(db.Integer, nullable=False)
+    sections_cards_made: int = db.Column(db.Integer, nullable=False)
+    course_count: int = db.Column(db.Integer, nullable=False)
+    courses_complete: int = db.Column(db.Integer, nullable=False)
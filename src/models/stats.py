@@ -0,0 +1,44 @@
+"""
+Module creating the statistics rollup models
+"""
+
+from dataclasses import dataclass
+from datetime import date
+
+from src.db import db
+
+
+@dataclass
+class ResourceStats(db.Model):
+    """
+    Model defining the Resource totals of a cert by type
+    """
+
+    __tablename__ = "resource_stats"
+
+    cert_id: int = db.Column(
+        "cert_id",
+        db.ForeignKey("certs.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    resource_type: str = db.Column(db.String(64), primary_key=True)
+    total: int = db.Column(db.Integer, nullable=False)
+    complete: int = db.Column(db.Integer, nullable=False)
+
+
+@dataclass
+class WeeklyResourceStats(db.Model):
+    """
+    Model defining the number of Resources added to a cert
+    in the week starting on a Monday
+    """
+
+    __tablename__ = "weekly_resource_stats"
+
+    cert_id: int = db.Column(
+        "cert_id",
+        db.ForeignKey("certs.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    week: date = db.Column(db.Date, primary_key=True)
+    added: int = db.Column(db.Integer, nullable=False)
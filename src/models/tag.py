@@ -0,0 +1,51 @@
+"""
+Module creating the Tag model
+"""
+
+from dataclasses import dataclass
+
+from src.db import db
+
+# associative table for many-to-many cert/tag relationships
+tag_association = db.Table(
+    "tag_association",
+    db.Column(
+        "cert_id",
+        db.ForeignKey("certs.id", ondelete="CASCADE"),
+        primary_key=True
+    ),
+    db.Column(
+        "tag_id",
+        db.ForeignKey("tags.id", ondelete="CASCADE"),
+        primary_key=True
+    ),
+    # certs with a tag, the primary key covers tags of a cert
+    db.Index("ix_tag_association_tag_id_cert_id", "tag_id", "cert_id"),
+)
+
+
+@dataclass
+class Tag(db.Model):
+    """
+    Model defining a tag shared by certs
+    """
+
+    __tablename__ = "tags"
+
+    id: int = db.Column(db.Integer, primary_key=True)
+    name: str = db.Column(db.String(255), nullable=False, unique=True)
+
+    @classmethod
+    def parse(cls, tags: str) -> list:
+        """
+        Splits a comma separated tag string into unique
+        lowercase tag names, keeping their order
+
+        Args:
+            tags (str): comma separated tags
+
+        Returns:
+            list: tag names
+        """
+        names = (tag.strip().lower() for tag in (tags or "").split(","))
+        return list(dict.fromkeys(name for name in names if name))
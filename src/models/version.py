@@ -0,0 +1,148 @@
+"""
+Module creating the TableVersion model
+"""
+
+from dataclasses import dataclass
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from src.db import db
+
+
+@dataclass
+class TableVersion(db.Model):
+    """
+    Model defining a version counter for a table that
+    is incremented when every transaction writing to
+    that table commits
+    """
+
+    __tablename__ = "table_versions"
+
+    name: str = db.Column(db.String(64), primary_key=True)
+    version: int = db.Column(db.Integer, nullable=False, default=0)
+
+    @classmethod
+    def get(cls, names: tuple) -> dict:
+        """
+        Gets the current versions of the given tables
+        with a single query
+
+        Args:
+            names (tuple): table names
+
+        Returns:
+            dict: table name to version, 0 if never written
+        """
+        rows = db.session.execute(
+            select(cls.name, cls.version).where(cls.name.in_(names))
+        ).all()
+        versions = {name: 0 for name in names}
+        versions.update({row.name: row.version for row in rows})
+        return versions
+
+    @classmethod
+    def bump(cls, session: Session, names: set) -> None:
+        """
+        Increments the versions of the given tables on the
+        session's current connection. Rows are updated one at
+        a time in name order so concurrent transactions lock
+        them in the same order
+
+        Args:
+            session (Session): session performing the write
+            names (set): names of the tables written to
+        """
+        connection = session.connection()
+        table = cls.__table__
+        for name in sorted(names - {cls.__tablename__}):
+            result = connection.execute(
+                update(table)
+                .where(table.c.name == name)
+                .values(version=table.c.version + 1)
+            )
+            if not result.rowcount:
+                connection.execute(insert(table).values(name=name, version=1))
+
+
+def written_tables(session: Session) -> set:
+    """
+    Gets the names of the tables written to in the
+    session's current transaction
+
+    Args:
+        session (Session): session performing the writes
+
+    Returns:
+        set: table names, bumped when the transaction commits
+    """
+    return session.info.setdefault("written_tables", set())
+
+
+def committed_tables(session: Session) -> set:
+    """
+    Gets and forgets the names of the tables whose versions
+    the session's last commit bumped
+
+    Args:
+        session (Session): session that committed
+
+    Returns:
+        set: table names, empty if already read
+    """
+    return session.info.pop("committed_tables", set())
+
+
+@event.listens_for(Session, "after_flush")
+def record_flushed_tables(session: Session, _) -> None:
+    """
+    Records the tables changed by an ORM flush
+
+    Args:
+        session (Session): session being flushed
+    """
+    changed = session.new | session.dirty | session.deleted
+    written_tables(session).update(obj.__table__.name for obj in changed)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def record_executed_table(state: ORMExecuteState) -> None:
+    """
+    Records the table changed by an INSERT, UPDATE, or
+    DELETE statement run through the session
+
+    Args:
+        state (ORMExecuteState): statement execution state
+    """
+    if state.is_insert or state.is_update or state.is_delete:
+        written_tables(state.session).add(state.statement.table.name)
+
+
+@event.listens_for(Session, "before_commit")
+def bump_written_tables(session: Session) -> None:
+    """
+    Bumps the versions of every table written to just
+    before the transaction commits, so the version rows
+    are only locked for the end of the transaction
+
+    Args:
+        session (Session): session being committed
+    """
+    # flush first so tables changed by pending objects are included
+    session.flush()
+    names = session.info.pop("written_tables", set()) - {TableVersion.__tablename__}
+    session.info["committed_tables"] = names
+    if names:
+        TableVersion.bump(session, names)
+
+
+@event.listens_for(Session, "after_rollback")
+def forget_written_tables(session: Session) -> None:
+    """
+    Forgets the tables written to by a rolled back transaction
+
+    Args:
+        session (Session): session being rolled back
+    """
+    session.info.pop("written_tables", None)
@@ -0,0 +1,299 @@
+"""
+Module defining in-process Cert operations shared
+by the API and the HTML views
+"""
+
+# pylint: disable=duplicate-code
+
+from dataclasses import asdict
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.db import db
+from src.models.cert import Cert
+from src.models.resource import Resource
+from src.models.section import Section
+from src.models.snapshot import ProgressSnapshot
+from src.models.stats import ResourceStats, WeeklyResourceStats
+from src.models.tag import Tag, tag_association
+from src.services.dates import parse_date, utcnow
+from src.services.patch import invalid_fields, patch_row
+from src.services.resource import RESOURCE_TYPES
+from src.services.search import search_index
+from src.services.tag import TagService
+
+# complete is derived from the courses by ProgressService
+PATCH_FIELDS = ("name", "code", "head_img", "badge_img", "exam_date", "tags")
+
+
+class CertService:
+    """
+    Cert CRUD operations returning plain data
+    """
+
+    @classmethod
+    def get_all(cls, after: int = None, limit: int = None, **filters) -> list:
+        """
+        Gets all Certs from the database matching the given
+        filters ordered by ID. Filters set to None are ignored
+
+        Args:
+            after (int): only return Certs with an ID greater than this
+            limit (int): maximum number of Certs to return
+            **filters: any of tags (list), only return Certs with
+                all of these tags, exam_from (date), only return
+                Certs with an exam on or after this, or exam_to
+                (date), only return Certs with an exam on or
+                before this
+
+        Returns:
+            list: list of Cert dicts
+        """
+        tags = filters.get("tags")
+        exam_from = filters.get("exam_from")
+        exam_to = filters.get("exam_to")
+        query = Cert.query
+        names = Tag.parse(",".join(tags or []))
+        if names:
+            query = query.filter(Cert.id.in_(TagService.cert_ids(names)))
+        if exam_from is not None:
+            query = query.filter(Cert.exam_date >= exam_from)
+        if exam_to is not None:
+            query = query.filter(Cert.exam_date <= exam_to)
+        if after is not None:
+            query = query.filter(Cert.id > after)
+        certs = query.order_by(Cert.id).limit(limit).all()
+        return [asdict(cert) for cert in certs]
+
+    @classmethod
+    def get(cls, cert_id: int) -> dict:
+        """
+        Gets a Cert from the database by ID
+
+        Args:
+            cert_id (int): Cert ID
+
+        Returns:
+            dict: Cert data or None if not found
+        """
+        cert = Cert.query.filter_by(id=cert_id).first()
+        return asdict(cert) if cert else None
+
+    @classmethod
+    def get_bundle(cls, cert_id: int) -> dict:
+        """
+        Gets a Cert along with all of its Resources grouped
+        by type and all of its Sections grouped by Resource
+        ID and ordered by number. Uses one query per table
+
+        Args:
+            cert_id (int): Cert ID
+
+        Returns:
+            dict: bundle data or None if the Cert is not found
+        """
+        cert = Cert.query.filter_by(id=cert_id).first()
+        if not cert:
+            return None
+        resources = {resource_type: [] for resource_type in RESOURCE_TYPES}
+        for resource in Resource.query.filter_by(cert_id=cert_id).order_by(Resource.id):
+            resources.setdefault(resource.resource_type, []).append(asdict(resource))
+        sections = {}
+        query = Section.query \
+            .filter_by(cert_id=cert_id) \
+            .order_by(Section.resource_id, Section.number)
+        for section in query:
+            sections.setdefault(section.resource_id, []).append(asdict(section))
+        return {
+            "cert": asdict(cert),
+            "resources": resources,
+            "sections": sections,
+        }
+
+    @classmethod
+    def create(cls, data: dict) -> dict:
+        """
+        Creates a Cert using the provided data
+
+        Args:
+            data (dict): Cert attribute values
+
+        Returns:
+            dict: result message and status
+        """
+        try:
+            exam_date = parse_date(data["exam_date"])
+        except ValueError:
+            return {
+                "message": "Invalid exam date",
+                "status": 400,
+            }
+        cert = Cert(
+            name=data["name"],
+            code=data["code"],
+            head_img=data["head_img"],
+            badge_img=data["badge_img"],
+            exam_date=exam_date,
+            tags=data["tags"],
+            created=utcnow(),
+        )
+        db.session.add(cert)
+        db.session.flush()
+        TagService.set_cert_tags(cert.id, cert.tags)
+        db.session.commit()
+        search_index.sync({("cert", cert.id)})
+        return {
+            "message": "Cert created successfully",
+            "status": 200,
+        }
+
+    @classmethod
+    def update(cls, cert_id: int, data: dict) -> dict:
+        """
+        Updates a Cert in the database using the
+        provided cert ID
+
+        Args:
+            cert_id (int): Cert ID
+            data (dict): Cert attribute values
+
+        Returns:
+            dict: result message and status
+        """
+        try:
+            exam_date = parse_date(data["exam_date"])
+        except ValueError:
+            return {
+                "message": "Invalid exam date",
+                "status": 400,
+            }
+        cert = Cert.query.filter_by(id=cert_id).first()
+        if not cert:
+            return {
+                "message": "Cert not found",
+                "status": 404,
+            }
+        cert.name = data["name"]
+        cert.code = data["code"]
+        cert.head_img = data["head_img"]
+        cert.badge_img = data["badge_img"]
+        cert.exam_date = exam_date
+        cert.tags = data["tags"]
+        db.session.add(cert)
+        TagService.set_cert_tags(cert_id, cert.tags)
+        db.session.commit()
+        search_index.sync({("cert", cert_id)})
+        return {
+            "message": "Cert updated successfully",
+            "status": 200,
+        }
+
+    @classmethod
+    def patch(cls, cert_id: int, data: dict) -> dict:
+        """
+        Updates only the provided fields of a Cert with
+        a single UPDATE statement
+
+        Args:
+            cert_id (int): Cert ID
+            data (dict): Cert attribute values to change
+
+        Returns:
+            dict: result message, status, and updated Cert data
+        """
+        if not isinstance(data, dict) or not data:
+            return {
+                "message": "No fields to update",
+                "status": 400,
+            }
+        invalid = invalid_fields(data, PATCH_FIELDS)
+        if invalid:
+            return {
+                "message": f"Invalid fields: {", ".join(invalid)}",
+                "status": 400,
+            }
+        values = dict(data)
+        if "exam_date" in values:
+            try:
+                values["exam_date"] = parse_date(values["exam_date"])
+            except ValueError:
+                return {
+                    "message": "Invalid exam date",
+                    "status": 400,
+                }
+        on_update = TagService.set_row_tags if "tags" in data else None
+        try:
+            cert = patch_row(Cert, cert_id, values, on_update)
+        except SQLAlchemyError:
+            return {
+                "message": "Cert update failed",
+                "status": 500,
+            }
+        if not cert:
+            return {
+                "message": "Cert not found",
+                "status": 404,
+            }
+        search_index.sync({("cert", cert_id)})
+        return {
+            "message": "Cert updated successfully",
+            "status": 200,
+            "data": cert,
+        }
+
+    @classmethod
+    def delete(cls, cert_id: int) -> dict:
+        """
+        Deletes the Cert with the given ID along with
+        all of its Resources, Sections, tags, statistics, and snapshots in a
+        single transaction. The child rows are deleted with one
+        statement per table so the delete does not rely
+        on the database enforcing ON DELETE CASCADE
+
+        Args:
+            cert_id (int): Cert ID
+
+        Returns:
+            dict: result message and status
+        """
+        resource_ids = select(Resource.id).where(Resource.cert_id == cert_id)
+        try:
+            db.session.execute(
+                delete(tag_association).where(tag_association.c.cert_id == cert_id)
+            )
+            for model in (ResourceStats, WeeklyResourceStats, ProgressSnapshot):
+                db.session.execute(delete(model).where(model.cert_id == cert_id))
+            section_ids = db.session.scalars(
+                delete(Section)
+                .where(or_(
+                    Section.cert_id == cert_id,
+                    Section.resource_id.in_(resource_ids)
+                ))
+                .returning(Section.id)
+            ).all()
+            Resource.query \
+                .filter_by(cert_id=cert_id) \
+                .delete(synchronize_session=False)
+            deletions = Cert.query.filter_by(id=cert_id).delete()
+            if deletions == 0:
+                db.session.rollback()
+                return {
+                    "message": "Cert not found",
+                    "status": 404,
+                }
+            db.session.commit()
+        except SQLAlchemyError:
+            db.session.rollback()
+            return {
+                "message": "Cert delete failed",
+                "status": 500,
+            }
+        search_index.sync({
+            ("cert", cert_id),
+            *(("section", section_id) for section_id in section_ids),
+        })
+        return {
+            "message": "Cert deleted successfully",
+            "status": 200
+        }
@@ -0,0 +1,65 @@
+"""
+Module defining the date and time helpers shared
+by the services
+"""
+
+from datetime import date, datetime, timezone
+
+# formats accepted for dates, the first is the ISO format used in responses
+DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y")
+
+
+def utcnow() -> datetime:
+    """
+    Gets the current time in UTC
+
+    Returns:
+        datetime: timezone aware current time
+    """
+    return datetime.now(timezone.utc)
+
+
+def parse_date(value: str) -> date:
+    """
+    Converts an ISO 'yyyy-mm-dd' or 'dd/mm/yyyy' string
+    to a date. Empty values are treated as no date
+
+    Args:
+        value (str): date string, date, or None
+
+    Raises:
+        ValueError: if the value is not a valid date
+
+    Returns:
+        date: parsed date or None
+    """
+    if not value:
+        return None
+    if isinstance(value, date):
+        return value
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).date()
+        except (TypeError, ValueError):
+            continue
+    raise ValueError(f"Invalid date '{value}'")
+
+
+def parse_datetime(value: str) -> datetime:
+    """
+    Converts an ISO 8601 string to a UTC datetime. Times
+    without a timezone are taken to be in UTC
+
+    Args:
+        value (str): ISO 8601 date or datetime string
+
+    Raises:
+        ValueError: if the value is not a valid datetime
+
+    Returns:
+        datetime: timezone aware datetime in UTC
+    """
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
@@ -0,0 +1,455 @@
+"""
+Module defining bulk Resource ingestion from a list of
+URLs or a browser bookmarks export, with the metadata of
+every page fetched concurrently
+"""
+
+import threading
+import time
+import weakref
+
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from html.parser import HTMLParser
+from typing import Callable
+from urllib.parse import urlsplit
+
+from flask import Flask
+from sqlalchemy import func, select
+
+from src.db import db
+from src.models.cert import Cert
+from src.models.resource import Resource
+from src.services.opengraph import OpenGraphService, canonical_url
+from src.services.resource import RESOURCE_TYPES, ResourceService
+
+# most URLs accepted in one request
+MAX_URLS = 200
+# pages fetched at the same time by the process, and from one host
+WORKERS = 8
+PER_HOST = 2
+# seconds every lookup of one request must finish within
+DEADLINE = 20
+# length of the Resource string columns
+MAX_LENGTH = 255
+# result of each URL, in the order they are counted
+STATUSES = ("created", "duplicate", "invalid", "failed")
+
+
+class BookmarkParser(HTMLParser):
+    """
+    Collects the links and their titles from a Netscape
+    bookmark file, the format every browser exports
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.links = []
+        self.link = None
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        """
+        Starts a link at each <a> tag with an href
+
+        Args:
+            tag (str): lowercase tag name
+            attrs (list): attribute name and value pairs
+        """
+        href = dict(attrs).get("href")
+        if tag == "a" and href:
+            self.link = {"url": href.strip(), "title": ""}
+            self.links.append(self.link)
+
+    def handle_endtag(self, tag: str) -> None:
+        """
+        Ends the current link
+
+        Args:
+            tag (str): lowercase tag name
+        """
+        if tag == "a":
+            self.link = None
+
+    def handle_data(self, data: str) -> None:
+        """
+        Collects the text of the current link
+
+        Args:
+            data (str): text between tags
+        """
+        if self.link is not None:
+            self.link["title"] += data
+
+
+def parse_urls(text: str) -> list:
+    """
+    Gets the links from pasted text, which is either a
+    bookmarks export or URLs separated by whitespace
+
+    Args:
+        text (str): URLs or bookmark file HTML
+
+    Returns:
+        list: dicts of each URL and its bookmark title, which
+            is None for plain URLs
+    """
+    text = text or ""
+    if "<a" in text.lower():
+        parser = BookmarkParser()
+        parser.feed(text)
+        parser.close()
+        return [
+            {"url": link["url"], "title": link["title"].strip() or None}
+            for link in parser.links
+        ]
+    return [{"url": url, "title": None} for url in text.split()]
+
+
+def normalize_links(links: list) -> list:
+    """
+    Checks a list of links, turning URL strings into the
+    dicts returned by parse_urls
+
+    Args:
+        links (list): URL strings, or dicts with a url and a
+            title, which may be None
+
+    Raises:
+        ValueError: if links is not a list or a link is neither
+            a URL string nor a dict with a url and a title
+
+    Returns:
+        list: dicts of each URL and its title
+    """
+    if not isinstance(links, list):
+        raise ValueError("Links must be a list")
+    normalized = []
+    for link in links:
+        if isinstance(link, str):
+            link = {"url": link, "title": None}
+        if not isinstance(link, dict) or \
+                not isinstance(link.get("url"), str) or \
+                "title" not in link or \
+                not isinstance(link["title"], (str, type(None))):
+            raise ValueError(f"Invalid link {link!r}")
+        normalized.append({"url": link["url"], "title": link["title"]})
+    return normalized
+
+
+class FetchPool:
+    """
+    Thread pool shared by every ingestion request in the
+    process, so concurrent requests never run more than
+    WORKERS lookups between them. The semaphore of each
+    host is shared too, so no host gets more than PER_HOST
+    requests at once however many requests include it
+    """
+
+    def __init__(self, workers: int = WORKERS) -> None:
+        self.workers = workers
+        self.lock = threading.Lock()
+        self.executor = None
+        # a semaphore is dropped once no lookup holds it
+        self.hosts = weakref.WeakValueDictionary()
+
+    def host(self, host: str) -> threading.BoundedSemaphore:
+        """
+        Gets the semaphore limiting the lookups of a host
+
+        Args:
+            host (str): URL host and port
+
+        Returns:
+            threading.BoundedSemaphore: semaphore of the host
+        """
+        with self.lock:
+            semaphore = self.hosts.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(PER_HOST)
+                self.hosts[host] = semaphore
+            return semaphore
+
+    def submit(self, function: Callable, *args) -> Future:
+        """
+        Queues a call on the shared thread pool, starting
+        the pool on first use
+
+        Args:
+            function (Callable): function to call
+            *args: arguments of the call
+
+        Returns:
+            Future: future of the call
+        """
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(self.workers, "og-ingest")
+            return self.executor.submit(function, *args)
+
+
+fetch_pool = FetchPool()
+
+
+def fetch_all(app: Flask, urls: list) -> dict:
+    """
+    Looks up the metadata of every URL on the shared fetch
+    pool. The URLs of each host are split into at most
+    PER_HOST chains fetched one after another, so a request
+    never leaves workers waiting on one of its own hosts,
+    and every lookup holds the semaphore of its host. A
+    lookup that raises only fails its own URL. Chains still
+    queued at DEADLINE are cancelled, and lookups still
+    running are left to finish in the background, only
+    filling the cache
+
+    Args:
+        app (Flask): app whose context the lookups run in
+        urls (list): canonical URLs
+
+    Returns:
+        dict: URL to Open Graph properties, None if the page
+            has no metadata. URLs whose lookup raised or did not
+            finish in time are left out
+    """
+    chains = {}
+    for url in urls:
+        host = urlsplit(url).netloc
+        chains.setdefault(host, [[] for _ in range(PER_HOST)])
+        host_chains = chains[host]
+        min(host_chains, key=len).append(url)
+    results = {}
+    lock = threading.Lock()
+    end = time.monotonic() + DEADLINE
+
+    def run(host: str, chain: list) -> None:
+        semaphore = fetch_pool.host(host)
+        with app.app_context():
+            for url in chain:
+                remaining = end - time.monotonic()
+                if remaining <= 0 or not semaphore.acquire(timeout=remaining):
+                    return
+                try:
+                    data = OpenGraphService.lookup(url)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    # any error from one page must not fail the others
+                    db.session.rollback()
+                    continue
+                finally:
+                    semaphore.release()
+                with lock:
+                    results[url] = data
+
+    futures = [
+        fetch_pool.submit(run, host, chain)
+        for host, host_chains in chains.items()
+        for chain in host_chains
+        if chain
+    ]
+    if futures:
+        wait(futures, timeout=DEADLINE)
+    for future in futures:
+        future.cancel()
+    with lock:
+        return dict(results)
+
+
+class IngestService:
+    """
+    Bulk Resource creation returning plain data
+    """
+
+    @classmethod
+    def check(cls, resource_type: str, links: list) -> dict:
+        """
+        Checks the resource type and number of links of a
+        request
+
+        Args:
+            resource_type (str): type of every Resource
+            links (list): dicts from normalize_links
+
+        Returns:
+            dict: error message and status, None if valid
+        """
+        if resource_type not in RESOURCE_TYPES:
+            return {
+                "message": f"Resource type must be one of {", ".join(RESOURCE_TYPES)}",
+                "status": 400,
+            }
+        if not links:
+            return {
+                "message": "No URLs found",
+                "status": 400,
+            }
+        if len(links) > MAX_URLS:
+            return {
+                "message": f"At most {MAX_URLS} URLs can be added at once",
+                "status": 400,
+            }
+        return None
+
+    @classmethod
+    def existing(cls, cert_id: int) -> tuple:
+        """
+        Gets the URLs and titles of the Resources on a Cert
+
+        Args:
+            cert_id (int): Cert ID
+
+        Returns:
+            tuple: set of canonical URLs and set of lowercase titles
+        """
+        rows = db.session.execute(
+            select(Resource.url, func.lower(Resource.title))
+            .where(Resource.cert_id == cert_id)
+        ).all()
+        urls = set()
+        for row in rows:
+            try:
+                urls.add(canonical_url(row[0]))
+            except ValueError:
+                urls.add(row[0])
+        return urls, {row[1] for row in rows}
+
+    @classmethod
+    def select_new(cls, links: list, urls: set) -> list:
+        """
+        Picks the links to fetch, skipping invalid URLs and
+        URLs already on the Cert or earlier in the list
+
+        Args:
+            links (list): dicts from normalize_links
+            urls (set): canonical URLs already on the Cert
+
+        Returns:
+            list: result dict of each link, with the canonical URL
+                and bookmark title of those to fetch
+        """
+        seen = set(urls)
+        results = []
+        for link in links:
+            result = {"url": link["url"], "status": "invalid", "title": None}
+            results.append(result)
+            try:
+                result["key"] = canonical_url(link["url"])
+            except ValueError:
+                continue
+            if result["key"] in seen:
+                result["status"] = "duplicate"
+                continue
+            seen.add(result["key"])
+            result["status"] = "created"
+            result["bookmark_title"] = link["title"]
+        return results
+
+    @classmethod
+    def build_rows(cls, cert_id: int, resource_type: str, results: list, og_data: dict) -> list:
+        """
+        Builds the Resource rows of the fetched links. Links
+        whose lookup failed are marked failed, and links whose
+        URL or title is on the Cert, which is read again as
+        other requests may have added to it during the fetch,
+        are marked duplicate. Links without metadata use their
+        bookmark title or URL
+
+        Args:
+            cert_id (int): Cert ID
+            resource_type (str): type of every Resource
+            results (list): result dicts from select_new
+            og_data (dict): URL to Open Graph properties from fetch_all
+
+        Returns:
+            list: Resource attribute dicts
+        """
+        urls, titles = cls.existing(cert_id)
+        rows = []
+        for result in results:
+            if result["status"] != "created":
+                continue
+            if result["key"] not in og_data:
+                result["status"] = "failed"
+                continue
+            data = og_data[result["key"]] or {}
+            title = (data.get("title") or result["bookmark_title"] or result["url"])[:MAX_LENGTH]
+            if result["key"] in urls or title.lower() in titles:
+                result["status"] = "duplicate"
+                continue
+            titles.add(title.lower())
+            image = data.get("image")
+            site_name = data.get("site_name") or urlsplit(result["key"]).hostname
+            result["title"] = title
+            rows.append({
+                "cert_id": cert_id,
+                "resource_type": resource_type,
+                "url": result["url"],
+                "title": title,
+                # links longer than the column fall back to the default
+                "image": image if image and len(image) <= MAX_LENGTH else "",
+                "description": data.get("description") or "",
+                "site_logo": "",
+                "site_name": site_name[:MAX_LENGTH],
+                "has_og_data": bool(data),
+            })
+        return rows
+
+    @classmethod
+    def ingest(cls, app: Flask, cert_id: int, resource_type: str, links: list) -> dict:
+        """
+        Creates a Resource for every new link on a Cert in
+        one transaction. Invalid URLs, and URLs or titles
+        already on the Cert or earlier in the list, are
+        skipped. Pages are fetched for metadata with no
+        transaction open, and links whose lookup failed or
+        ran past the deadline are reported as failed
+
+        Args:
+            app (Flask): app whose context the lookups run in
+            cert_id (int): ID of the Cert to add to
+            resource_type (str): type of every Resource
+            links (list): URL strings, or dicts from parse_urls
+
+        Returns:
+            dict: result message, status, counts, and the result
+                of each URL, which is created, duplicate, invalid,
+                or failed
+        """
+        try:
+            cert_id = int(cert_id)
+            links = normalize_links(links)
+        except (TypeError, ValueError):
+            return {
+                "message": "Invalid cert ID or URL list",
+                "status": 400,
+            }
+        error = cls.check(resource_type, links)
+        if error:
+            return error
+        if not db.session.get(Cert, cert_id):
+            return {
+                "message": "Cert not found",
+                "status": 404,
+            }
+        results = cls.select_new(links, cls.existing(cert_id)[0])
+        # release the connection so no transaction is held open while pages are fetched
+        db.session.close()
+        og_data = fetch_all(app, [r["key"] for r in results if r["status"] == "created"])
+        rows = cls.build_rows(cert_id, resource_type, results, og_data)
+        if rows:
+            data = ResourceService.create_bulk(rows)
+            if data["status"] != 200:
+                return data
+        for result in results:
+            result.pop("key", None)
+            result.pop("bookmark_title", None)
+        counts = {
+            status: sum(1 for r in results if r["status"] == status)
+            for status in STATUSES
+        }
+        return {
+            "message": f"{counts["created"]} resources created, "
+                       f"{counts["duplicate"]} skipped as duplicates, "
+                       f"{counts["invalid"]} invalid, "
+                       f"{counts["failed"]} failed",
+            "status": 200,
+            **counts,
+            "results": results,
+        }
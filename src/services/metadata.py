@@ -0,0 +1,177 @@
+"""
+Module defining the streaming extractor that reads the
+Open Graph, Twitter card, and standard metadata from the
+<head> of a page without downloading the rest of it
+"""
+
+import codecs
+
+from html.parser import HTMLParser
+from http.client import HTTPException, HTTPResponse
+from urllib.error import URLError
+from urllib.parse import urljoin
+from urllib.request import Request, urlopen
+
+# bytes read per chunk and the most read before giving up on </head>
+CHUNK_SIZE = 8192
+MAX_BYTES = 256 * 1024
+TIMEOUT = 5
+USER_AGENT = "Mozilla/5.0 (compatible; CertTracker/1.0)"
+# properties returned, filled from Twitter and standard tags if missing
+PROPERTIES = ("title", "type", "url", "image", "description", "site_name")
+# properties holding links resolved against the page URL
+LINKS = ("url", "image")
+
+
+class HeadParser(HTMLParser):
+    """
+    Incremental tokenizer collecting <meta> tags and the
+    <title> of a page. Stops collecting at </head> or the
+    first <body> tag
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.og = {}
+        self.twitter = {}
+        self.meta = {}
+        self.title = None
+        self.in_title = False
+        self.done = False
+        self.bytes_read = 0
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        """
+        Records meta tags and notes the start of the title
+        or body
+
+        Args:
+            tag (str): lowercase tag name
+            attrs (list): attribute name and value pairs
+        """
+        if self.done:
+            return
+        if tag == "body":
+            self.done = True
+        elif tag == "title" and self.title is None:
+            self.in_title = True
+            self.title = ""
+        elif tag == "meta":
+            attrs = {name: value for name, value in attrs if value is not None}
+            content = attrs.get("content", "").strip()
+            key = (attrs.get("property") or attrs.get("name") or "").strip().lower()
+            if not content or not key:
+                return
+            # the first tag wins as pages repeat og:image for alternatives
+            if key.startswith("og:"):
+                self.og.setdefault(key[3:], content)
+            elif key.startswith("twitter:"):
+                self.twitter.setdefault(key[8:], content)
+            else:
+                self.meta.setdefault(key, content)
+
+    def handle_endtag(self, tag: str) -> None:
+        """
+        Notes the end of the title or head
+
+        Args:
+            tag (str): lowercase tag name
+        """
+        if tag == "title":
+            self.in_title = False
+        elif tag == "head":
+            self.done = True
+
+    def handle_data(self, data: str) -> None:
+        """
+        Collects the text of the title
+
+        Args:
+            data (str): text between tags
+        """
+        if self.in_title and not self.done:
+            self.title += data
+
+    def metadata(self, base_url: str) -> dict:
+        """
+        Gets the Open Graph properties of the page, filling
+        missing ones from the Twitter card, standard meta tags,
+        and title, with links made absolute
+
+        Args:
+            base_url (str): URL the page was fetched from
+
+        Returns:
+            dict: Open Graph properties, None if there are none
+        """
+        fallbacks = {
+            "title": self.twitter.get("title") or (self.title or "").strip(),
+            "description": self.twitter.get("description") or self.meta.get("description"),
+            "image": self.twitter.get("image") or self.twitter.get("image:src"),
+            "site_name": self.meta.get("application-name"),
+        }
+        data = {}
+        for name in PROPERTIES:
+            value = self.og.get(name) or fallbacks.get(name)
+            if value:
+                data[name] = urljoin(base_url, value) if name in LINKS else value
+        return data or None
+
+
+def read_head(response: HTTPResponse, max_bytes: int = MAX_BYTES) -> HeadParser:
+    """
+    Feeds a response to a HeadParser a chunk at a time until
+    the head has ended, the body is exhausted, or max_bytes
+    have been read
+
+    Args:
+        response (HTTPResponse): open response
+        max_bytes (int): most bytes to read
+
+    Returns:
+        HeadParser: parser holding the collected tags
+    """
+    charset = response.headers.get_content_charset() or "utf-8"
+    try:
+        decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    parser = HeadParser()
+    while not parser.done and parser.bytes_read < max_bytes:
+        chunk = response.read(min(CHUNK_SIZE, max_bytes - parser.bytes_read))
+        if not chunk:
+            break
+        parser.bytes_read += len(chunk)
+        parser.feed(decoder.decode(chunk))
+    return parser
+
+
+def fetch_metadata(url: str, max_bytes: int = MAX_BYTES, timeout: float = TIMEOUT) -> dict:
+    """
+    Streams the head of a page and extracts its metadata.
+    The connection is closed as soon as the head has been
+    read so the body of the page is never downloaded
+
+    Args:
+        url (str): page URL
+        max_bytes (int): most bytes to read
+        timeout (float): seconds to wait for the server
+
+    Returns:
+        dict: Open Graph properties, None if the page could not
+            be fetched, is not HTML, or has no metadata
+    """
+    request = Request(url, headers={
+        "User-Agent": USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml",
+    })
+    try:
+        with urlopen(request, timeout=timeout) as response:
+            if response.headers.get_content_type() not in ("text/html", "application/xhtml+xml"):
+                return None
+            parser = read_head(response, max_bytes)
+            return parser.metadata(response.geturl())
+    except (URLError, OSError, ValueError, HTTPException):
+        # HTTPException covers malformed responses such as a bad
+        # status line or an overlong header
+        return None
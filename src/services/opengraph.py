@@ -0,0 +1,223 @@
+"""
+Module defining the cached Open Graph lookups used to
+fill in the resource form from a URL
+"""
+
+import json
+import threading
+
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.db import db
+from src.models.og_cache import OpenGraphCache
+from src.services.dates import utcnow
+from src.services.metadata import fetch_metadata
+
+# how long scraped metadata and failed lookups are kept
+TTL = timedelta(days=7)
+FAILURE_TTL = timedelta(hours=1)
+# number of lookups held in memory by each process
+LRU_SIZE = 256
+# query parameters that only track where a link was shared
+TRACKING_PARAMS = ("utm_", "fbclid", "gclid")
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonical_url(url: str) -> str:
+    """
+    Normalises a URL so links to the same page share a
+    cache entry. The scheme and host are lowercased, default
+    ports, fragments, and tracking parameters are removed, the
+    remaining query parameters are sorted, and an empty path
+    becomes '/'
+
+    Args:
+        url (str): URL entered by the user
+
+    Raises:
+        ValueError: if the URL is not an absolute http(s) URL
+
+    Returns:
+        str: canonical URL
+    """
+    parts = urlsplit((url or "").strip())
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        raise ValueError(f"Invalid URL '{url}'")
+    host = parts.hostname
+    if parts.port and parts.port != DEFAULT_PORTS[scheme]:
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAMS)
+    )
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+
+def fetch(url: str) -> dict:
+    """
+    Scrapes the Open Graph metadata of a page, reading only
+    its <head>
+
+    Args:
+        url (str): page URL
+
+    Returns:
+        dict: Open Graph properties, None if the page could not
+            be fetched or has no metadata
+    """
+    return fetch_metadata(url)
+
+
+class LRUCache:
+    """
+    Thread safe least recently used cache of lookups and
+    the time they expire
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+
+    def get(self, key: str) -> tuple:
+        """
+        Gets a live entry and marks it as recently used
+
+        Args:
+            key (str): cache key
+
+        Returns:
+            tuple: True and the cached value if found, otherwise
+                False and None
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return False, None
+            value, expires = entry
+            if expires <= utcnow():
+                del self.entries[key]
+                return False, None
+            self.entries.move_to_end(key)
+            return True, value
+
+    def put(self, key: str, value: dict, expires: datetime) -> None:
+        """
+        Adds an entry, evicting the least recently used one
+        if the cache is full
+
+        Args:
+            key (str): cache key
+            value (dict): value to cache, may be None
+            expires (datetime): time the entry expires
+        """
+        with self.lock:
+            self.entries[key] = (value, expires)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes every entry
+        """
+        with self.lock:
+            self.entries.clear()
+
+
+class OpenGraphService:
+    """
+    Open Graph lookups cached in memory and in the
+    database. Each canonical URL is scraped at most once
+    per TTL, and failures are cached for a shorter time
+    """
+
+    lru = LRUCache(LRU_SIZE)
+
+    @classmethod
+    def cached(cls, url: str) -> tuple:
+        """
+        Gets the Open Graph metadata of a URL from the
+        in-process cache, then the database, without scraping
+        the page. Must be called inside an app context
+
+        Args:
+            url (str): page URL
+
+        Raises:
+            ValueError: if the URL is not an absolute http(s) URL
+
+        Returns:
+            tuple: True and the cached properties, which are None
+                for a cached failure, or False and None if neither
+                cache has a live entry
+        """
+        key = canonical_url(url)
+        found, data = cls.lru.get(key)
+        if found:
+            return True, data
+        row = OpenGraphCache.query \
+            .filter(OpenGraphCache.url == key, OpenGraphCache.expires > utcnow()) \
+            .first()
+        if not row:
+            return False, None
+        data = json.loads(row.data) if row.data else None
+        expires = row.expires
+        if expires.tzinfo is None:
+            expires = expires.replace(tzinfo=timezone.utc)
+        cls.lru.put(key, data, expires)
+        return True, data
+
+    @classmethod
+    def lookup(cls, url: str) -> dict:
+        """
+        Gets the Open Graph metadata of a URL from the caches
+        and scrapes the page only if neither has a live entry.
+        Must be called inside an app context
+
+        Args:
+            url (str): page URL
+
+        Raises:
+            ValueError: if the URL is not an absolute http(s) URL
+
+        Returns:
+            dict: Open Graph properties, None if the page could not
+                be fetched or has no Open Graph metadata
+        """
+        found, data = cls.cached(url)
+        if found:
+            return data
+        key = canonical_url(url)
+        data = fetch(key)
+        expires = utcnow() + (TTL if data else FAILURE_TTL)
+        cls.store(key, data, expires)
+        cls.lru.put(key, data, expires)
+        return data
+
+    @classmethod
+    def store(cls, key: str, data: dict, expires: datetime) -> None:
+        """
+        Saves a lookup to the database. A failed write only
+        loses the cache entry so it is rolled back and ignored
+
+        Args:
+            key (str): canonical URL
+            data (dict): Open Graph properties or None
+            expires (datetime): time the entry expires
+        """
+        try:
+            db.session.merge(OpenGraphCache(
+                url=key,
+                data=json.dumps(data) if data else None,
+                expires=expires,
+            ))
+            db.session.commit()
+        except SQLAlchemyError:
+            db.session.rollback()
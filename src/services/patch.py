@@ -0,0 +1,59 @@
+"""
+Module defining the partial update helper shared
+by the services
+"""
+
+from typing import Callable
+
+from sqlalchemy import update
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.db import db
+
+
+def invalid_fields(data: dict, fields: tuple) -> list:
+    """
+    Gets the keys in data that are not patchable fields
+
+    Args:
+        data (dict): partial update data
+        fields (tuple): names of the fields that can be updated
+
+    Returns:
+        list: sorted list of invalid field names
+    """
+    return sorted(set(data) - set(fields))
+
+
+def patch_row(model: db.Model, row_id: int, values: dict, on_update: Callable = None) -> dict:
+    """
+    Updates only the given columns of a single row with one
+    UPDATE ... WHERE id = ... RETURNING statement and commits
+
+    Args:
+        model (db.Model): model class of the table to update
+        row_id (int): primary key of the row
+        values (dict): column values to set
+        on_update (Callable): called with the updated row before
+            committing to make related writes in the same transaction
+
+    Raises:
+        SQLAlchemyError: if the update fails, after rolling back
+
+    Returns:
+        dict: the updated row or None if no row has the given ID
+    """
+    table = model.__table__
+    statement = update(table) \
+        .where(table.c.id == row_id) \
+        .values(**values) \
+        .returning(*table.columns)
+    try:
+        row = db.session.execute(statement).mappings().first()
+        if row and on_update:
+            on_update(dict(row))
+        db.session.commit()
+    except SQLAlchemyError:
+        db.session.rollback()
+        raise
+    return dict(row) if row else None
@@ -0,0 +1,167 @@
+"""
+Module defining the study pace planner that compares
+the pace needed to finish before the exam date with
+the pace recorded by the progress snapshots
+"""
+
+import math
+
+from datetime import date, timedelta
+
+from sqlalchemy import Row, func, select
+from sqlalchemy.orm import aliased
+
+from src.db import db
+from src.models.cert import Cert
+from src.models.section import Section
+from src.models.snapshot import ProgressSnapshot
+from src.services.dates import utcnow
+
+# days of snapshots used to measure the recent pace
+VELOCITY_DAYS = 14
+# days of the schedule returned for a distant exam
+MAX_SCHEDULE_DAYS = 60
+
+
+class PlannerService:
+    """
+    Study plans built from the progress counters so every
+    Cert is planned with one query and no Section rows
+    """
+
+    @classmethod
+    def get_all(cls, cert_ids: list = None, today: date = None) -> dict:
+        """
+        Gets the plan of every Cert, or of the given Certs,
+        with a single query reading the progress counters,
+        exam dates, and the snapshot starting the velocity
+        window. A Cert without a snapshot that old is measured
+        from its earliest snapshot
+
+        Args:
+            cert_ids (list): IDs of the Certs to plan, all by default
+            today (date): day to plan from, today in UTC by default
+
+        Returns:
+            dict: Cert ID to plan dict
+        """
+        today = today or utcnow().date()
+        window_start = today - timedelta(days=VELOCITY_DAYS)
+        of_cert = ProgressSnapshot.cert_id == Cert.id
+        # coalesce builds a SQL expression, pylint infers it returns nothing
+        since = func.coalesce(  # pylint: disable=assignment-from-no-return
+            select(func.max(ProgressSnapshot.day))
+            .where(of_cert, ProgressSnapshot.day <= window_start)
+            .scalar_subquery(),
+            select(func.min(ProgressSnapshot.day))
+            .where(of_cert)
+            .scalar_subquery(),
+        )
+        baseline = aliased(ProgressSnapshot)
+        query = select(
+            Cert.id,
+            Cert.exam_date,
+            Cert.section_count,
+            Cert.sections_complete,
+            since.label("since"),
+            select(baseline.sections_complete)
+            .where(baseline.cert_id == Cert.id, baseline.day == since)
+            .scalar_subquery()
+            .label("baseline"),
+        )
+        if cert_ids is not None:
+            query = query.where(Cert.id.in_(cert_ids))
+        return {
+            row.id: cls.plan(row, today)
+            for row in db.session.execute(query)
+        }
+
+    @classmethod
+    def plan(cls, row: Row, today: date) -> dict:
+        """
+        Works out the pace of a Cert from its counters
+
+        Args:
+            row (Row): Cert counters, exam date, and velocity baseline
+            today (date): day to plan from
+
+        Returns:
+            dict: remaining Sections, days left, required and
+                recent Sections per day, projected completion
+                date, and status
+        """
+        remaining = row.section_count - row.sections_complete
+        elapsed = (today - row.since).days if row.since else 0
+        velocity = None
+        if elapsed > 0:
+            velocity = round((row.sections_complete - row.baseline) / elapsed, 2)
+        projected = None
+        if remaining == 0:
+            projected = today
+        elif velocity and velocity > 0:
+            projected = today + timedelta(days=math.ceil(remaining / velocity))
+        days_left = (row.exam_date - today).days if row.exam_date else None
+        required = None
+        if days_left is not None and days_left > 0:
+            required = round(remaining / days_left, 2)
+        if not row.section_count:
+            status = "no sections"
+        elif remaining == 0:
+            status = "complete"
+        elif days_left is None:
+            status = "no exam date"
+        elif days_left <= 0:
+            status = "overdue"
+        elif velocity is None:
+            status = "no pace yet"
+        elif projected and projected <= row.exam_date:
+            status = "on track"
+        else:
+            status = "behind"
+        return {
+            "cert_id": row.id,
+            "exam_date": row.exam_date,
+            "remaining": remaining,
+            "days_left": days_left,
+            "required_per_day": required,
+            "velocity": velocity,
+            "projected_date": projected,
+            "status": status,
+        }
+
+    @classmethod
+    def get(cls, cert_id: int, today: date = None) -> dict:
+        """
+        Gets the plan of a Cert with a day by day schedule
+        spreading its incomplete Sections, in course and
+        number order, evenly over the days before the exam.
+        Only the first MAX_SCHEDULE_DAYS days are listed
+
+        Args:
+            cert_id (int): Cert ID
+            today (date): day to plan from, today in UTC by default
+
+        Returns:
+            dict: plan dict with a list of days and their
+                Sections, or None if the Cert is not found
+        """
+        today = today or utcnow().date()
+        plan = cls.get_all([cert_id], today).get(cert_id)
+        if not plan:
+            return None
+        days_left = plan["days_left"]
+        schedule = []
+        if plan["remaining"] and days_left and days_left > 0:
+            sections = db.session.execute(
+                select(Section.id, Section.resource_id, Section.number, Section.title)
+                .where(Section.cert_id == cert_id, Section.complete.is_not(True))
+                .order_by(Section.resource_id, Section.number)
+            ).mappings().all()
+            for offset in range(min(days_left, MAX_SCHEDULE_DAYS)):
+                start = offset * len(sections) // days_left
+                end = (offset + 1) * len(sections) // days_left
+                schedule.append({
+                    "day": today + timedelta(days=offset),
+                    "sections": [dict(section) for section in sections[start:end]],
+                })
+        return {**plan, "schedule": schedule}
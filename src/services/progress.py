@@ -0,0 +1,116 @@
+"""
+Module defining the progress counters kept on course
+Resources and Certs by the other services
+"""
+
+from sqlalchemy import and_, func, select, update
+
+from src.db import db
+from src.models.cert import Cert
+from src.models.resource import Resource
+from src.models.section import Section
+from src.services.stats import StatsService
+
+
+def count(model: db.Model, *criteria) -> select:
+    """
+    Builds a correlated subquery counting the rows of a model
+
+    Args:
+        model (db.Model): model class of the table to count
+        *criteria: WHERE clauses
+
+    Returns:
+        select: scalar subquery
+    """
+    return select(func.count(model.id)).where(*criteria).scalar_subquery()  # pylint: disable=not-callable
+
+
+class ProgressService:
+    """
+    Section and course counters for Resources and Certs.
+    The counters are recounted for the rows a write touched
+    in the same transaction as the write, so reading progress
+    never needs to load the Sections
+    """
+
+    @classmethod
+    def refresh(cls, cert_ids: set, resource_ids: set = ()) -> None:
+        """
+        Recounts the Sections of the given course Resources
+        and the Sections and courses of the given Certs. A
+        course with Sections is complete when all of them are,
+        and a Cert is complete when it has courses and all of
+        them are. The course statistics rollups are recounted
+        for courses whose complete flag changed. Runs in the
+        caller's transaction without committing
+
+        Args:
+            cert_ids (set): IDs of the Certs to recount
+            resource_ids (set): IDs of the Resources to recount
+        """
+        cert_ids = [int(i) for i in cert_ids if i is not None]
+        resource_ids = [int(i) for i in resource_ids if i is not None]
+        options = {"synchronize_session": False}
+        if resource_ids:
+            of_resource = Section.resource_id == Resource.id
+            db.session.execute(
+                update(Resource)
+                .where(Resource.id.in_(resource_ids))
+                .values(
+                    section_count=count(Section, of_resource),
+                    sections_complete=count(Section, of_resource, Section.complete.is_(True)),
+                    sections_cards_made=count(Section, of_resource, Section.cards_made.is_(True)),
+                ),
+                execution_options=options
+            )
+            derived = Resource.sections_complete == Resource.section_count
+            changed = db.session.scalars(
+                update(Resource)
+                .where(
+                    Resource.id.in_(resource_ids),
+                    Resource.section_count > 0,
+                    Resource.complete.is_distinct_from(derived)
+                )
+                .values(complete=derived)
+                .returning(Resource.cert_id),
+                execution_options=options
+            ).all()
+            # only courses whose complete flag flipped change the rollups
+            StatsService.refresh({(cert_id, "course") for cert_id in changed})
+        if cert_ids:
+            of_cert = Section.cert_id == Cert.id
+            course = (Resource.cert_id == Cert.id, Resource.resource_type == "course")
+            db.session.execute(
+                update(Cert)
+                .where(Cert.id.in_(cert_ids))
+                .values(
+                    section_count=count(Section, of_cert),
+                    sections_complete=count(Section, of_cert, Section.complete.is_(True)),
+                    sections_cards_made=count(Section, of_cert, Section.cards_made.is_(True)),
+                    course_count=count(Resource, *course),
+                    courses_complete=count(Resource, *course, Resource.complete.is_(True)),
+                ),
+                execution_options=options
+            )
+            db.session.execute(
+                update(Cert)
+                .where(Cert.id.in_(cert_ids))
+                .values(complete=and_(
+                    Cert.course_count > 0,
+                    Cert.courses_complete == Cert.course_count
+                )),
+                execution_options=options
+            )
+
+    @classmethod
+    def refresh_row(cls, row: dict) -> None:
+        """
+        Recounts the Cert of an updated Resource or Section
+        row, and the course Resource of a Section row
+
+        Args:
+            row (dict): Resource or Section row data
+        """
+        resource_ids = {row["resource_id"]} if "resource_id" in row else ()
+        cls.refresh({row["cert_id"]}, resource_ids)
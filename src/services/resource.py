@@ -0,0 +1,458 @@
+"""
+Module defining in-process Resource operations shared
+by the API and the HTML views
+"""
+
+# pylint: disable=duplicate-code
+
+from dataclasses import asdict
+from datetime import datetime
+
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.db import db
+from src.models.cert import Cert
+from src.models.resource import Resource
+from src.models.section import Section
+from src.services.dates import utcnow
+from src.services.patch import invalid_fields, patch_row
+from src.services.progress import ProgressService
+from src.services.search import search_index
+from src.services.stats import StatsService
+
+RESOURCE_TYPES = ("course", "video", "article", "documentation")
+PATCH_FIELDS = (
+    "resource_type", "url", "title", "image", "description",
+    "site_logo", "site_name", "has_og_data", "complete",
+)
+
+
+class ResourceService:
+    """
+    Resource CRUD operations returning plain data
+    """
+
+    @classmethod
+    def get_all(
+        cls,
+        after: int = None,
+        limit: int = None,
+        updated_since: datetime = None,
+        **filters
+    ) -> list:
+        """
+        Gets all Resources from the database matching the
+        given filters ordered by ID. Filters set to None
+        are ignored
+
+        Args:
+            after (int): only return Resources with an ID greater than this
+            limit (int): maximum number of Resources to return
+            updated_since (datetime): only return Resources updated at
+                or after this time
+            **filters: column values to filter on, any of
+                cert_id, resource_type, or complete
+
+        Returns:
+            list: list of Resource dicts
+        """
+        filters = {k: v for k, v in filters.items() if v is not None}
+        query = Resource.query.filter_by(**filters)
+        if updated_since is not None:
+            query = query.filter(Resource.updated >= updated_since)
+        if after is not None:
+            query = query.filter(Resource.id > after)
+        resources = query.order_by(Resource.id).limit(limit).all()
+        return [asdict(resource) for resource in resources]
+
+    @classmethod
+    def get_importable(cls, cert_id: int) -> list:
+        """
+        Gets the Resources that can be imported onto a Cert
+        with a single query: the first Resource of each title
+        on the other Certs, unless the Cert already has a
+        Resource with that title
+
+        Args:
+            cert_id (int): Cert ID
+
+        Returns:
+            list: list of Resource dicts ordered by ID
+        """
+        first_of_title = select(func.min(Resource.id)) \
+            .where(Resource.cert_id != cert_id) \
+            .group_by(Resource.title)
+        on_cert = select(Resource.title).where(Resource.cert_id == cert_id)
+        resources = Resource.query \
+            .filter(Resource.id.in_(first_of_title), Resource.title.not_in(on_cert)) \
+            .order_by(Resource.id) \
+            .all()
+        return [asdict(resource) for resource in resources]
+
+    @classmethod
+    def get(cls, resource_id: int) -> dict:
+        """
+        Gets a Resource from the database by ID
+
+        Args:
+            resource_id (int): Resource ID
+
+        Returns:
+            dict: Resource data or None if not found
+        """
+        resource = Resource.query.filter_by(id=resource_id).first()
+        return asdict(resource) if resource else None
+
+    @classmethod
+    def create(cls, data: dict) -> dict:
+        """
+        Creates a Resource using the provided data
+
+        Args:
+            data (dict): Resource attribute values
+
+        Returns:
+            dict: result message and status
+        """
+        # add default images if none provided
+        image = data["image"] if data["image"] else "default_image.jpg"
+        logo = data["site_logo"] if data["site_logo"] else "default_logo.png"
+        resource = Resource(
+            cert_id=data["cert_id"],
+            resource_type=data["resource_type"],
+            url=data["url"],
+            title=data["title"],
+            image=image,
+            description=data["description"],
+            site_logo=logo,
+            site_name=data["site_name"],
+            has_og_data=data["has_og_data"],
+            complete=data["complete"],
+            created=utcnow(),
+        )
+        db.session.add(resource)
+        db.session.flush()
+        ProgressService.refresh({resource.cert_id})
+        StatsService.refresh(
+            {(resource.cert_id, resource.resource_type)},
+            {(resource.cert_id, resource.created)}
+        )
+        db.session.commit()
+        search_index.sync({("resource", resource.id)})
+        return {
+            "message": "Resource created successfully",
+            "status": 200,
+        }
+
+    @classmethod
+    def create_bulk(cls, resources: list) -> dict:
+        """
+        Creates multiple Resources using a single multi-row
+        insert in one transaction, so either every Resource
+        is created or none are
+
+        Args:
+            resources (list): list of Resource attribute dicts
+
+        Returns:
+            dict: result message and status
+        """
+        created = utcnow()
+        rows = [
+            {
+                **resource,
+                # add default images if none provided
+                "image": resource["image"] or "default_image.jpg",
+                "site_logo": resource["site_logo"] or "default_logo.png",
+                "complete": False,
+                "created": created,
+            }
+            for resource in resources
+        ]
+        try:
+            ids = db.session.scalars(insert(Resource).returning(Resource.id), rows).all()
+            ProgressService.refresh({row["cert_id"] for row in rows})
+            StatsService.refresh(
+                {(row["cert_id"], row["resource_type"]) for row in rows},
+                {(row["cert_id"], created) for row in rows}
+            )
+            db.session.commit()
+        except SQLAlchemyError:
+            db.session.rollback()
+            return {
+                "message": "Create resources failed",
+                "status": 500,
+            }
+        search_index.sync({("resource", resource_id) for resource_id in ids})
+        return {
+            "message": f"{len(rows)} resources created successfully",
+            "status": 200,
+        }
+
+    @classmethod
+    def import_resources(cls, cert_id: int, resource_ids: list) -> dict:
+        """
+        Copies the given Resources onto a Cert with a single
+        INSERT ... SELECT statement. Resources are skipped as
+        duplicates if the Cert already has a Resource with the
+        same title or URL, or if an earlier Resource being
+        imported in the same selection has the same title or URL
+
+        Args:
+            cert_id (int): ID of the Cert to import into
+            resource_ids (list): IDs of the Resources to copy
+
+        Returns:
+            dict: result message, status, import count, and
+                the IDs that were skipped or not found
+        """
+        try:
+            cert_id = int(cert_id)
+            resource_ids = [int(resource_id) for resource_id in resource_ids]
+        except (TypeError, ValueError):
+            return {
+                "message": "Invalid cert or resource ID",
+                "status": 400,
+            }
+        if not db.session.get(Cert, cert_id):
+            return {
+                "message": "Cert not found",
+                "status": 404,
+            }
+        existing = db.session.execute(
+            select(Resource.title, Resource.url).where(Resource.cert_id == cert_id)
+        ).all()
+        titles = {row.title for row in existing}
+        urls = {row.url for row in existing}
+        found = db.session.execute(
+            select(Resource.id, Resource.title, Resource.url)
+            .where(Resource.id.in_(resource_ids))
+            .order_by(Resource.id)
+        ).all()
+        # only Resources that will be imported block later ones
+        imported, skipped = [], []
+        for row in found:
+            if row.title in titles or row.url in urls:
+                skipped.append(row.id)
+                continue
+            imported.append(row.id)
+            titles.add(row.title)
+            urls.add(row.url)
+        not_found = sorted(set(resource_ids) - {row.id for row in found})
+        created = utcnow()
+        columns = [
+            "cert_id", "resource_type", "url", "title", "image", "description",
+            "site_logo", "site_name", "has_og_data", "complete", "created",
+        ]
+        copy = select(
+            literal(cert_id),
+            Resource.resource_type,
+            Resource.url,
+            Resource.title,
+            Resource.image,
+            Resource.description,
+            Resource.site_logo,
+            Resource.site_name,
+            Resource.has_og_data,
+            Resource.complete,
+            literal(created, Resource.created.type),
+        ).where(Resource.id.in_(imported))
+        rows = []
+        try:
+            if imported:
+                rows = db.session.execute(
+                    insert(Resource)
+                    .from_select(columns, copy)
+                    .returning(Resource.id, Resource.resource_type)
+                ).all()
+                ProgressService.refresh({cert_id})
+                StatsService.refresh(
+                    {(cert_id, row.resource_type) for row in rows},
+                    {(cert_id, created)}
+                )
+            db.session.commit()
+        except SQLAlchemyError:
+            db.session.rollback()
+            return {
+                "message": "Import resources failed",
+                "status": 500,
+            }
+        search_index.sync({("resource", row.id) for row in rows})
+        return {
+            "message": f"{len(imported)} resources imported successfully",
+            "status": 200,
+            "imported": len(imported),
+            "skipped": skipped,
+            "not_found": not_found,
+        }
+
+    @classmethod
+    def update(cls, resource_id: int, data: dict) -> dict:
+        """
+        Updates a Resource in the database
+
+        Args:
+            resource_id (int): Resource ID
+            data (dict): Resource attribute values
+
+        Returns:
+            dict: result message and status
+        """
+        resource = Resource.query.filter_by(id=resource_id).first()
+        if not resource:
+            return {
+                "message": "Resource not found",
+                "status": 404,
+            }
+        # add default images if none provided
+        image = data["image"] if data["image"] else "default_image.jpg"
+        logo = data["site_logo"] if data["site_logo"] else "default_logo.png"
+        old_type = resource.resource_type
+        resource.resource_type = data["resource_type"]
+        resource.url = data["url"]
+        resource.title = data["title"]
+        resource.image = image
+        resource.description = data["description"]
+        resource.site_logo = logo
+        resource.site_name = data["site_name"]
+        resource.complete = data["complete"]
+        resource.updated = utcnow()
+        try:
+            db.session.flush()
+            ProgressService.refresh({resource.cert_id}, {resource.id})
+            StatsService.refresh({
+                (resource.cert_id, old_type),
+                (resource.cert_id, resource.resource_type),
+            })
+            db.session.commit()
+        except SQLAlchemyError:
+            db.session.rollback()
+            return {
+                "message": "Resource update failed",
+                "status": 500,
+            }
+        search_index.sync({("resource", resource_id)})
+        return {
+            "message": "Resource updated successfully",
+            "status": 200,
+        }
+
+    @classmethod
+    def patch(cls, resource_id: int, data: dict) -> dict:
+        """
+        Updates only the provided fields of a Resource with
+        a single UPDATE statement
+
+        Args:
+            resource_id (int): Resource ID
+            data (dict): Resource attribute values to change
+
+        Returns:
+            dict: result message, status, and updated Resource data
+        """
+        if not isinstance(data, dict) or not data:
+            return {
+                "message": "No fields to update",
+                "status": 400,
+            }
+        invalid = invalid_fields(data, PATCH_FIELDS)
+        if invalid:
+            return {
+                "message": f"Invalid fields: {", ".join(invalid)}",
+                "status": 400,
+            }
+        current = db.session.execute(
+            select(Resource.resource_type, Resource.section_count)
+            .where(Resource.id == resource_id)
+        ).first()
+        # a course with Sections is complete when all of them are
+        if current and "complete" in data and current.section_count:
+            return {
+                "message": "Complete is set by the sections of this course",
+                "status": 400,
+            }
+        values = dict(data)
+        # add default images if cleared
+        if "image" in values and not values["image"]:
+            values["image"] = "default_image.jpg"
+        if "site_logo" in values and not values["site_logo"]:
+            values["site_logo"] = "default_logo.png"
+        values["updated"] = utcnow()
+
+        def on_update(row: dict) -> None:
+            ProgressService.refresh_row(row)
+            types = {(row["cert_id"], row["resource_type"])}
+            if current:
+                types.add((row["cert_id"], current.resource_type))
+            StatsService.refresh(types)
+
+        try:
+            resource = patch_row(Resource, resource_id, values, on_update)
+        except SQLAlchemyError:
+            return {
+                "message": "Resource update failed",
+                "status": 500,
+            }
+        if not resource:
+            return {
+                "message": "Resource not found",
+                "status": 404,
+            }
+        search_index.sync({("resource", resource["id"])})
+        return {
+            "message": "Resource updated successfully",
+            "status": 200,
+            "data": resource,
+        }
+
+    @classmethod
+    def delete(cls, resource_id: int) -> dict:
+        """
+        Deletes the Resource with the given ID along with
+        any Sections if the Resource is a course, in a
+        single transaction
+
+        Args:
+            resource_id (int): Resource ID
+
+        Returns:
+            dict: result message and status
+        """
+        try:
+            section_ids = db.session.scalars(
+                delete(Section)
+                .where(Section.resource_id == resource_id)
+                .returning(Section.id)
+            ).all()
+            deleted = db.session.execute(
+                delete(Resource)
+                .where(Resource.id == resource_id)
+                .returning(Resource.cert_id, Resource.resource_type, Resource.created)
+            ).first()
+            if not deleted:
+                db.session.rollback()
+                return {
+                    "message": "Resource not found",
+                    "status": 404,
+                }
+            ProgressService.refresh({deleted.cert_id})
+            StatsService.refresh(
+                {(deleted.cert_id, deleted.resource_type)},
+                {(deleted.cert_id, deleted.created)}
+            )
+            db.session.commit()
+        except SQLAlchemyError:
+            db.session.rollback()
+            return {
+                "message": "Resource delete failed",
+                "status": 500,
+            }
+        search_index.sync({
+            ("resource", resource_id),
+            *(("section", section_id) for section_id in section_ids),
+        })
+        return {
+            "message": "Resource deleted successfully",
+            "status": 200
+        }
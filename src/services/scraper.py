@@ -0,0 +1,183 @@
+"""
+Module defining the background worker pool that scrapes
+Open Graph metadata outside of the request threads
+"""
+
+import secrets
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from flask import Flask
+from sqlalchemy import delete, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.db import db
+from src.models.og_job import OpenGraphJob
+from src.services.dates import utcnow
+from src.services.opengraph import OpenGraphService, canonical_url
+
+# number of pages scraped at the same time
+WORKERS = 4
+# how long finished jobs can be polled for
+JOB_TTL = timedelta(minutes=10)
+# how long a job can stay pending before its worker is assumed lost
+PENDING_TTL = timedelta(minutes=1)
+# random bytes in a job token, which is 16 characters long
+TOKEN_BYTES = 12
+
+
+class ScrapeQueue:
+    """
+    Thread pool running Open Graph lookups as jobs polled
+    by a token. Jobs are stored in the database so a poll
+    can be answered by any worker process, and a URL already
+    being scraped shares the pending job of the first
+    request for it. Finished jobs point at the cached
+    properties until they expire so the resource form can
+    be filled without them being sent through the URL
+    """
+
+    def __init__(self, workers: int = WORKERS) -> None:
+        self.workers = workers
+        self.lock = threading.Lock()
+        self.executor = None
+
+    def submit(self, app: Flask, url: str) -> str:
+        """
+        Queues a lookup of a URL. Must be called inside an
+        app context
+
+        Args:
+            app (Flask): app whose context the lookup runs in
+            url (str): page URL
+
+        Raises:
+            ValueError: if the URL is not an absolute http(s) URL
+
+        Returns:
+            str: job token
+        """
+        key = canonical_url(url)
+        now = utcnow()
+        db.session.execute(delete(OpenGraphJob).where(OpenGraphJob.expires <= now))
+        pending = OpenGraphJob.query \
+            .filter(
+                OpenGraphJob.key == key,
+                OpenGraphJob.status == "pending",
+                OpenGraphJob.expires > now
+            ) \
+            .first()
+        if pending:
+            db.session.commit()
+            return pending.token
+        token = secrets.token_urlsafe(TOKEN_BYTES)
+        db.session.add(OpenGraphJob(
+            token=token,
+            url=url,
+            key=key,
+            status="pending",
+            expires=now + PENDING_TTL,
+        ))
+        # commit before queueing so the worker finds the job
+        db.session.commit()
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(self.workers, "og-scraper")
+            self.executor.submit(self.run, app, key)
+        return token
+
+    def lookup(self, app: Flask, url: str) -> dict:
+        """
+        Gets the metadata of a URL from the caches, or queues
+        the page for scraping if neither has a live entry.
+        Must be called inside an app context
+
+        Args:
+            app (Flask): app whose context a scrape runs in
+            url (str): page URL
+
+        Raises:
+            ValueError: if the URL is not an absolute http(s) URL
+
+        Returns:
+            dict: job status, which is done or failed for a cached
+                lookup and pending for a queued one, the URL, the
+                Open Graph properties, and the token to poll a
+                queued lookup by, which is None for a cached one
+        """
+        found, data = OpenGraphService.cached(url)
+        if found:
+            return {
+                "status": "done" if data else "failed",
+                "url": url,
+                "data": data,
+                "token": None,
+            }
+        return {
+            "status": "pending",
+            "url": url,
+            "data": None,
+            "token": self.submit(app, url),
+        }
+
+    def run(self, app: Flask, key: str) -> None:
+        """
+        Runs a lookup on a worker thread and finishes every
+        pending job for the URL, rolling back first if the
+        lookup raised
+
+        Args:
+            app (Flask): app whose context the lookup runs in
+            key (str): canonical URL
+        """
+        with app.app_context():
+            data = None
+            try:
+                data = OpenGraphService.lookup(key)
+            except Exception:
+                # leave the session usable to mark the jobs failed
+                db.session.rollback()
+                raise
+            finally:
+                try:
+                    db.session.execute(
+                        update(OpenGraphJob)
+                        .where(OpenGraphJob.key == key, OpenGraphJob.status == "pending")
+                        .values(status="done" if data else "failed", expires=utcnow() + JOB_TTL)
+                    )
+                    db.session.commit()
+                except SQLAlchemyError:
+                    # the jobs stay pending until PENDING_TTL expires them
+                    db.session.rollback()
+
+    def status(self, token: str) -> dict:
+        """
+        Gets the state of a job. Must be called inside an app
+        context
+
+        Args:
+            token (str): job token
+
+        Returns:
+            dict: job status, which is pending, done, or failed,
+                the URL, and the Open Graph properties once done,
+                or None if the token is unknown or expired
+        """
+        job = OpenGraphJob.query \
+            .filter(OpenGraphJob.token == token, OpenGraphJob.expires > utcnow()) \
+            .first()
+        if not job:
+            return None
+        data = None
+        if job.status == "done":
+            _, data = OpenGraphService.cached(job.key)
+        return {
+            "status": "failed" if job.status == "done" and not data else job.status,
+            "url": job.url,
+            "data": data,
+        }
+
+
+scrape_queue = ScrapeQueue()
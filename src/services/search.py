@@ -0,0 +1,235 @@
+"""
+Module defining the in-memory inverted index used to
+search across Certs, Resources, and Sections
+"""
+
+import math
+import re
+import threading
+
+from collections import Counter
+
+from src.db import db
+from src.models.cert import Cert
+from src.models.resource import Resource
+from src.models.section import Section
+from src.models.version import TableVersion, committed_tables
+
+# tables whose versions are checked before each search
+INDEXED_TABLES = ("certs", "resources", "sections")
+
+
+def tokenize(text: str) -> list:
+    """
+    Splits text into lowercase alphanumeric tokens
+
+    Args:
+        text (str): text to tokenize
+
+    Returns:
+        list: list of tokens
+    """
+    return re.findall(r"[^\W_]+", (text or "").lower())
+
+
+class SearchIndex:
+    """
+    Inverted index over Cert, Resource, and Section text
+    scored with BM25. The index is built from the database
+    on first use and each write through the services replaces
+    only the documents of the rows it touched. Table versions
+    are compared before every search so writes made by
+    another process trigger a full rebuild
+    """
+
+    # BM25 term frequency saturation and length normalisation
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.postings = {}
+        self.docs = {}
+        self.cert_docs = {}
+        self.cert_names = {}
+        self.total_length = 0
+        self.versions = None
+
+    def clear(self) -> None:
+        """
+        Removes every document from the index
+        """
+        with self.lock:
+            self.postings = {}
+            self.docs = {}
+            self.cert_docs = {}
+            self.cert_names = {}
+            self.total_length = 0
+            self.versions = None
+
+    def build(self) -> None:
+        """
+        Rebuilds the index from every Cert, Resource, and
+        Section in the database. Must be called inside an
+        app context
+        """
+        with self.lock:
+            self.clear()
+            self.add_rows(
+                Cert.query.all(),
+                Resource.query.all(),
+                Section.query.all()
+            )
+            self.versions = TableVersion.get(INDEXED_TABLES)
+
+    def sync(self, keys: set) -> None:
+        """
+        Replaces the documents with the given keys with their
+        current database rows, removing those whose rows are
+        gone. A removed Cert also removes the documents of its
+        Resources and Sections. Call after committing a write
+        with the keys of the rows it touched. The index is
+        rebuilt instead if the table versions moved by more
+        than that commit bumped, since another commit has then
+        written rows the index has not seen
+
+        Args:
+            keys (set): document keys, each a table of cert,
+                resource, or section and a row ID
+        """
+        bumped = committed_tables(db.session)
+        with self.lock:
+            if self.versions is None:
+                self.build()
+                return
+            versions = TableVersion.get(INDEXED_TABLES)
+            expected = {
+                name: version + 1 if name in bumped else version
+                for name, version in self.versions.items()
+            }
+            if versions != expected:
+                self.build()
+                return
+            rows = {}
+            for table, model in (("cert", Cert), ("resource", Resource), ("section", Section)):
+                ids = {int(row_id) for key_table, row_id in keys if key_table == table}
+                rows[table] = model.query.filter(model.id.in_(ids)).all() if ids else []
+                found = {row.id for row in rows[table]}
+                for row_id in ids:
+                    self.remove((table, row_id))
+                    if table == "cert" and row_id not in found:
+                        for key in self.cert_docs.pop(row_id, set()):
+                            self.remove(key)
+                        self.cert_names.pop(row_id, None)
+            self.add_rows(rows["cert"], rows["resource"], rows["section"])
+            self.versions = versions
+
+    def add_rows(self, certs: list, resources: list, sections: list) -> None:
+        """
+        Adds documents for the given model instances
+
+        Args:
+            certs (list): Cert instances
+            resources (list): Resource instances
+            sections (list): Section instances
+        """
+        for cert in certs:
+            self.cert_names[cert.id] = cert.name
+            self.add(("cert", cert.id), {
+                "type": "cert",
+                "id": cert.id,
+                "cert_id": cert.id,
+                "title": f"{cert.name} - {cert.code}",
+            }, (cert.name, cert.code, cert.tags))
+        for resource in resources:
+            self.add(("resource", resource.id), {
+                "type": resource.resource_type,
+                "id": resource.id,
+                "cert_id": resource.cert_id,
+                "title": resource.title,
+            }, (resource.title, resource.description, resource.site_name))
+        for section in sections:
+            self.add(("section", section.id), {
+                "type": "section",
+                "id": section.id,
+                "cert_id": section.cert_id,
+                "title": f"{section.number}. {section.title}",
+            }, (section.title,))
+
+    def add(self, key: tuple, doc: dict, fields: tuple) -> None:
+        """
+        Adds a document to the index
+
+        Args:
+            key (tuple): document table and ID
+            doc (dict): result data returned for the document
+            fields (tuple): text fields to index
+        """
+        terms = Counter(token for field in fields for token in tokenize(field))
+        length = sum(terms.values())
+        self.docs[key] = {"doc": doc, "terms": terms, "length": length}
+        self.cert_docs.setdefault(doc["cert_id"], set()).add(key)
+        self.total_length += length
+        for token, count in terms.items():
+            self.postings.setdefault(token, {})[key] = count
+
+    def remove(self, key: tuple) -> None:
+        """
+        Removes a document from the index
+
+        Args:
+            key (tuple): document table and ID
+        """
+        entry = self.docs.pop(key, None)
+        if not entry:
+            return
+        self.cert_docs.get(entry["doc"]["cert_id"], set()).discard(key)
+        self.total_length -= entry["length"]
+        for token in entry["terms"]:
+            postings = self.postings[token]
+            postings.pop(key, None)
+            if not postings:
+                del self.postings[token]
+
+    def search(self, query: str, limit: int = 50) -> list:
+        """
+        Gets the documents best matching the query ranked
+        by BM25 score. Must be called inside an app context
+
+        Args:
+            query (str): search terms
+            limit (int): maximum number of results
+
+        Returns:
+            list: list of result dicts with type, id, cert_id,
+                cert_name, title, and score
+        """
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+        with self.lock:
+            if self.versions != TableVersion.get(INDEXED_TABLES):
+                self.build()
+            count = len(self.docs)
+            if not count:
+                return []
+            average = self.total_length / count
+            scores = Counter()
+            for term in terms:
+                postings = self.postings.get(term, {})
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for key, frequency in postings.items():
+                    norm = 1 - self.B + self.B * self.docs[key]["length"] / average
+                    scores[key] += idf * frequency * (self.K1 + 1) / \
+                        (frequency + self.K1 * norm)
+            return [
+                {
+                    **self.docs[key]["doc"],
+                    "cert_name": self.cert_names.get(self.docs[key]["doc"]["cert_id"]),
+                    "score": round(score, 4),
+                }
+                for key, score in scores.most_common(limit)
+            ]
+
+
+search_index = SearchIndex()
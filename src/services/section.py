@@ -0,0 +1,252 @@
+"""
+Module defining in-process Section operations shared
+by the API and the HTML views
+"""
+
+# pylint: disable=duplicate-code
+
+from dataclasses import asdict
+
+from sqlalchemy import delete, insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.db import db
+from src.models.section import Section
+from src.services.dates import utcnow
+from src.services.patch import invalid_fields, patch_row
+from src.services.progress import ProgressService
+from src.services.search import search_index
+
+PATCH_FIELDS = ("number", "title", "cards_made", "complete")
+
+
+class SectionService:
+    """
+    Section CRUD operations returning plain data
+    """
+
+    @classmethod
+    def get_all(cls, after: int = None, limit: int = None, **filters) -> list:
+        """
+        Gets all Sections from the database matching the
+        given filters ordered by ID. Filters set to None
+        are ignored
+
+        Args:
+            after (int): only return Sections with an ID greater than this
+            limit (int): maximum number of Sections to return
+            **filters: column values to filter on, any of
+                cert_id, resource_id, or complete
+
+        Returns:
+            list: list of Section dicts
+        """
+        filters = {k: v for k, v in filters.items() if v is not None}
+        query = Section.query.filter_by(**filters)
+        if after is not None:
+            query = query.filter(Section.id > after)
+        sections = query.order_by(Section.id).limit(limit).all()
+        return [asdict(section) for section in sections]
+
+    @classmethod
+    def get(cls, section_id: int) -> dict:
+        """
+        Gets a Section from the database by ID
+
+        Args:
+            section_id (int): Section ID
+
+        Returns:
+            dict: Section data or None if not found
+        """
+        section = Section.query.filter_by(id=section_id).first()
+        return asdict(section) if section else None
+
+    @classmethod
+    def create(cls, data: dict) -> dict:
+        """
+        Creates a Section using the provided data
+
+        Args:
+            data (dict): Section attribute values
+
+        Returns:
+            dict: result message and status
+        """
+        section = Section(
+            cert_id=data["cert_id"],
+            resource_id=data["resource_id"],
+            number=data["number"],
+            title=data["title"],
+            created=utcnow(),
+        )
+        db.session.add(section)
+        db.session.flush()
+        ProgressService.refresh({section.cert_id}, {section.resource_id})
+        db.session.commit()
+        search_index.sync({("section", section.id)})
+        return {
+            "message": "Section created successfully",
+            "status": 200,
+        }
+
+    @classmethod
+    def create_bulk(cls, sections: list) -> dict:
+        """
+        Creates multiple Sections using a single multi-row
+        insert in one transaction. All rows are validated
+        before anything is written so either every Section
+        is created or none are
+
+        Args:
+            sections (list): list of Section attribute dicts
+
+        Returns:
+            dict: result message and status
+        """
+        if not isinstance(sections, list) or not sections:
+            return {
+                "message": "List of sections not found",
+                "status": 400,
+            }
+        created = utcnow()
+        rows = []
+        for i, section in enumerate(sections):
+            try:
+                rows.append({
+                    "cert_id": int(section["cert_id"]),
+                    "resource_id": int(section["resource_id"]),
+                    "number": int(section["number"]),
+                    "title": str(section["title"]),
+                    "created": created,
+                })
+            except (KeyError, TypeError, ValueError):
+                return {
+                    "message": f"Invalid section at index {i}",
+                    "status": 400,
+                }
+        try:
+            ids = db.session.scalars(insert(Section).returning(Section.id), rows).all()
+            ProgressService.refresh(
+                {row["cert_id"] for row in rows},
+                {row["resource_id"] for row in rows}
+            )
+            db.session.commit()
+        except SQLAlchemyError:
+            db.session.rollback()
+            return {
+                "message": "Create sections failed",
+                "status": 500,
+            }
+        search_index.sync({("section", section_id) for section_id in ids})
+        return {
+            "message": f"{len(rows)} sections created successfully",
+            "status": 200,
+        }
+
+    @classmethod
+    def update(cls, section_id: int, data: dict) -> dict:
+        """
+        Updates a Section in the database
+
+        Args:
+            section_id (int): Section ID
+            data (dict): Section attribute values
+
+        Returns:
+            dict: result message and status
+        """
+        section = Section.query.filter_by(id=section_id).first()
+        if not section:
+            return {
+                "message": "Section not found",
+                "status": 404,
+            }
+        section.number = data["number"]
+        section.title = data["title"]
+        section.cards_made = data["cards_made"]
+        section.complete = data["complete"]
+        section.updated = utcnow()
+        db.session.flush()
+        ProgressService.refresh({section.cert_id}, {section.resource_id})
+        db.session.commit()
+        search_index.sync({("section", section_id)})
+        return {
+            "message": "Section updated successfully",
+            "status": 200,
+        }
+
+    @classmethod
+    def patch(cls, section_id: int, data: dict) -> dict:
+        """
+        Updates only the provided fields of a Section with
+        a single UPDATE statement
+
+        Args:
+            section_id (int): Section ID
+            data (dict): Section attribute values to change
+
+        Returns:
+            dict: result message, status, and updated Section data
+        """
+        if not isinstance(data, dict) or not data:
+            return {
+                "message": "No fields to update",
+                "status": 400,
+            }
+        invalid = invalid_fields(data, PATCH_FIELDS)
+        if invalid:
+            return {
+                "message": f"Invalid fields: {", ".join(invalid)}",
+                "status": 400,
+            }
+        values = dict(data)
+        values["updated"] = utcnow()
+        try:
+            section = patch_row(Section, section_id, values, ProgressService.refresh_row)
+        except SQLAlchemyError:
+            return {
+                "message": "Section update failed",
+                "status": 500,
+            }
+        if not section:
+            return {
+                "message": "Section not found",
+                "status": 404,
+            }
+        search_index.sync({("section", section["id"])})
+        return {
+            "message": "Section updated successfully",
+            "status": 200,
+            "data": section,
+        }
+
+    @classmethod
+    def delete(cls, section_id: int) -> dict:
+        """
+        Deletes a Section from the database by ID and
+        recounts the progress of its course and Cert
+
+        Args:
+            section_id (int): Section ID
+
+        Returns:
+            dict: result message and status
+        """
+        deleted = db.session.execute(
+            delete(Section)
+            .where(Section.id == section_id)
+            .returning(Section.id, Section.cert_id, Section.resource_id)
+        ).first()
+        if deleted:
+            ProgressService.refresh({deleted.cert_id}, {deleted.resource_id})
+            db.session.commit()
+            search_index.sync({("section", deleted.id)})
+            return {
+                "message": "Section deleted successfully",
+                "status": 200
+            }
+        return {
+            "message": "Section not found",
+            "status": 404,
+        }
@@ -0,0 +1,151 @@
+"""
+Module defining the daily progress snapshots used to
+chart Cert progress over time
+"""
+
+from datetime import date, timedelta
+
+from sqlalchemy import Date, and_, exists, func, insert, literal, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import aliased
+
+from src.db import db
+from src.models.cert import Cert
+from src.models.snapshot import ProgressSnapshot
+from src.services.dates import parse_date, utcnow
+
+# counters copied from certs into each snapshot
+COUNTERS = (
+    "section_count", "sections_complete", "sections_cards_made",
+    "course_count", "courses_complete",
+)
+DEFAULT_DAYS = 30
+MAX_DAYS = 366
+
+
+class SnapshotService:
+    """
+    Snapshot operations returning plain data
+    """
+
+    @classmethod
+    def take(cls, day: date = None) -> dict:
+        """
+        Appends a snapshot of every Cert's progress counters
+        for the given day with a single INSERT ... SELECT. Certs
+        whose counters match their latest snapshot, or that
+        already have a snapshot on or after the day, are skipped
+        so running the job more than once a day is harmless
+
+        Args:
+            day (date): day to record, today in UTC by default
+
+        Returns:
+            dict: result message, status, and snapshot count
+        """
+        day = day or utcnow().date()
+        previous = aliased(ProgressSnapshot)
+        latest = aliased(ProgressSnapshot)
+        latest_day = select(func.max(latest.day)) \
+            .where(latest.cert_id == Cert.id) \
+            .scalar_subquery()
+        unchanged = exists().where(
+            previous.cert_id == Cert.id,
+            previous.day == latest_day,
+            and_(*[
+                getattr(previous, counter) == getattr(Cert, counter)
+                for counter in COUNTERS
+            ])
+        )
+        taken = exists().where(
+            ProgressSnapshot.cert_id == Cert.id,
+            ProgressSnapshot.day >= day
+        )
+        rows = select(
+            Cert.id,
+            literal(day, Date),
+            *[getattr(Cert, counter) for counter in COUNTERS]
+        ).where(~unchanged, ~taken)
+        try:
+            result = db.session.execute(
+                insert(ProgressSnapshot).from_select(["cert_id", "day", *COUNTERS], rows)
+            )
+            db.session.commit()
+        except SQLAlchemyError:
+            db.session.rollback()
+            return {
+                "message": "Snapshot failed",
+                "status": 500,
+            }
+        return {
+            "message": f"{result.rowcount} snapshots taken for {day.isoformat()}",
+            "status": 200,
+            "taken": result.rowcount,
+        }
+
+    @classmethod
+    def get_series(cls, cert_id: int, start: str = None, end: str = None) -> dict:
+        """
+        Gets a Cert's progress for every day in a range from
+        its snapshots. Days without a snapshot carry the
+        counters of the snapshot before them, and days before
+        the first snapshot have none
+
+        Args:
+            cert_id (int): Cert ID
+            start (str): first day, 30 days before end by default
+            end (str): last day, today in UTC by default
+
+        Returns:
+            dict: Cert ID, range, and list of daily points, an
+                error message and status if the range is
+                invalid, or None if the Cert is not found
+        """
+        try:
+            end = parse_date(end) or utcnow().date()
+            start = parse_date(start) or end - timedelta(days=DEFAULT_DAYS - 1)
+        except ValueError:
+            return {
+                "message": "Invalid date",
+                "status": 400,
+            }
+        days = (end - start).days + 1
+        if not 0 < days <= MAX_DAYS:
+            return {
+                "message": f"Range must be between 1 and {MAX_DAYS} days",
+                "status": 400,
+            }
+        if not db.session.get(Cert, cert_id):
+            return None
+        # the latest snapshot before the range gives the starting counters
+        baseline = select(func.max(ProgressSnapshot.day)) \
+            .where(ProgressSnapshot.cert_id == cert_id, ProgressSnapshot.day < start) \
+            .scalar_subquery()
+        snapshots = ProgressSnapshot.query \
+            .filter(
+                ProgressSnapshot.cert_id == cert_id,
+                ProgressSnapshot.day <= end,
+                (ProgressSnapshot.day >= start) | (ProgressSnapshot.day == baseline)
+            ) \
+            .order_by(ProgressSnapshot.day) \
+            .all()
+        series = []
+        current = None
+        i = 0
+        for offset in range(days):
+            day = start + timedelta(days=offset)
+            while i < len(snapshots) and snapshots[i].day <= day:
+                current = snapshots[i]
+                i += 1
+            point = {"day": day}
+            point.update({
+                counter: getattr(current, counter) if current else None
+                for counter in COUNTERS
+            })
+            series.append(point)
+        return {
+            "cert_id": cert_id,
+            "start": start,
+            "end": end,
+            "series": series,
+        }
@@ -0,0 +1,182 @@
+"""
+Module defining the statistics rollups read by the
+statistics dashboard and the API
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import Date, case, cast, delete, func, insert, select, tuple_
+
+from src.db import db
+from src.models.cert import Cert
+from src.models.resource import Resource
+from src.models.stats import ResourceStats, WeeklyResourceStats
+
+
+def week_start(column: db.Column) -> db.Column:
+    """
+    Builds an expression for the UTC date of the Monday
+    starting the week of a timestamp column
+
+    Args:
+        column (db.Column): timestamp column
+
+    Returns:
+        db.Column: date expression
+    """
+    if db.session.get_bind().dialect.name == "postgresql":
+        return cast(func.date_trunc("week", func.timezone("UTC", column)), Date)
+    # step back to the Tuesday before and forward to the next Monday
+    return func.date(column, "-6 days", "weekday 1", type_=Date)
+
+
+def week_of(created: datetime) -> date:
+    """
+    Gets the UTC date of the Monday starting the week of
+    a timestamp, matching week_start
+
+    Args:
+        created (datetime): timestamp, naive timestamps are UTC
+
+    Returns:
+        date: Monday of the week
+    """
+    if created.tzinfo:
+        created = created.astimezone(timezone.utc)
+    day = created.date()
+    return day - timedelta(days=day.weekday())
+
+
+def percent(part: int, total: int) -> float:
+    """
+    Gets part as a percentage of total
+
+    Args:
+        part (int): part of the total
+        total (int): total
+
+    Returns:
+        float: percentage to one decimal place, 0 if total is 0
+    """
+    return round(100 * part / total, 1) if total else 0.0
+
+
+class StatsService:
+    """
+    Rollup tables of Resource totals by type and Resources
+    added per week for each Cert. The rows a Resource write
+    touches are recounted in the same transaction as the
+    write so the dashboard reads a handful of rows no matter
+    how many Resources and Sections exist
+    """
+
+    @classmethod
+    def refresh(cls, types: set, weeks: set = ()) -> None:
+        """
+        Recounts the given rollup rows from the Resources.
+        Runs in the caller's transaction without committing
+
+        Args:
+            types (set): (Cert ID, Resource type) pairs to recount
+            weeks (set): (Cert ID, Resource created time) pairs
+                whose weeks to recount
+        """
+        types = {
+            (int(cert_id), resource_type)
+            for cert_id, resource_type in types
+            if cert_id is not None
+        }
+        weeks = {
+            (int(cert_id), week_of(created))
+            for cert_id, created in weeks
+            if cert_id is not None and created is not None
+        }
+        if types:
+            db.session.execute(
+                delete(ResourceStats)
+                .where(tuple_(ResourceStats.cert_id, ResourceStats.resource_type).in_(types))
+            )
+            db.session.execute(insert(ResourceStats).from_select(
+                ["cert_id", "resource_type", "total", "complete"],
+                select(
+                    Resource.cert_id,
+                    Resource.resource_type,
+                    func.count(Resource.id),  # pylint: disable=not-callable
+                    func.sum(case((Resource.complete.is_(True), 1), else_=0)),
+                )
+                .where(tuple_(Resource.cert_id, Resource.resource_type).in_(types))
+                .group_by(Resource.cert_id, Resource.resource_type)
+            ))
+        if weeks:
+            db.session.execute(
+                delete(WeeklyResourceStats)
+                .where(tuple_(WeeklyResourceStats.cert_id, WeeklyResourceStats.week).in_(weeks))
+            )
+            week = week_start(Resource.created)
+            db.session.execute(insert(WeeklyResourceStats).from_select(
+                ["cert_id", "week", "added"],
+                select(Resource.cert_id, week, func.count(Resource.id))  # pylint: disable=not-callable
+                .where(tuple_(Resource.cert_id, week).in_(weeks))
+                .group_by(Resource.cert_id, week)
+            ))
+
+    @classmethod
+    def get(cls, cert_id: int = None) -> dict:
+        """
+        Gets the statistics of a Cert, or of every Cert if
+        no ID is given, from the progress counters and the
+        rollup tables
+
+        Args:
+            cert_id (int): Cert ID
+
+        Returns:
+            dict: section progress, Resource completion by type,
+                and Resources added per week, or None if the
+                Cert is not found
+        """
+        sections = select(
+            func.count(Cert.id),  # pylint: disable=not-callable
+            func.coalesce(func.sum(Cert.section_count), 0),
+            func.coalesce(func.sum(Cert.sections_complete), 0),
+            func.coalesce(func.sum(Cert.sections_cards_made), 0),
+        )
+        types = select(
+            ResourceStats.resource_type,
+            func.sum(ResourceStats.total),
+            func.sum(ResourceStats.complete),
+        ).group_by(ResourceStats.resource_type).order_by(ResourceStats.resource_type)
+        weeks = select(
+            WeeklyResourceStats.week,
+            func.sum(WeeklyResourceStats.added),
+        ).group_by(WeeklyResourceStats.week).order_by(WeeklyResourceStats.week)
+        if cert_id is not None:
+            sections = sections.where(Cert.id == cert_id)
+            types = types.where(ResourceStats.cert_id == cert_id)
+            weeks = weeks.where(WeeklyResourceStats.cert_id == cert_id)
+        certs, total, complete, cards_made = db.session.execute(sections).one()
+        if cert_id is not None and not certs:
+            return None
+        return {
+            "cert_id": cert_id,
+            "sections": {
+                "total": total,
+                "complete": complete,
+                "cards_made": cards_made,
+                "percent_complete": percent(complete, total),
+                "percent_cards_made": percent(cards_made, total),
+            },
+            "resource_types": [
+                {
+                    "resource_type": resource_type,
+                    "total": type_total,
+                    "complete": type_complete,
+                    "percent_complete": percent(type_complete, type_total),
+                }
+                for resource_type, type_total, type_complete in db.session.execute(types)
+            ],
+            "weeks": [
+                {"week": week, "added": added}
+                for week, added in db.session.execute(weeks)
+            ],
+        }
@@ -0,0 +1,90 @@
+"""
+Module defining the in-memory prefix index used to
+suggest cert names, codes, and tags as the user types
+"""
+
+import bisect
+import threading
+
+from src.models.cert import Cert
+from src.models.version import TableVersion
+
+DEFAULT_SUGGESTIONS = 10
+MAX_SUGGESTIONS = 50
+
+
+class SuggestIndex:
+    """
+    Sorted array of lowercase keys searched with bisect.
+    Every word position of a name, code, or tag is a key
+    so a prefix of any word matches. The array is rebuilt
+    when the certs table version changes
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.keys = []
+        self.entries = []
+        self.version = None
+
+    def build(self, version: int) -> None:
+        """
+        Rebuilds the array from every Cert in the database.
+        Must be called inside an app context
+
+        Args:
+            version (int): certs table version being indexed
+        """
+        pairs = []
+        for cert in Cert.query.all():
+            tags = [tag.strip() for tag in (cert.tags or "").split(",")]
+            labels = [(cert.name, "name", cert.id), (cert.code, "code", cert.id)]
+            labels += [(tag, "tag", None) for tag in tags if tag]
+            for text, kind, cert_id in labels:
+                words = text.lower().split()
+                for i in range(len(words)):
+                    key = " ".join(words[i:])
+                    pairs.append((key, i, text, kind, cert_id))
+        pairs.sort(key=lambda pair: pair[:3])
+        self.keys = [pair[0] for pair in pairs]
+        self.entries = [
+            {"text": text, "type": kind, "cert_id": cert_id}
+            for _, _, text, kind, cert_id in pairs
+        ]
+        self.version = version
+
+    def suggest(self, query: str, limit: int = DEFAULT_SUGGESTIONS) -> list:
+        """
+        Gets names, codes, and tags with a word starting with
+        the query in alphabetical order. Must be called inside
+        an app context
+
+        Args:
+            query (str): text typed so far
+            limit (int): maximum number of suggestions
+
+        Returns:
+            list: list of suggestion dicts with text, type, and
+                cert_id, which is None for tags
+        """
+        query = " ".join((query or "").lower().split())
+        if not query:
+            return []
+        version = TableVersion.get(("certs",))["certs"]
+        with self.lock:
+            if version != self.version:
+                self.build(version)
+            keys, entries = self.keys, self.entries
+        suggestions = []
+        seen = set()
+        i = bisect.bisect_left(keys, query)
+        while i < len(keys) and keys[i].startswith(query) and len(suggestions) < limit:
+            entry = entries[i]
+            if (entry["text"], entry["type"]) not in seen:
+                seen.add((entry["text"], entry["type"]))
+                suggestions.append(entry)
+            i += 1
+        return suggestions
+
+
+suggest_index = SuggestIndex()
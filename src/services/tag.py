@@ -0,0 +1,93 @@
+"""
+Module defining in-process Tag operations shared
+by the API and the Cert service
+"""
+
+from sqlalchemy import delete, func, insert, intersect, literal, select
+
+from src.db import db
+from src.models.tag import Tag, tag_association
+
+
+class TagService:
+    """
+    Tag operations returning plain data
+    """
+
+    @classmethod
+    def get_counts(cls) -> list:
+        """
+        Gets every tag in use with the number of Certs
+        that have it, most used first
+
+        Returns:
+            list: list of dicts with the tag name and count
+        """
+        count = func.count(tag_association.c.cert_id)  # pylint: disable=not-callable
+        rows = db.session.execute(
+            select(Tag.name, count)
+            .join(tag_association, tag_association.c.tag_id == Tag.id)
+            .group_by(Tag.name)
+            .order_by(count.desc(), Tag.name)
+        ).all()
+        return [{"name": name, "count": total} for name, total in rows]
+
+    @classmethod
+    def cert_ids(cls, names: list) -> select:
+        """
+        Builds a query for the IDs of Certs that have every
+        one of the given tags by intersecting the Cert IDs
+        found for each tag on the tag_id index
+
+        Args:
+            names (list): tag names parsed with Tag.parse
+
+        Returns:
+            select: compound select of Cert IDs
+        """
+        return intersect(*[
+            select(tag_association.c.cert_id)
+            .join(Tag, tag_association.c.tag_id == Tag.id)
+            .where(Tag.name == name)
+            for name in names
+        ])
+
+    @classmethod
+    def set_row_tags(cls, cert: dict) -> None:
+        """
+        Replaces the tags of a Cert from its updated row
+
+        Args:
+            cert (dict): Cert row data
+        """
+        cls.set_cert_tags(cert["id"], cert["tags"])
+
+    @classmethod
+    def set_cert_tags(cls, cert_id: int, tags: str) -> None:
+        """
+        Replaces the tags of a Cert with those in the comma
+        separated tag string, creating any new tags. Runs in
+        the caller's transaction without committing
+
+        Args:
+            cert_id (int): Cert ID
+            tags (str): comma separated tags
+        """
+        names = Tag.parse(tags)
+        db.session.execute(
+            delete(tag_association).where(tag_association.c.cert_id == cert_id)
+        )
+        if not names:
+            return
+        existing = db.session.execute(
+            select(Tag.name).where(Tag.name.in_(names))
+        ).scalars().all()
+        new = [{"name": name} for name in names if name not in existing]
+        if new:
+            db.session.execute(insert(Tag), new)
+        db.session.execute(
+            insert(tag_association).from_select(
+                ["cert_id", "tag_id"],
+                select(literal(cert_id), Tag.id).where(Tag.name.in_(names))
+            )
+        )
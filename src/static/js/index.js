@@ -21,12 +21,15 @@ function toggleDarkMode() {
 function displayAddContentButton(value) {
   const addBtn = document.getElementById("content-btn");
   const importBtn = document.getElementById("import-btn");
+  const bulkBtn = document.getElementById("bulk-btn");
   if (value != "statistics") {
     addBtn.classList.remove("hidden");
     importBtn.classList.remove("hidden");
+    bulkBtn.classList.remove("hidden");
   } else {
     addBtn.classList.add("hidden");
     importBtn.classList.add("hidden");
+    bulkBtn.classList.add("hidden");
   }
 }
 
@@ -36,8 +39,10 @@ function displayAddContentButton(value) {
 function hideAddContentButton() {
   const addBtn = document.getElementById("content-btn");
   const importBtn = document.getElementById("import-btn");
+  const bulkBtn = document.getElementById("bulk-btn");
   addBtn.classList.add("hidden");
   importBtn.classList.add("hidden");
+  bulkBtn.classList.add("hidden");
 }
 
 /**
@@ -147,6 +152,7 @@ function handleNav(el) {
   // hide any open forms
   hideResourceForm("resource-form");
   hideResourceForm("resource-import-form");
+  hideResourceForm("resource-bulk-form");
   // clear the radio buttons
   clearChecked();
   let id;
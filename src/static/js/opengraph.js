@@ -0,0 +1,117 @@
+// failed polls in a row before a lookup is given up
+const maxPollFailures = 5;
+
+const ogFields = {
+  "resource-title": "title",
+  "resource-image": "image",
+  "resource-description": "description",
+  "resource-site-name": "site_name",
+};
+
+/**
+ * Fills the resource form from a finished Open Graph lookup
+ *
+ * @param {HTMLFormElement} form
+ * @param {object} job
+ */
+function fillResourceForm(form, job) {
+  const status = document.getElementById("og-job-status");
+  status.classList.remove("hidden");
+  if (job.status === "failed") {
+    status.textContent = "No Open Graph data found";
+    return;
+  }
+  document.getElementById("resource-url").value = job.data.url || job.url;
+  for (const [id, key] of Object.entries(ogFields)) {
+    document.getElementById(id).value = job.data[key] || "";
+  }
+  const hasOgData = document.createElement("input");
+  hasOgData.type = "hidden";
+  hasOgData.name = "has_og_data";
+  hasOgData.value = "True";
+  form.prepend(hasOgData);
+  status.textContent = "Data pulled using the Open Graph protocol";
+}
+
+/**
+ * Polls an Open Graph lookup until it has finished, giving
+ * up after maxPollFailures failed polls in a row
+ *
+ * @param {HTMLFormElement} form
+ * @param {string} url
+ * @param {number} failures
+ */
+async function pollOpenGraph(form, url, failures = 0) {
+  let job = null;
+  try {
+    const response = await fetch(url);
+    job = await response.json();
+  } catch (e) {
+    if (form.dataset.ogJobUrl !== url) {
+      return;
+    }
+    if (failures + 1 >= maxPollFailures) {
+      fillResourceForm(form, { status: "failed" });
+      return;
+    }
+    setTimeout(() => pollOpenGraph(form, url, failures + 1), 2000);
+    return;
+  }
+  // stop if the URL has been changed or the job has expired
+  if (!job || form.dataset.ogJobUrl !== url) {
+    return;
+  }
+  if (job.status === "pending") {
+    setTimeout(() => pollOpenGraph(form, url), 1000);
+    return;
+  }
+  fillResourceForm(form, job);
+}
+
+/**
+ * Looks up the Open Graph data of the entered URL and
+ * fills the resource form without reloading the page
+ *
+ * @param {HTMLInputElement} input
+ */
+async function lookupOpenGraph(input) {
+  const form = input.form;
+  if (!input.value || input.value === form.dataset.ogLookedUp) {
+    return;
+  }
+  form.dataset.ogLookedUp = input.value;
+  form.querySelectorAll("input[name='has_og_data']").forEach((el) => el.remove());
+  const status = document.getElementById("og-job-status");
+  let job = null;
+  try {
+    const response = await fetch(form.dataset.ogLookupUrl, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ url: input.value }),
+    });
+    job = await response.json();
+  } catch (e) {
+    return;
+  }
+  // a cached lookup is finished straight away without a token
+  form.dataset.ogJobUrl = job.status_url || "";
+  if (job.status === "pending") {
+    status.textContent = "Fetching Open Graph data...";
+    status.classList.remove("hidden");
+    pollOpenGraph(form, job.status_url);
+    return;
+  }
+  if (job.status === "done" || job.status === "failed") {
+    fillResourceForm(form, job);
+    return;
+  }
+  // invalid URLs are left for the form validation to report
+  status.classList.add("hidden");
+}
+
+(function () {
+  const form = document.getElementById("resource-form");
+  if (form && form.dataset.ogJobUrl) {
+    pollOpenGraph(form, form.dataset.ogJobUrl);
+  }
+})();
@@ -88,10 +88,12 @@ function setDisplayedContent(id) {
 function setDisplayAddContentBtn(id) {
   const addBtn = document.getElementById("content-btn");
   const importBtn = document.getElementById("import-btn");
-  if (addBtn && importBtn) {
+  const bulkBtn = document.getElementById("bulk-btn");
+  if (addBtn && importBtn && bulkBtn) {
     if (id != "statistics") {
       addBtn.classList.remove("hidden");
       importBtn.classList.remove("hidden");
+      bulkBtn.classList.remove("hidden");
     }
   }
 }
@@ -170,8 +172,10 @@ function setResourceFormState() {
       // hide add content buttons
       const addBtn = document.getElementById("content-btn");
       const importBtn = document.getElementById("import-btn");
+      const bulkBtn = document.getElementById("bulk-btn");
       addBtn.classList.add("hidden");
       importBtn.classList.add("hidden");
+      bulkBtn.classList.add("hidden");
       // hide tab contents
       const courses = document.getElementById("courses");
       const videos = document.getElementById("videos");
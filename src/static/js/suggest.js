@@ -0,0 +1,31 @@
+(function () {
+  const searchInput = document.getElementById("search");
+  const suggestions = document.getElementById("search-suggestions");
+  if (searchInput && suggestions) {
+    let controller = null;
+    searchInput.addEventListener("input", async () => {
+      if (controller) {
+        controller.abort();
+      }
+      controller = new AbortController();
+      const query = encodeURIComponent(searchInput.value);
+      try {
+        const response = await fetch(
+          `${searchInput.dataset.suggestUrl}?q=${query}`,
+          { signal: controller.signal }
+        );
+        const data = await response.json();
+        suggestions.replaceChildren(
+          ...data.map((suggestion) => {
+            const option = document.createElement("option");
+            option.value = suggestion.text;
+            option.label = suggestion.type;
+            return option;
+          })
+        );
+      } catch (e) {
+        // superseded by a newer keystroke
+      }
+    });
+  }
+})();
@@ -13,7 +13,13 @@ from src import create_app
 from src.db import db
 from src.models.cert import Cert
 from src.models.resource import Resource
+from src.models.og_cache import OpenGraphCache
+from src.models.og_job import OpenGraphJob
 from src.models.section import Section
+from src.models.snapshot import ProgressSnapshot
+from src.models.stats import ResourceStats, WeeklyResourceStats
+from src.models.tag import Tag, tag_association
+from src.services.opengraph import OpenGraphService
 
 
 @pytest.fixture()
@@ -58,4 +64,12 @@ def clean_db(app: Flask):
         Cert.query.delete()
         Resource.query.delete()
         Section.query.delete()
+        ResourceStats.query.delete()
+        WeeklyResourceStats.query.delete()
+        ProgressSnapshot.query.delete()
+        OpenGraphCache.query.delete()
+        OpenGraphJob.query.delete()
+        OpenGraphService.lru.clear()
+        db.session.execute(tag_association.delete())
+        Tag.query.delete()
         db.session.commit()
@@ -179,6 +179,50 @@ class TestCerts:
             data["status"] == 200 and \
             section.title == "Test section"
 
+    def test_post_sections_bulk(self, app: Flask, client: FlaskClient) -> None:
+        """
+        Assert that a list of Section objects are created and saved
+        in the database in one request
+
+        Args:
+            app (Flask): Flask app instance
+            client (FlaskClient): Flask app test client
+        """
+        response = client.post(
+            f"{self.api_url}/section/bulk",
+            data=json.dumps([self.section_data_1, self.section_data_2]),
+            headers={"Content-Type": "application/json"},
+        )
+        data = response.json
+        with app.app_context():
+            sections = Section.query.order_by(Section.number).all()
+        assert \
+            data["message"] == "2 sections created successfully" and \
+            data["status"] == 200 and \
+            [s.title for s in sections] == ["Test section", "Test section 2"]
+
+    def test_post_sections_bulk_rejects_invalid_rows(self, app: Flask, client: FlaskClient) -> None:
+        """
+        Assert that no Section objects are created if any row is invalid
+
+        Args:
+            app (Flask): Flask app instance
+            client (FlaskClient): Flask app test client
+        """
+        del self.section_data_2["title"]
+        response = client.post(
+            f"{self.api_url}/section/bulk",
+            data=json.dumps([self.section_data_1, self.section_data_2]),
+            headers={"Content-Type": "application/json"},
+        )
+        data = response.json
+        with app.app_context():
+            sections = Section.query.all()
+        assert \
+            data["message"] == "Invalid section at index 1" and \
+            data["status"] == 400 and \
+            len(sections) == 0
+
     # ========== Test Read ==========
 
     def test_get_cert_returns_all_certs(self, client: FlaskClient) -> None:
@@ -241,6 +285,106 @@ class TestCerts:
         response = client.get("/api/v1/section")
         assert len(response.json) == 2
 
+    def test_get_cert_paginates_with_next_link(self, client: FlaskClient) -> None:
+        """
+        Asserts the API returns pages of Cert objects with a 'next'
+        link until the last page is reached
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        cert_data = [self.cert_data_1, self.cert_data_2]
+        for _, cert in enumerate(cert_data):
+            client.post(
+                f"{self.api_url}/cert",
+                data=json.dumps(cert),
+                headers={"Content-Type": "application/json"},
+            )
+        first_page = client.get("/api/v1/cert?limit=1")
+        next_url = first_page.headers["Link"].split(";")[0].strip("<>")
+        last_page = client.get(next_url)
+        assert \
+            [c["name"] for c in first_page.json] == ["Test"] and \
+            [c["name"] for c in last_page.json] == ["Test2"] and \
+            "Link" not in last_page.headers
+
+    def test_get_cert_returns_400_for_invalid_cursor(self, client: FlaskClient) -> None:
+        """
+        Asserts a 400 status is returned if the cursor is malformed
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        response = client.get("/api/v1/cert?after=not-a-cursor")
+        assert \
+            response.json["message"] == "Invalid cursor" and \
+            response.json["status"] == 400
+
+    def test_get_resource_filters_by_cert_id_and_type(self, client: FlaskClient) -> None:
+        """
+        Asserts the API only returns Resource objects matching the
+        cert_id and resource_type query parameters
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        self.resource_data_2["cert_id"] = 2
+        resource_data = [self.resource_data_1, self.resource_data_2]
+        for _, resource in enumerate(resource_data):
+            client.post(
+                f"{self.api_url}/resource",
+                data=json.dumps(resource),
+                headers={"Content-Type": "application/json"},
+            )
+        response = client.get("/api/v1/resource?cert_id=1&resource_type=course")
+        empty_response = client.get("/api/v1/resource?cert_id=1&resource_type=article")
+        assert \
+            len(response.json) == 1 and \
+            response.json[0]["title"] == "Test course" and \
+            len(empty_response.json) == 0
+
+    def test_get_resource_filters_by_complete(self, client: FlaskClient) -> None:
+        """
+        Asserts the API only returns Resource objects matching the
+        complete query parameter
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        self.resource_data_2["complete"] = True
+        resource_data = [self.resource_data_1, self.resource_data_2]
+        for _, resource in enumerate(resource_data):
+            client.post(
+                f"{self.api_url}/resource",
+                data=json.dumps(resource),
+                headers={"Content-Type": "application/json"},
+            )
+        response = client.get("/api/v1/resource?complete=true")
+        assert \
+            len(response.json) == 1 and \
+            response.json[0]["title"] == "Test article"
+
+    def test_get_section_filters_by_resource_id(self, client: FlaskClient) -> None:
+        """
+        Asserts the API only returns Section objects matching the
+        resource_id query parameter
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        self.section_data_2["resource_id"] = 2
+        section_data = [self.section_data_1, self.section_data_2]
+        for _, section in enumerate(section_data):
+            client.post(
+                f"{self.api_url}/section",
+                data=json.dumps(section),
+                headers={"Content-Type": "application/json"},
+            )
+        response = client.get("/api/v1/section?cert_id=1&resource_id=2")
+        assert \
+            len(response.json) == 1 and \
+            response.json[0]["title"] == "Test section 2"
+
     def test_get_cert_returns_cert_by_id(self, client: FlaskClient) -> None:
         """
         Asserts that the API gets and returns a Cert object
@@ -292,6 +436,88 @@ class TestCerts:
         response = client.get("/api/v1/section/1")
         assert response.json["title"] == "Test section"
 
+    def test_get_cert_bundle_groups_resources_and_sections(self, client: FlaskClient) -> None:
+        """
+        Asserts the API returns a Cert with its Resources grouped by type
+        and its Sections grouped by Resource ID in number order
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        client.post(
+            f"{self.api_url}/cert",
+            data=json.dumps(self.cert_data_1),
+            headers={"Content-Type": "application/json"},
+        )
+        resource_data = [self.resource_data_1, self.resource_data_2]
+        for _, resource in enumerate(resource_data):
+            client.post(
+                f"{self.api_url}/resource",
+                data=json.dumps(resource),
+                headers={"Content-Type": "application/json"},
+            )
+        # create sections out of order
+        section_data = [self.section_data_2, self.section_data_1]
+        for _, section in enumerate(section_data):
+            client.post(
+                f"{self.api_url}/section",
+                data=json.dumps(section),
+                headers={"Content-Type": "application/json"},
+            )
+        response = client.get("/api/v1/cert/1/bundle")
+        data = response.json
+        assert \
+            data["cert"]["name"] == "Test" and \
+            [r["title"] for r in data["resources"]["course"]] == ["Test course"] and \
+            [r["title"] for r in data["resources"]["article"]] == ["Test article"] and \
+            data["resources"]["video"] == [] and \
+            [s["number"] for s in data["sections"]["1"]] == [1, 2]
+
+    def test_get_cert_bundle_returns_none(self, client: FlaskClient) -> None:
+        """
+        Asserts the API returns null if the Cert does not exist
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        response = client.get("/api/v1/cert/1/bundle")
+        assert response.json is None
+
+    def test_get_all_certs_filters_by_exam_date_range(self, client: FlaskClient) -> None:
+        """
+        Asserts only Certs with an exam date in the range are returned
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        client.post("/api/v1/cert", json={**self.cert_data_1, "exam_date": "2024-11-30"})
+        client.post("/api/v1/cert", json={**self.cert_data_2, "exam_date": "2025-01-15"})
+        december = client.get("/api/v1/cert?exam_from=2024-12-01&exam_to=2024-12-31").json
+        winter = client.get("/api/v1/cert?exam_from=2024-11-30&exam_to=2025-01-15").json
+        later = client.get("/api/v1/cert?exam_from=2025-01-01").json
+        assert \
+            december == [] and \
+            [cert["name"] for cert in winter] == ["Test", "Test2"] and \
+            [cert["exam_date"] for cert in later] == ["2025-01-15"]
+
+    def test_get_all_resources_filters_by_updated_since(self, client: FlaskClient) -> None:
+        """
+        Asserts only Resources updated at or after the given time
+        are returned
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        client.post("/api/v1/resource", json=self.resource_data_1)
+        client.post("/api/v1/resource", json=self.resource_data_2)
+        client.patch("/api/v1/resource/2", json={"complete": True})
+        updated = client.get("/api/v1/resource/2").json["updated"]
+        recent = client.get("/api/v1/resource", query_string={"updated_since": updated}).json
+        future = client.get("/api/v1/resource?updated_since=2999-01-01T00:00:00Z").json
+        assert \
+            [resource["id"] for resource in recent] == [2] and \
+            future == []
+
     # ========== Test Update ==========
 
     def test_put_cert_updates_correctly(self, client: FlaskClient) -> None:
@@ -82,6 +82,65 @@ class TestCerts:
             result = Cert.find("test_tag")
         assert isinstance(result, list) and result[0].name == "Test"
 
+    def test_find_returns_every_cert_with_tag(self, app: Flask, client: FlaskClient) -> None:
+        """
+        Assert find() returns all certs sharing a tag, not just the first
+
+        Args:
+            app (Flask): Flask app instance
+            client (FlaskClient): Flask app test client
+        """
+        client.post("/create/cert", data=self.form_data)
+        self.form_data["name"] = "Another"
+        self.form_data["code"] = "ano-101"
+        client.post("/create/cert", data=self.form_data)
+        with app.app_context():
+            result = Cert.find("test_tag")
+        assert sorted(cert.name for cert in result) == ["Another", "Test"]
+
+    def test_find_ranks_best_match_first(self, app: Flask, client: FlaskClient) -> None:
+        """
+        Assert find() orders a cert matching on name and tags before
+        a cert only matching on tags
+
+        Args:
+            app (Flask): Flask app instance
+            client (FlaskClient): Flask app test client
+        """
+        client.post("/create/cert", data=self.form_data)
+        self.form_data["name"] = "Another"
+        self.form_data["code"] = "ano-101"
+        self.form_data["tags"] = "test"
+        client.post("/create/cert", data=self.form_data)
+        with app.app_context():
+            result = Cert.find("test")
+        assert [cert.name for cert in result] == ["Test", "Another"]
+
+    def test_find_matches_every_word(self, app: Flask, client: FlaskClient) -> None:
+        """
+        Assert find() only returns certs matching all words in the query
+
+        Args:
+            app (Flask): Flask app instance
+            client (FlaskClient): Flask app test client
+        """
+        client.post("/create/cert", data=self.form_data)
+        with app.app_context():
+            found = Cert.find("test tst")
+            missing = Cert.find("test missing")
+        assert len(found) == 1 and missing == []
+
+    def test_find_returns_empty_list_for_blank_query(self, app: Flask) -> None:
+        """
+        Assert find() returns an empty list when the query has no words
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            result = Cert.find(" - ")
+        assert result == []
+
     # ===== /create/cert =====
 
     def test_create_new_creates_object(self, app: Flask, client: FlaskClient) -> None:
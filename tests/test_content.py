@@ -6,6 +6,9 @@ Content operations test module
 
 import json
 import os
+import time
+
+from urllib.parse import parse_qs, urlsplit
 
 import requests
 
@@ -110,6 +113,22 @@ class TestCerts:
             response.status_code == 200 and \
             b"Create new cert" in response.data
 
+    def test_content_create_fails_unique_constraint_name_any_case(self, client: FlaskClient) -> None:
+        """
+        Assert Cert not created if the name matches an existing cert
+        name in a different case
+
+        Args:
+            client (FlaskClient): Flask app test client
+        """
+        client.post("/create/cert", data=self.cert_data)
+        self.cert_data["name"] = self.cert_data["name"].upper()
+        self.cert_data["code"] = "another-101"
+        response = client.post("/create/cert", data=self.cert_data)
+        assert \
+            response.status_code == 200 and \
+            b"Name must be unique" in response.data
+
     # ===== /update/cert/<int:cert_id> =====
 
     def test_update_cert(self, client: FlaskClient) -> None:
@@ -232,6 +251,22 @@ class TestCerts:
             response.status_code == 302 and \
             ("error", "URL must be unique") in flashes
 
+    def test_content_create_resource_fails_constraint_title_any_case(self, client: FlaskClient) -> None:
+        """
+        Assert creating a resource fails the unique constraint for a
+        title matching an existing title in a different case
+
+        Args:
+            client (FlaskClient): Flask app test client
+        """
+        client.post("/create/resource", data=self.resource_data)
+        self.resource_data["title"] = self.resource_data["title"].lower()
+        self.resource_data["url"] = "http://another.test"
+        client.post("/create/resource", data=self.resource_data)
+        with client.session_transaction() as session:
+            flashes = session.get("_flashes")
+        assert ("error", "Title must be unique") in flashes
+
     def test_content_create_resource_article_fails_constraint(self, client: FlaskClient) -> None:
         """
         Assert creating a Resource (article) resource fails the unique constraint
@@ -247,11 +282,33 @@ class TestCerts:
             flashes = session.get("_flashes")
         assert ("error", "Title must be unique") in flashes
 
+    def wait_for_og_job(self, client: FlaskClient, response) -> dict:
+        """
+        Polls the status of the Open Graph job a response
+        redirected to until it finishes
+
+        Args:
+            client (FlaskClient): Flask app test client
+            response (TestResponse): redirect to the cert page
+
+        Returns:
+            dict: job status
+        """
+        token = parse_qs(urlsplit(response.location).query)["og_job"][0]
+        job = None
+        for _ in range(100):
+            job = client.get(f"/api/v1/og/{token}").json
+            if job["status"] != "pending":
+                break
+            time.sleep(0.1)
+        return job
+
     def test_content_create_resource_pulls_og_data(self, client: FlaskClient) -> None:
         """
-        Assert Open Protocol metadata data is returned when the
-        ResourceForm is submitted with an Open Graph compliant
-        URL only 
+        Assert Open Protocol metadata data is scraped in the
+        background when the ResourceForm is submitted with an
+        Open Graph compliant URL only, and filled in straight away
+        from the cache for the next submission
 
             "title": "Cert Tracker",
             "image": "static/images/og_site_img.png",
@@ -263,12 +320,18 @@ class TestCerts:
             client (FlaskClient): Flask app test client
         """
         response = client.post("/create/resource", data=self.resource_data_og)
-        assert b"static/images/og_site_img.png" in response.data
+        job = self.wait_for_og_job(client, response)
+        cached = client.post("/create/resource", data=self.resource_data_og, follow_redirects=True)
+        assert \
+            response.status_code == 307 and \
+            job["status"] == "done" and \
+            job["data"]["image"].endswith("static/images/og_site_img.png") and \
+            b"static/images/og_site_img.png" in cached.data
 
     def test_content_create_resource_catches_httperror(self, client: FlaskClient) -> None:
         """
         Asserts a HTTPError is caught if a non Open Graph
-        compliant URL is provided. 
+        compliant URL is provided and the job fails. 
 
         **This test will use udemy.com since I know they block 
         crawlers but this may break tests in future if they 
@@ -279,7 +342,7 @@ class TestCerts:
         """
         self.resource_data_og["url"] = "https://www.udemy.com/course/70533-azure"
         response = client.post("/create/resource", data=self.resource_data_og)
-        assert response.status_code == 204
+        assert self.wait_for_og_job(client, response)["status"] == "failed"
 
     def test_content_create_resource_catches_valueerror(self, client: FlaskClient) -> None:
         """
@@ -297,12 +360,26 @@ class TestCerts:
         """
         Asserts a URLError is caught if the URL provided 
         cannot be correctly verified (in this test case I 
-        am passing HTTPS which is not configured)
+        am passing HTTPS which is not configured) and the
+        job fails
+
+        Args:
+            client (FlaskClient): Flask app test client
+        """
+        self.resource_data_og["url"] = "https://127.0.0.1:5000"
+        response = client.post("/create/resource", data=self.resource_data_og)
+        assert self.wait_for_og_job(client, response)["status"] == "failed"
+
+    def test_content_create_resource_skips_cached_failure(self, client: FlaskClient) -> None:
+        """
+        Asserts 204 is returned for a URL whose lookup failed
+        recently without queueing it again
 
         Args:
             client (FlaskClient): Flask app test client
         """
         self.resource_data_og["url"] = "https://127.0.0.1:5000"
+        self.wait_for_og_job(client, client.post("/create/resource", data=self.resource_data_og))
         response = client.post("/create/resource", data=self.resource_data_og)
         assert response.status_code == 204
 
@@ -511,10 +588,10 @@ class TestCerts:
 
     def test_content_update_cert_exam_date_formats_correctly(self, client: FlaskClient) -> None:
         """
-        Assert updating an exam date saves in the correct UK
-        format e.g. 
+        Assert updating an exam date from the date input saves
+        the date, returned by the API in ISO format e.g.
 
-        30th Nov 2024 -> 30/11/2024
+        30th Nov 2024 -> 2024-11-30
 
         Args:
             app (Flask): Flask app instance
@@ -533,7 +610,7 @@ class TestCerts:
         client.post("/update/cert/exam_date", data=data)
         response = requests.get(f"{API_URL}/cert/1", timeout=2)
         data = response.json()
-        assert data["exam_date"] == "30/11/2024"
+        assert data["exam_date"] == "2024-11-30"
 
     def test_content_update_cert_exam_date_empty_date(self, client: FlaskClient) -> None:
         """
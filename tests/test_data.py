@@ -7,7 +7,10 @@ import os
 
 import requests
 
+from flask import Flask
+
 from src.data.views import get_cert_resources, get_importable_resources
+from src.services.resource import ResourceService
 
 API_URL = f"http://127.0.0.1:5000/api/v{os.environ["API_VERSION"]}"
 
@@ -97,10 +100,13 @@ class TestData:
 
     # ===== get_cert_resources() =====
 
-    def test_get_cert_resources_returns_sections(self) -> None:
+    def test_get_cert_resources_returns_sections(self, app: Flask) -> None:
         """
         Assert get_cert_resources() returns list of 'section'
         type Resource objects
+
+        Args:
+            app (Flask): Flask app instance
         """
         requests.post(
             url=f"{API_URL}/section",
@@ -108,15 +114,19 @@ class TestData:
             headers={"Content-Type": "application/json"},
             timeout=2,
         )
-        result = get_cert_resources(self.cert, "section")
+        with app.app_context():
+            result = get_cert_resources(self.cert, "section")
         assert \
             len(result) == 1 and \
             result[0]["title"] == "Test section"
 
-    def test_get_cert_resources_returns_courses(self) -> None:
+    def test_get_cert_resources_returns_courses(self, app: Flask) -> None:
         """
         Assert get_cert_resources() returns list of 'course'
         type Resource objects
+
+        Args:
+            app (Flask): Flask app instance
         """
         requests.post(
             url=f"{API_URL}/resource",
@@ -124,15 +134,19 @@ class TestData:
             headers={"Content-Type": "application/json"},
             timeout=2,
         )
-        result = get_cert_resources(self.cert, "course")
+        with app.app_context():
+            result = get_cert_resources(self.cert, "course")
         assert \
             len(result) == 1 and \
             result[0]["title"] == "Test course"
 
-    def test_get_cert_resources_returns_videos(self) -> None:
+    def test_get_cert_resources_returns_videos(self, app: Flask) -> None:
         """
         Assert get_cert_resources() returns list of 'video'
         type Resource objects
+
+        Args:
+            app (Flask): Flask app instance
         """
         requests.post(
             url=f"{API_URL}/resource",
@@ -140,15 +154,19 @@ class TestData:
             headers={"Content-Type": "application/json"},
             timeout=2,
         )
-        result = get_cert_resources(self.cert, "video")
+        with app.app_context():
+            result = get_cert_resources(self.cert, "video")
         assert \
             len(result) == 1 and \
             result[0]["title"] == "Test video"
 
-    def test_get_cert_resources_returns_articles(self) -> None:
+    def test_get_cert_resources_returns_articles(self, app: Flask) -> None:
         """
         Assert get_cert_resources() returns list of 'article'
         type Resource objects
+
+        Args:
+            app (Flask): Flask app instance
         """
         requests.post(
             url=f"{API_URL}/resource",
@@ -156,15 +174,19 @@ class TestData:
             headers={"Content-Type": "application/json"},
             timeout=2,
         )
-        result = get_cert_resources(self.cert, "article")
+        with app.app_context():
+            result = get_cert_resources(self.cert, "article")
         assert \
             len(result) == 1 and \
             result[0]["title"] == "Test article"
 
-    def test_get_cert_resources_returns_documents(self) -> None:
+    def test_get_cert_resources_returns_documents(self, app: Flask) -> None:
         """
         Assert get_cert_resources() returns list of 'documentation'
         type Resource objects
+
+        Args:
+            app (Flask): Flask app instance
         """
         requests.post(
             url=f"{API_URL}/resource",
@@ -172,24 +194,32 @@ class TestData:
             headers={"Content-Type": "application/json"},
             timeout=2,
         )
-        result = get_cert_resources(self.cert, "documentation")
+        with app.app_context():
+            result = get_cert_resources(self.cert, "documentation")
         assert \
             len(result) == 1 and \
             result[0]["title"] == "Test document"
 
     # ===== get_importable_resources() =====
 
-    def test_get_importable_resources_returns_empty_list(self) -> None:
+    def test_get_importable_resources_returns_empty_list(self, app: Flask) -> None:
         """
         Assert that an empty list is returned if no resources exist
+
+        Args:
+            app (Flask): Flask app instance
         """
-        result = get_importable_resources(self.cert)
+        with app.app_context():
+            result = get_importable_resources(self.cert)
         assert len(result) == 0 and isinstance(result, list)
 
-    def test_get_importable_resources_returns_empty_list_id(self) -> None:
+    def test_get_importable_resources_returns_empty_list_id(self, app: Flask) -> None:
         """
         Assert that an empty list is returned if only resources with a 
         matching cert id exist
+
+        Args:
+            app (Flask): Flask app instance
         """
         requests.post(
             url=f"{API_URL}/resource",
@@ -197,12 +227,16 @@ class TestData:
             headers={"Content-Type": "application/json"},
             timeout=2,
         )
-        result = get_importable_resources(self.cert)
+        with app.app_context():
+            result = get_importable_resources(self.cert)
         assert len(result) == 0 and isinstance(result, list)
 
-    def test_get_importable_resources_returns_resources(self) -> None:
+    def test_get_importable_resources_returns_resources(self, app: Flask) -> None:
         """
         Assert that all resources with a non-matching cert id are returned
+
+        Args:
+            app (Flask): Flask app instance
         """
         requests.post(
             url=f"{API_URL}/resource",
@@ -218,8 +252,28 @@ class TestData:
             headers={"Content-Type": "application/json"},
             timeout=2,
         )
-        result = get_importable_resources(self.cert)
+        with app.app_context():
+            result = get_importable_resources(self.cert)
         assert \
             len(result) == 1 and \
             isinstance(result, list) and \
             result[0]["title"] == "Test video"
+
+    def test_get_importable_resources_skips_duplicate_titles(self, app: Flask) -> None:
+        """
+        Assert that only the first resource of each title on other
+        certs is returned, and titles on the cert are excluded
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            ResourceService.create_bulk([
+                self.document_data,
+                {**self.document_data, "cert_id": 2, "url": "http://test.test/document/2"},
+                {**self.video_data, "cert_id": 2},
+                {**self.video_data, "cert_id": 3, "url": "http://test.test/video/3"},
+                {**self.article_data, "cert_id": 3},
+            ])
+            result = get_importable_resources(self.cert)
+        assert [(r["id"], r["title"]) for r in result] == [(3, "Test video"), (5, "Test article")]
@@ -0,0 +1,155 @@
+"""
+API ETag test module
+"""
+
+# pylint: disable=duplicate-code, line-too-long
+
+import json
+
+from flask import Flask
+from flask.testing import FlaskClient
+from sqlalchemy import update
+
+from src.db import db
+from src.models.cert import Cert
+from src.models.version import TableVersion
+
+
+class TestETag:
+    """
+    Tests conditional API reads answered with 304 Not Modified
+    """
+
+    @classmethod
+    def setup_class(cls) -> None:
+        """
+        Setup class before all tests run
+        """
+        cls.api_url = "http://127.0.0.1:5000/api/v1"
+        cls.cert_data_1 = None
+        cls.resource_data_1 = None
+
+    def setup_method(self) -> None:
+        """
+        Setup class before all tests run
+        """
+        # create new cert from form
+        self.cert_data_1 = {
+            "name": "Test",
+            "code": "tst-101",
+            "date": "01/01/2000",
+            "head_img": "test/test.jpg",
+            "badge_img": "etest/BADGE_test.png",
+            "exam_date": "",
+            "complete": False,
+            "tags": "test",
+        }
+        # create a new resource on the cert
+        self.resource_data_1 = {
+            "cert_id": 1,
+            "resource_type": "course",
+            "url": "http://test.test",
+            "title": "Test course",
+            "image": "test/test.png",
+            "description": "This is a test course",
+            "site_logo": "test.svg",
+            "site_name": "Test",
+            "complete": False,
+            "has_og_data": False,
+        }
+
+    def test_get_cert_returns_304_if_not_modified(self, client: FlaskClient) -> None:
+        """
+        Asserts a 304 response is returned when the If-None-Match
+        header matches the current ETag
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        client.post(
+            f"{self.api_url}/cert",
+            data=json.dumps(self.cert_data_1),
+            headers={"Content-Type": "application/json"},
+        )
+        response = client.get("/api/v1/cert")
+        cached_response = client.get(
+            "/api/v1/cert",
+            headers={"If-None-Match": response.headers["ETag"]}
+        )
+        assert \
+            cached_response.status_code == 304 and \
+            cached_response.data == b"" and \
+            cached_response.headers["ETag"] == response.headers["ETag"]
+
+    def test_get_resource_etag_changes_after_write(self, client: FlaskClient) -> None:
+        """
+        Asserts the ETag changes and the full response is returned
+        after Resource objects are created, patched, and deleted
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        tags = [client.get("/api/v1/resource").headers["ETag"]]
+        client.post(
+            f"{self.api_url}/resource",
+            data=json.dumps(self.resource_data_1),
+            headers={"Content-Type": "application/json"},
+        )
+        tags.append(client.get("/api/v1/resource").headers["ETag"])
+        client.patch(
+            "/api/v1/resource/1",
+            data=json.dumps({"complete": True}),
+            headers={"Content-Type": "application/json"},
+        )
+        tags.append(client.get("/api/v1/resource").headers["ETag"])
+        client.delete("/api/v1/resource/1")
+        response = client.get(
+            "/api/v1/resource",
+            headers={"If-None-Match": tags[-1]}
+        )
+        tags.append(response.headers["ETag"])
+        assert \
+            response.status_code == 200 and \
+            response.json == [] and \
+            len(set(tags)) == 4
+
+    def test_table_versions_bump_once_per_commit(self, app: Flask, client: FlaskClient) -> None:
+        """
+        Asserts a transaction writing a table through a flush
+        and a statement bumps its version once, at commit
+
+        Args:
+            app (Flask): Flask app instance
+            client (FlaskClient): client returned by fixture
+        """
+        client.post("/api/v1/cert", json=self.cert_data_1)
+        with app.app_context():
+            before = TableVersion.get(("certs",))["certs"]
+            cert = db.session.get(Cert, 1)
+            cert.name = "Renamed"
+            db.session.flush()
+            db.session.execute(update(Cert).where(Cert.id == 1).values(code="tst-201"))
+            pending = TableVersion.get(("certs",))["certs"]
+            db.session.commit()
+            after = TableVersion.get(("certs",))["certs"]
+        assert \
+            pending == before and \
+            after == before + 1
+
+    def test_table_versions_unchanged_by_rollback(self, app: Flask, client: FlaskClient) -> None:
+        """
+        Asserts a rolled back write does not bump the version
+        of its table in a later commit
+
+        Args:
+            app (Flask): Flask app instance
+            client (FlaskClient): client returned by fixture
+        """
+        client.post("/api/v1/cert", json=self.cert_data_1)
+        with app.app_context():
+            before = TableVersion.get(("certs", "resources"))
+            db.session.execute(update(Cert).where(Cert.id == 1).values(name="Renamed"))
+            db.session.rollback()
+            db.session.commit()
+            after = TableVersion.get(("certs", "resources"))
+        assert after == before
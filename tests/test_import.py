@@ -0,0 +1,163 @@
+"""
+Resource import test module
+"""
+
+# pylint: disable=duplicate-code, line-too-long
+
+import json
+
+from flask import Flask
+from flask.testing import FlaskClient
+
+from src.models.resource import Resource
+
+
+class TestImport:
+    """
+    Tests copying Resources from one Cert onto another
+    """
+
+    @classmethod
+    def setup_class(cls) -> None:
+        """
+        Setup class before all tests run
+        """
+        cls.api_url = "http://127.0.0.1:5000/api/v1"
+        cls.resource_data_1 = None
+        cls.resource_data_2 = None
+
+    def setup_method(self) -> None:
+        """
+        Setup class before all tests run
+        """
+        self.resource_data_1 = {
+            "cert_id": 1,
+            "resource_type": "course",
+            "url": "http://test.test",
+            "title": "Test course",
+            "image": "test/test.png",
+            "description": "This is a test course",
+            "site_logo": "test.svg",
+            "site_name": "Test",
+            "complete": False,
+            "has_og_data": False,
+        }
+        self.resource_data_2 = {
+            "cert_id": 1,
+            "resource_type": "article",
+            "url": "http://test.test2",
+            "title": "Test article",
+            "image": "test2/test2.png",
+            "description": "This is a test article",
+            "site_logo": "test2.svg",
+            "site_name": "Test 2",
+            "complete": False,
+            "has_og_data": False,
+        }
+
+    def create(self, client: FlaskClient, certs: int, resources: list) -> None:
+        """
+        Creates Certs and Resources through the API
+
+        Args:
+            client (FlaskClient): Flask app test client
+            certs (int): number of Certs to create
+            resources (list): Resource data dicts
+        """
+        for i in range(1, certs + 1):
+            client.post(
+                f"{self.api_url}/cert",
+                data=json.dumps({
+                    "name": f"Test {i}",
+                    "code": f"tst-10{i}",
+                    "head_img": "test/test.jpg",
+                    "badge_img": "test/BADGE_test.png",
+                    "exam_date": "",
+                    "tags": "test",
+                }),
+                headers={"Content-Type": "application/json"},
+            )
+        for resource in resources:
+            client.post(
+                f"{self.api_url}/resource",
+                data=json.dumps(resource),
+                headers={"Content-Type": "application/json"},
+            )
+
+    def import_resources(self, client: FlaskClient, cert_id: int, resource_ids: list) -> dict:
+        """
+        Imports Resources onto a Cert through the API
+
+        Args:
+            client (FlaskClient): Flask app test client
+            cert_id (int): ID of the Cert to import into
+            resource_ids (list): IDs of the Resources to copy
+
+        Returns:
+            dict: API response data
+        """
+        return client.post(
+            f"{self.api_url}/resource/import",
+            data=json.dumps({"cert_id": cert_id, "resource_ids": resource_ids}),
+            headers={"Content-Type": "application/json"},
+        ).json
+
+    def test_import_resources_copies_and_skips_duplicates(self, app: Flask, client: FlaskClient) -> None:
+        """
+        Assert that Resource objects are copied onto another Cert and
+        that duplicates and missing IDs are reported
+
+        Args:
+            app (Flask): Flask app instance
+            client (FlaskClient): Flask app test client
+        """
+        # resource 3 duplicates resource 2 on cert 2
+        resource_data_3 = {**self.resource_data_2, "cert_id": 2}
+        self.create(client, 2, [self.resource_data_1, self.resource_data_2, resource_data_3])
+        data = self.import_resources(client, 2, [1, 2, 99])
+        with app.app_context():
+            resources = Resource.query.filter_by(cert_id=2).order_by(Resource.id).all()
+        assert \
+            data["status"] == 200 and \
+            data["imported"] == 1 and \
+            data["skipped"] == [2] and \
+            data["not_found"] == [99] and \
+            [r.title for r in resources] == ["Test article", "Test course"]
+
+    def test_import_resources_ignores_skipped_resources(self, app: Flask, client: FlaskClient) -> None:
+        """
+        Assert that a Resource is not skipped because of an
+        earlier Resource in the selection that was itself skipped
+
+        Args:
+            app (Flask): Flask app instance
+            client (FlaskClient): Flask app test client
+        """
+        # resource 1 is skipped by the title of resource 3, and shares its URL with resource 2
+        resource_data_2 = {**self.resource_data_2, "url": self.resource_data_1["url"]}
+        resource_data_3 = {**self.resource_data_1, "cert_id": 2, "url": "http://test.test3"}
+        self.create(client, 2, [self.resource_data_1, resource_data_2, resource_data_3])
+        data = self.import_resources(client, 2, [1, 2])
+        with app.app_context():
+            titles = [r.title for r in Resource.query.filter_by(cert_id=2).order_by(Resource.id)]
+        assert \
+            data["imported"] == 1 and \
+            data["skipped"] == [1] and \
+            titles == ["Test course", "Test article"]
+
+    def test_import_resources_returns_404_for_missing_cert(self, app: Flask, client: FlaskClient) -> None:
+        """
+        Assert that importing onto a Cert that does not exist
+        returns 404 without creating anything
+
+        Args:
+            app (Flask): Flask app instance
+            client (FlaskClient): Flask app test client
+        """
+        self.create(client, 1, [self.resource_data_1])
+        data = self.import_resources(client, 99, [1])
+        with app.app_context():
+            count = Resource.query.count()
+        assert \
+            data == {"message": "Cert not found", "status": 404} and \
+            count == 1
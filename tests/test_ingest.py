@@ -0,0 +1,352 @@
+"""
+Bulk Resource ingestion test module
+"""
+
+# pylint: disable=duplicate-code, line-too-long
+
+import io
+import threading
+import time
+
+from urllib.parse import urlsplit
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from flask import Flask
+from flask.testing import FlaskClient
+
+from src.models.resource import Resource
+from src.services import ingest
+from src.services.cert import CertService
+from src.services.ingest import PER_HOST, IngestService, parse_urls
+from src.services.opengraph import OpenGraphService
+
+BOOKMARKS = """<!DOCTYPE NETSCAPE-Bookmark-file-1>
+<META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=UTF-8">
+<TITLE>Bookmarks</TITLE>
+<H1>Bookmarks</H1>
+<DL><p>
+    <DT><H3>Study</H3>
+    <DL><p>
+        <DT><A HREF="{base}/page/1" ADD_DATE="1700000000">Page One</A>
+        <DT><A HREF="{base}/missing" ADD_DATE="1700000000">Saved &amp; Missing</A>
+    </DL><p>
+</DL><p>"""
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Serves pages with Open Graph tags standing in for
+    remote sites, recording the most requests served at
+    the same time
+    """
+
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """
+        Writes a page titled with the requested path
+        """
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        try:
+            if self.path.startswith("/slow/"):
+                time.sleep(0.1)
+            if self.path.startswith("/stall/"):
+                time.sleep(0.5)
+            if not self.path.startswith(("/page/", "/slow/", "/stall/")):
+                self.send_error(404)
+                return
+            body = f"""<html><head>
+                <meta property="og:title" content="Page {self.path}">
+                <meta property="og:description" content="About {self.path}">
+                <meta property="og:site_name" content="Stand-in">
+                <meta property="og:image" content="/cover.png">
+            </head><body></body></html>""".encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def log_message(self, format: str, *args) -> None:  # pylint: disable=redefined-builtin
+        """
+        Silences the request log
+        """
+
+
+class TestIngest:
+    """
+    Tests creating Resources in bulk from URLs fetched
+    from a local stand-in server
+    """
+
+    @classmethod
+    def setup_class(cls) -> None:
+        """
+        Setup class before all tests run
+        """
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        """
+        Teardown class after all tests run
+        """
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setup_method(self) -> None:
+        """
+        Setup class before all tests run
+        """
+        StandInHandler.max_active = 0
+
+    def create_cert(self, app: Flask) -> None:
+        """
+        Creates the Cert the Resources are added to
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            CertService.create({
+                "name": "Test",
+                "code": "tst-101",
+                "head_img": "test/test.jpg",
+                "badge_img": "test/BADGE_test.png",
+                "exam_date": "",
+                "tags": "test",
+            })
+
+    def test_parse_urls_reads_plain_urls(self) -> None:
+        """
+        Asserts URLs separated by whitespace are read
+        """
+        assert parse_urls("https://a.example.com\n  https://b.example.com https://c.example.com\n") == [
+            {"url": "https://a.example.com", "title": None},
+            {"url": "https://b.example.com", "title": None},
+            {"url": "https://c.example.com", "title": None},
+        ]
+
+    def test_parse_urls_reads_bookmarks_export(self) -> None:
+        """
+        Asserts links and titles are read from a bookmark file
+        """
+        assert parse_urls(BOOKMARKS.format(base="https://example.com")) == [
+            {"url": "https://example.com/page/1", "title": "Page One"},
+            {"url": "https://example.com/missing", "title": "Saved & Missing"},
+        ]
+
+    def test_ingest_creates_resources_with_metadata(self, app: Flask) -> None:
+        """
+        Asserts every new URL is added with its metadata, or
+        its bookmark title when the page has none, and that
+        invalid and duplicate URLs are reported
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        self.create_cert(app)
+        links = parse_urls(BOOKMARKS.format(base=self.base_url)) + [
+            {"url": f"{self.base_url}/page/1#intro", "title": None},
+            {"url": "not_a_url", "title": None},
+        ]
+        with app.app_context():
+            data = IngestService.ingest(app, 1, "article", links)
+            resources = Resource.query.order_by(Resource.id).all()
+        assert \
+            data["status"] == 200 and \
+            [r["status"] for r in data["results"]] == ["created", "created", "duplicate", "invalid"] and \
+            (data["created"], data["duplicate"], data["invalid"], data["failed"]) == (2, 1, 1, 0) and \
+            resources[0].title == "Page /page/1" and \
+            resources[0].image == f"{self.base_url}/cover.png" and \
+            resources[0].has_og_data and \
+            resources[1].title == "Saved & Missing" and \
+            resources[1].site_name == "127.0.0.1" and \
+            resources[1].image == "default_image.jpg" and \
+            not resources[1].has_og_data
+
+    def test_ingest_skips_urls_already_on_cert(self, app: Flask) -> None:
+        """
+        Asserts URLs and titles already on the Cert are skipped
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        self.create_cert(app)
+        with app.app_context():
+            IngestService.ingest(app, 1, "video", [f"{self.base_url}/page/1"])
+            data = IngestService.ingest(app, 1, "video", [
+                f"{self.base_url}/page/1",
+                f"{self.base_url}/page/1?utm_source=feed",
+                f"{self.base_url}/page/2",
+            ])
+            count = Resource.query.count()
+        assert \
+            [r["status"] for r in data["results"]] == ["duplicate", "duplicate", "created"] and \
+            count == 2
+
+    def test_ingest_limits_requests_per_host(self, app: Flask) -> None:
+        """
+        Asserts pages on one host are never fetched more than
+        PER_HOST at a time
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        self.create_cert(app)
+        with app.app_context():
+            data = IngestService.ingest(app, 1, "documentation", [
+                f"{self.base_url}/slow/{i}" for i in range(6)
+            ])
+        assert \
+            data["created"] == 6 and \
+            StandInHandler.max_active <= PER_HOST
+
+    def test_fetch_all_limits_requests_per_host_across_requests(self, app: Flask) -> None:
+        """
+        Asserts concurrent requests for pages on one host share
+        its limit of PER_HOST requests at a time
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        results = []
+
+        def fetch(name: str) -> None:
+            results.append(ingest.fetch_all(app, [f"{self.base_url}/slow/{name}{i}" for i in range(4)]))
+
+        threads = [threading.Thread(target=fetch, args=(name,)) for name in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert \
+            [len(result) for result in results] == [4, 4] and \
+            StandInHandler.max_active <= PER_HOST
+
+    def test_ingest_fails_only_urls_whose_lookup_raises(self, app: Flask, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Asserts an error looking up one host marks only its URL
+        as failed while the URLs of other hosts are created
+
+        Args:
+            app (Flask): Flask app instance
+            monkeypatch (pytest.MonkeyPatch): patches the lookup
+        """
+        lookup = OpenGraphService.lookup
+
+        def broken_lookup(url: str) -> dict:
+            if urlsplit(url).hostname == "bad.invalid":
+                raise RuntimeError("lookup failed")
+            return lookup(url)
+
+        monkeypatch.setattr(OpenGraphService, "lookup", broken_lookup)
+        self.create_cert(app)
+        with app.app_context():
+            data = IngestService.ingest(app, 1, "article", [
+                f"{self.base_url}/page/1",
+                "https://bad.invalid/page",
+                f"{self.base_url}/page/2",
+            ])
+            count = Resource.query.count()
+        assert \
+            data["status"] == 200 and \
+            [r["status"] for r in data["results"]] == ["created", "failed", "created"] and \
+            count == 2
+
+    def test_ingest_fails_urls_past_deadline(self, app: Flask, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Asserts the request returns at the deadline, creating
+        the pages fetched in time and failing the rest
+
+        Args:
+            app (Flask): Flask app instance
+            monkeypatch (pytest.MonkeyPatch): shortens the deadline
+        """
+        monkeypatch.setattr(ingest, "DEADLINE", 0.25)
+        self.create_cert(app)
+        start = time.monotonic()
+        with app.app_context():
+            data = IngestService.ingest(app, 1, "article", [
+                f"{self.base_url}/page/1",
+                f"{self.base_url}/stall/1",
+            ])
+        elapsed = time.monotonic() - start
+        # let the stalled lookup finish before the next test cleans the database
+        time.sleep(0.5)
+        assert \
+            [r["status"] for r in data["results"]] == ["created", "failed"] and \
+            elapsed < 0.5
+
+    def test_ingest_rejects_invalid_requests(self, app: Flask) -> None:
+        """
+        Asserts a missing Cert, an unknown resource type, and
+        an empty list are rejected
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        self.create_cert(app)
+        with app.app_context():
+            missing = IngestService.ingest(app, 2, "video", ["https://example.com"])
+            bad_type = IngestService.ingest(app, 1, "podcast", ["https://example.com"])
+            empty = IngestService.ingest(app, 1, "video", [])
+            no_title = IngestService.ingest(app, 1, "video", [{"url": "https://example.com"}])
+            no_url = IngestService.ingest(app, 1, "video", [{"title": "Example"}])
+            not_list = IngestService.ingest(app, 1, "video", "https://example.com")
+        assert \
+            missing["status"] == 404 and \
+            bad_type["status"] == 400 and \
+            empty["status"] == 400 and \
+            no_title == no_url == not_list == {"message": "Invalid cert ID or URL list", "status": 400}
+
+    def test_bulk_api_creates_resources(self, app: Flask, client: FlaskClient) -> None:
+        """
+        Asserts the API creates Resources from pasted text
+
+        Args:
+            app (Flask): Flask app instance
+            client (FlaskClient): Flask app test client
+        """
+        self.create_cert(app)
+        response = client.post("/api/v1/resource/bulk", json={
+            "cert_id": 1,
+            "resource_type": "article",
+            "text": f"{self.base_url}/page/1\n{self.base_url}/page/2",
+        })
+        assert \
+            response.json["status"] == 200 and \
+            response.json["created"] == 2
+
+    def test_bulk_form_accepts_bookmarks_upload(self, app: Flask, client: FlaskClient) -> None:
+        """
+        Asserts the form creates Resources from pasted URLs
+        and an uploaded bookmark file and flashes the results
+
+        Args:
+            app (Flask): Flask app instance
+            client (FlaskClient): Flask app test client
+        """
+        self.create_cert(app)
+        response = client.post("/create/resource/bulk", data={
+            "cert_id": 1,
+            "resource_type": "video",
+            "urls": f"{self.base_url}/page/3",
+            "bookmarks": (io.BytesIO(BOOKMARKS.format(base=self.base_url).encode("utf-8")), "bookmarks.html"),
+        }, content_type="multipart/form-data", follow_redirects=True)
+        assert \
+            response.status_code == 200 and \
+            b"3 resources created, 0 skipped as duplicates, 0 invalid, 0 failed" in response.data
@@ -0,0 +1,172 @@
+"""
+Streaming metadata extractor test module
+"""
+
+# pylint: disable=duplicate-code, line-too-long
+
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.request import urlopen
+
+from src.services.metadata import CHUNK_SIZE, fetch_metadata, read_head
+
+OG_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Ignored Title</title>
+    <meta property="og:title" content="Networking &amp; Security">
+    <meta property="og:image" content="/images/cover.png">
+    <meta property="og:image" content="/images/alternative.png">
+    <meta property="og:description" content="Study guide">
+    <meta property="og:site_name" content="Docs">
+    <meta name="description" content="Ignored description">
+</head>
+<body><p>Course</p></body>
+</html>"""
+
+FALLBACK_PAGE = """<html>
+<head>
+    <meta charset="utf-8">
+    <title> Plain Title </title>
+    <meta name="description" content="Plain description">
+    <meta name="twitter:image" content="https://cdn.example.com/card.png">
+</head>
+<body></body>
+</html>"""
+
+# a large body that must never be downloaded
+LARGE_PAGE = OG_PAGE.replace("<body>", "<body>" + "<p>filler</p>" * 100000)
+# a head that never ends so only the byte cap stops the read
+ENDLESS_HEAD = "<html><head><title>Endless</title>" + "<!-- filler -->" * 100000
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Serves fixed pages standing in for remote sites
+    """
+
+    pages = {
+        "/og": ("text/html; charset=utf-8", OG_PAGE),
+        "/fallback": ("text/html", FALLBACK_PAGE),
+        "/large": ("text/html; charset=utf-8", LARGE_PAGE),
+        "/endless": ("text/html; charset=utf-8", ENDLESS_HEAD),
+        "/json": ("application/json", '{"title": "Not HTML"}'),
+    }
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """
+        Writes the page at the requested path
+        """
+        if self.path == "/bad-status":
+            self.wfile.write(b"NOT HTTP\r\n\r\n")
+            return
+        if self.path not in self.pages:
+            self.send_error(404)
+            return
+        content_type, body = self.pages[self.path]
+        body = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # the extractor closes the connection once the head is read
+            pass
+
+    def log_message(self, format: str, *args) -> None:  # pylint: disable=redefined-builtin
+        """
+        Silences the request log
+        """
+
+
+class TestMetadata:
+    """
+    Tests the head only metadata extractor against a
+    local stand-in server
+    """
+
+    @classmethod
+    def setup_class(cls) -> None:
+        """
+        Setup class before all tests run
+        """
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        """
+        Teardown class after all tests run
+        """
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_fetch_metadata_reads_og_tags(self) -> None:
+        """
+        Asserts Open Graph tags are read, with the first
+        repeated tag kept and links made absolute
+        """
+        data = fetch_metadata(f"{self.base_url}/og")
+        assert data == {
+            "title": "Networking & Security",
+            "image": f"{self.base_url}/images/cover.png",
+            "description": "Study guide",
+            "site_name": "Docs",
+        }
+
+    def test_fetch_metadata_falls_back_to_standard_tags(self) -> None:
+        """
+        Asserts the title, description, and Twitter card fill
+        in for missing Open Graph tags
+        """
+        data = fetch_metadata(f"{self.base_url}/fallback")
+        assert data == {
+            "title": "Plain Title",
+            "image": "https://cdn.example.com/card.png",
+            "description": "Plain description",
+        }
+
+    def test_read_head_stops_at_end_of_head(self) -> None:
+        """
+        Asserts the body of a large page is not read
+        """
+        with urlopen(f"{self.base_url}/large") as response:
+            parser = read_head(response)
+        assert \
+            parser.done and \
+            parser.og["title"] == "Networking & Security" and \
+            parser.bytes_read <= CHUNK_SIZE < len(LARGE_PAGE)
+
+    def test_read_head_stops_at_byte_cap(self) -> None:
+        """
+        Asserts reading stops at the byte cap when the head
+        never ends
+        """
+        with urlopen(f"{self.base_url}/endless") as response:
+            parser = read_head(response, max_bytes=4 * CHUNK_SIZE)
+        assert \
+            not parser.done and \
+            parser.title == "Endless" and \
+            parser.bytes_read == 4 * CHUNK_SIZE
+
+    def test_fetch_metadata_ignores_non_html(self) -> None:
+        """
+        Asserts None is returned for a response that is not HTML
+        """
+        assert fetch_metadata(f"{self.base_url}/json") is None
+
+    def test_fetch_metadata_handles_missing_page(self) -> None:
+        """
+        Asserts None is returned for a HTTP error
+        """
+        assert fetch_metadata(f"{self.base_url}/missing") is None
+
+    def test_fetch_metadata_handles_bad_status_line(self) -> None:
+        """
+        Asserts None is returned for a response that is not HTTP
+        """
+        assert fetch_metadata(f"{self.base_url}/bad-status") is None
@@ -0,0 +1,120 @@
+"""
+Database migration test module
+"""
+
+# pylint: disable=line-too-long
+
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config as AlembicConfig
+from alembic.script import ScriptDirectory
+from flask import Flask
+from sqlalchemy import inspect, text
+
+from src.db import ALEMBIC_INI, db, migrate
+
+
+class TestMigrations:
+    """
+    Tests the Alembic migrations applied when the app starts
+    """
+
+    @classmethod
+    def setup_class(cls) -> None:
+        """
+        Setup class before all tests run
+        """
+        cls.config = AlembicConfig(ALEMBIC_INI)
+        cls.head = ScriptDirectory.from_config(cls.config).get_current_head()
+
+    def test_app_database_at_head(self, app: Flask) -> None:
+        """
+        Test the app database is upgraded to the latest revision
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            revision = db.session.execute(
+                text("SELECT version_num FROM alembic_version")
+            ).scalar()
+        assert revision == self.head
+
+    def test_lookup_indexes_created(self, app: Flask) -> None:
+        """
+        Test the foreign key lookup indexes exist
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            inspector = inspect(db.engine)
+            resources = {
+                index["name"]: index["column_names"]
+                for index in inspector.get_indexes("resources")
+            }
+            sections = {
+                index["name"]: index["column_names"]
+                for index in inspector.get_indexes("sections")
+            }
+        assert \
+            resources["ix_resources_cert_id_resource_type"] == ["cert_id", "resource_type"]
+        assert \
+            sections["ix_sections_cert_id_resource_id_number"] == ["cert_id", "resource_id", "number"]
+        assert \
+            sections["ix_sections_resource_id_number"] == ["resource_id", "number"]
+
+    def test_pre_migration_database_upgraded_in_place(self, tmp_path: Path) -> None:
+        """
+        Test a database created before migrations existed is
+        stamped with the baseline and upgraded keeping its rows,
+        splitting its tag strings into tags, converting its date
+        strings to date columns, and rolling up its resources
+
+        Args:
+            tmp_path (Path): temporary directory
+        """
+        legacy = Flask(__name__)
+        legacy.config["SQLALCHEMY_DATABASE_URI"] = \
+            f"sqlite:///{tmp_path / 'legacy.db'}"
+        db.init_app(legacy)
+        with legacy.app_context():
+            with db.engine.begin() as connection:
+                self.config.attributes["connection"] = connection
+                command.upgrade(self.config, "0001")
+                connection.execute(text("DROP TABLE alembic_version"))
+                connection.execute(text(
+                    "INSERT INTO certs (name, code, head_img, badge_img, exam_date, tags, created) "
+                    "VALUES ('Test', 'tst-101', 'test.jpg', 'test.png', '30/11/2024', 'AWS, cloud,aws', '01/02/2024')"
+                ))
+                connection.execute(text(
+                    "INSERT INTO resources (cert_id, resource_type, url, title, image, description, "
+                    "site_logo, site_name, complete, created) VALUES "
+                    "(1, 'video', 'http://a.test', 'A', 'a.jpg', '', 'a.svg', 'A', 1, '01/03/2024:12:00:00'), "
+                    "(1, 'video', 'http://b.test', 'B', 'b.jpg', '', 'b.svg', 'B', 0, '01/07/2024:12:00:00')"
+                ))
+            migrate()
+            names = inspect(db.engine).get_table_names()
+            certs = db.session.execute(text("SELECT name FROM certs")).scalars().all()
+            dates = db.session.execute(text("SELECT exam_date, created FROM certs")).one()
+            tags = db.session.execute(text(
+                "SELECT tags.name FROM tags JOIN tag_association "
+                "ON tags.id = tag_association.tag_id ORDER BY tags.name"
+            )).scalars().all()
+            types = db.session.execute(text(
+                "SELECT cert_id, resource_type, total, complete FROM resource_stats"
+            )).all()
+            weeks = db.session.execute(text(
+                "SELECT cert_id, week, added FROM weekly_resource_stats"
+            )).all()
+            revision = db.session.execute(
+                text("SELECT version_num FROM alembic_version")
+            ).scalar()
+        assert "table_versions" in names
+        assert certs == ["Test"]
+        assert dates[0] == "2024-11-30" and dates[1].startswith("2024-02-01")
+        assert tags == ["aws", "cloud"]
+        assert types == [(1, "video", 2, 1)]
+        assert weeks == [(1, "2024-01-01", 2)]
+        assert revision == self.head
@@ -0,0 +1,278 @@
+"""
+Open Graph lookup cache test module
+"""
+
+# pylint: disable=duplicate-code, line-too-long
+
+import json
+
+from datetime import timedelta
+
+import pytest
+
+from flask import Flask
+from flask.testing import FlaskClient
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.db import db
+from src.models.og_cache import OpenGraphCache
+from src.models.og_job import OpenGraphJob
+from src.services.cert import CertService
+from src.services.dates import utcnow
+from src.services.opengraph import FAILURE_TTL, LRUCache, OpenGraphService, canonical_url
+from src.services.scraper import scrape_queue
+
+
+class TestOpenGraph:
+    """
+    Tests the in-process and database caches in front
+    of Open Graph scraping
+    """
+
+    @classmethod
+    def setup_class(cls) -> None:
+        """
+        Setup class before all tests run
+        """
+        cls.og_data = None
+
+    def setup_method(self) -> None:
+        """
+        Setup class before all tests run
+        """
+        self.og_data = {
+            "title": "Cached Course",
+            "image": "https://og.invalid/cached.png",
+            "description": "Served from the cache",
+            "site_name": "Cached",
+            "url": "https://og.invalid/course",
+        }
+
+    def test_canonical_url_normalises_equivalent_links(self) -> None:
+        """
+        Asserts links to the same page share a canonical URL
+        """
+        assert \
+            canonical_url("HTTPS://Docs.Example.com:443?b=2&a=1&utm_source=x#intro") == "https://docs.example.com/?a=1&b=2" and \
+            canonical_url("http://example.com:8080/path") == "http://example.com:8080/path"
+
+    def test_canonical_url_rejects_relative_urls(self) -> None:
+        """
+        Asserts a ValueError is raised for a URL without a scheme
+        """
+        try:
+            canonical_url("this_is_not_a_valid_url_type")
+        except ValueError:
+            return
+        assert False
+
+    def test_lookup_serves_stored_entry(self, app: Flask) -> None:
+        """
+        Asserts a live database entry is returned without
+        scraping the page
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            db.session.add(OpenGraphCache(
+                url="https://og.invalid/course",
+                data=json.dumps(self.og_data),
+                expires=utcnow() + timedelta(days=1),
+            ))
+            db.session.commit()
+            data = OpenGraphService.lookup("https://OG.invalid/course#reviews")
+        assert data == self.og_data
+
+    def test_lookup_caches_failures(self, app: Flask) -> None:
+        """
+        Asserts a failed lookup is stored without data for
+        the failure TTL
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            data = OpenGraphService.lookup("http://127.0.0.1:9/missing")
+            row = db.session.get(OpenGraphCache, "http://127.0.0.1:9/missing")
+            expires = row.expires.replace(tzinfo=None)
+        now = utcnow().replace(tzinfo=None)
+        assert \
+            data is None and \
+            row.data is None and \
+            now < expires <= now + FAILURE_TTL
+
+    def test_lookup_refetches_expired_entry(self, app: Flask) -> None:
+        """
+        Asserts an expired entry is replaced by scraping the page
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            db.session.add(OpenGraphCache(
+                url="http://127.0.0.1:5000/",
+                data=json.dumps(self.og_data),
+                expires=utcnow() - timedelta(seconds=1),
+            ))
+            db.session.commit()
+            data = OpenGraphService.lookup("http://127.0.0.1:5000")
+        assert data["image"].endswith("static/images/og_site_img.png")
+
+    def test_lru_evicts_least_recently_used(self) -> None:
+        """
+        Asserts the oldest unused entry is evicted when full
+        """
+        cache = LRUCache(2)
+        expires = utcnow() + timedelta(minutes=1)
+        cache.put("a", {"n": 1}, expires)
+        cache.put("b", {"n": 2}, expires)
+        cache.get("a")
+        cache.put("c", {"n": 3}, expires)
+        assert \
+            cache.get("a") == (True, {"n": 1}) and \
+            cache.get("b") == (False, None) and \
+            cache.get("c") == (True, {"n": 3})
+
+    def test_create_resource_uses_cached_og_data(self, app: Flask, client: FlaskClient) -> None:
+        """
+        Asserts the resource form is filled from the cache
+
+        Args:
+            app (Flask): Flask app instance
+            client (FlaskClient): Flask app test client
+        """
+        with app.app_context():
+            CertService.create({
+                "name": "Test",
+                "code": "tst-101",
+                "head_img": "test/test.jpg",
+                "badge_img": "test/BADGE_test.png",
+                "exam_date": "",
+                "tags": "test",
+            })
+            db.session.add(OpenGraphCache(
+                url="https://og.invalid/course",
+                data=json.dumps(self.og_data),
+                expires=utcnow() + timedelta(days=1),
+            ))
+            db.session.commit()
+        response = client.post("/create/resource", data={
+            "cert_id": 1,
+            "resource_type": "course",
+            "url": "https://og.invalid/course?utm_source=newsletter",
+        }, follow_redirects=True)
+        assert b"https://og.invalid/cached.png" in response.data
+
+    def test_og_job_api_returns_none_for_unknown_token(self, client: FlaskClient) -> None:
+        """
+        Asserts the API returns null for a token it never issued
+
+        Args:
+            client (FlaskClient): Flask app test client
+        """
+        response = client.get("/api/v1/og/not-a-token")
+        assert response.json is None
+
+    def test_og_lookup_api_returns_cached_data(self, app: Flask, client: FlaskClient) -> None:
+        """
+        Asserts a cached lookup is returned straight away
+        without a job token
+
+        Args:
+            app (Flask): Flask app instance
+            client (FlaskClient): Flask app test client
+        """
+        with app.app_context():
+            db.session.add(OpenGraphCache(
+                url="https://og.invalid/course",
+                data=json.dumps(self.og_data),
+                expires=utcnow() + timedelta(days=1),
+            ))
+            db.session.commit()
+        response = client.post("/api/v1/og", json={"url": "https://og.invalid/course#intro"})
+        with app.app_context():
+            jobs = OpenGraphJob.query.count()
+        assert \
+            response.json["status"] == "done" and \
+            response.json["data"] == self.og_data and \
+            response.json["token"] is None and \
+            "status_url" not in response.json and \
+            jobs == 0
+
+    def test_og_lookup_api_shares_pending_job(self, app: Flask, client: FlaskClient) -> None:
+        """
+        Asserts a lookup of a URL another worker process is
+        scraping is given that process's job, which can be
+        polled until it expires
+
+        Args:
+            app (Flask): Flask app instance
+            client (FlaskClient): Flask app test client
+        """
+        with app.app_context():
+            db.session.add(OpenGraphJob(
+                token="other-process",
+                url="https://og.invalid/course",
+                key="https://og.invalid/course",
+                status="pending",
+                expires=utcnow() + timedelta(minutes=1),
+            ))
+            db.session.add(OpenGraphJob(
+                token="expired",
+                url="https://og.invalid/old",
+                key="https://og.invalid/old",
+                status="done",
+                expires=utcnow() - timedelta(minutes=1),
+            ))
+            db.session.commit()
+        response = client.post("/api/v1/og", json={"url": "https://og.invalid/course?utm_source=feed"})
+        job = client.get(response.json["status_url"]).json
+        expired = client.get("/api/v1/og/expired").json
+        assert \
+            response.json["token"] == "other-process" and \
+            job == {"status": "pending", "url": "https://og.invalid/course", "data": None} and \
+            expired is None
+
+    def test_og_lookup_api_rejects_invalid_url(self, client: FlaskClient) -> None:
+        """
+        Asserts an error is returned for a URL that cannot
+        be scraped
+
+        Args:
+            client (FlaskClient): Flask app test client
+        """
+        response = client.post("/api/v1/og", json={"url": "this_is_not_a_valid_url_type"})
+        assert response.json == {
+            "message": "Invalid URL",
+            "status": 400,
+        }
+
+    def test_scrape_queue_fails_job_after_lookup_error(self, app: Flask, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Asserts a lookup that raises a database error is rolled
+        back so its job can still be marked failed
+
+        Args:
+            app (Flask): Flask app instance
+            monkeypatch (pytest.MonkeyPatch): patches the lookup
+        """
+        def broken_lookup(_: str) -> dict:
+            db.session.add(OpenGraphCache(url="https://og.invalid/course", data="{}", expires=None))
+            db.session.flush()
+
+        monkeypatch.setattr(OpenGraphService, "lookup", broken_lookup)
+        with app.app_context():
+            db.session.add(OpenGraphJob(
+                token="broken",
+                url="https://og.invalid/course",
+                key="https://og.invalid/course",
+                status="pending",
+                expires=utcnow() + timedelta(minutes=1),
+            ))
+            db.session.commit()
+        with pytest.raises(SQLAlchemyError):
+            scrape_queue.run(app, "https://og.invalid/course")
+        with app.app_context():
+            job = scrape_queue.status("broken")
+        assert job["status"] == "failed"
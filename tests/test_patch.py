@@ -0,0 +1,181 @@
+"""
+Partial update test module
+"""
+
+# pylint: disable=duplicate-code, line-too-long
+
+import json
+
+from flask.testing import FlaskClient
+
+
+class TestPatch:
+    """
+    Tests PATCH endpoints updating only the given fields of
+    Certs, Resources, and Sections
+    """
+
+    @classmethod
+    def setup_class(cls) -> None:
+        """
+        Setup class before all tests run
+        """
+        cls.api_url = "http://127.0.0.1:5000/api/v1"
+        cls.cert_data_1 = None
+        cls.resource_data_1 = None
+        cls.section_data_1 = None
+
+    def setup_method(self) -> None:
+        """
+        Setup class before all tests run
+        """
+        # create new cert from form
+        self.cert_data_1 = {
+            "name": "Test",
+            "code": "tst-101",
+            "date": "01/01/2000",
+            "head_img": "test/test.jpg",
+            "badge_img": "etest/BADGE_test.png",
+            "exam_date": "",
+            "complete": False,
+            "tags": "test",
+        }
+        # create a new resource on the cert
+        self.resource_data_1 = {
+            "cert_id": 1,
+            "resource_type": "course",
+            "url": "http://test.test",
+            "title": "Test course",
+            "image": "test/test.png",
+            "description": "This is a test course",
+            "site_logo": "test.svg",
+            "site_name": "Test",
+            "complete": False,
+            "has_og_data": False,
+        }
+        # create a new section on a course
+        self.section_data_1 = {
+            "cert_id": 1,
+            "resource_id": 1,
+            "number": 1,
+            "title": "Test section",
+            "cards_made": False,
+            "complete": False,
+        }
+
+    def test_patch_cert_updates_only_given_fields(self, client: FlaskClient) -> None:
+        """
+        Asserts that only the provided fields of a Cert object are updated
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        client.post(
+            f"{self.api_url}/cert",
+            data=json.dumps(self.cert_data_1),
+            headers={"Content-Type": "application/json"},
+        )
+        patch_response = client.patch(
+            "/api/v1/cert/1",
+            data=json.dumps({"exam_date": "30/11/2024"}),
+            headers={"Content-Type": "application/json"},
+        )
+        data = client.get("/api/v1/cert/1").json
+        assert \
+            patch_response.json["message"] == "Cert updated successfully" and \
+            patch_response.json["status"] == 200 and \
+            data["exam_date"] == "2024-11-30" and \
+            data["name"] == "Test"
+
+    def test_patch_cert_rejects_invalid_exam_date(self, client: FlaskClient) -> None:
+        """
+        Asserts a 400 status is returned for an exam date that is
+        not a valid date
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        client.post("/api/v1/cert", json=self.cert_data_1)
+        response = client.patch("/api/v1/cert/1", json={"exam_date": "31/02/2024"})
+        assert \
+            response.json["message"] == "Invalid exam date" and \
+            response.json["status"] == 400
+
+    def test_patch_cert_rejects_complete(self, client: FlaskClient) -> None:
+        """
+        Asserts a 400 status is returned when patching the Cert
+        completion, which is kept in step with its courses
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        client.post("/api/v1/cert", json=self.cert_data_1)
+        response = client.patch("/api/v1/cert/1", json={"complete": True})
+        data = client.get("/api/v1/cert/1").json
+        assert \
+            response.json["message"] == "Invalid fields: complete" and \
+            response.json["status"] == 400 and \
+            not data["complete"]
+
+    def test_patch_cert_returns_404(self, client: FlaskClient) -> None:
+        """
+        Asserts 404 status is returned if the Cert object does not exist
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        patch_response = client.patch(
+            "/api/v1/cert/1",
+            data=json.dumps({"exam_date": "30/11/2024"}),
+            headers={"Content-Type": "application/json"},
+        )
+        assert \
+            patch_response.json["message"] == "Cert not found" and \
+            patch_response.json["status"] == 404
+
+    def test_patch_resource_rejects_invalid_fields(self, client: FlaskClient) -> None:
+        """
+        Asserts 400 status is returned if a field cannot be patched
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        client.post(
+            f"{self.api_url}/resource",
+            data=json.dumps(self.resource_data_1),
+            headers={"Content-Type": "application/json"},
+        )
+        patch_response = client.patch(
+            "/api/v1/resource/1",
+            data=json.dumps({"cert_id": 2, "complete": True}),
+            headers={"Content-Type": "application/json"},
+        )
+        data = client.get("/api/v1/resource/1").json
+        assert \
+            patch_response.json["message"] == "Invalid fields: cert_id" and \
+            patch_response.json["status"] == 400 and \
+            not data["complete"]
+
+    def test_patch_section_returns_updated_section(self, client: FlaskClient) -> None:
+        """
+        Asserts the updated Section object is returned after a patch
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        client.post(
+            f"{self.api_url}/section",
+            data=json.dumps(self.section_data_1),
+            headers={"Content-Type": "application/json"},
+        )
+        patch_response = client.patch(
+            "/api/v1/section/1",
+            data=json.dumps({"cards_made": True}),
+            headers={"Content-Type": "application/json"},
+        )
+        data = patch_response.json["data"]
+        assert \
+            patch_response.json["status"] == 200 and \
+            data["cards_made"] and \
+            data["title"] == "Test section" and \
+            data["updated"] is not None
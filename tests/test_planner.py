@@ -0,0 +1,194 @@
+"""
+Study pace planner test module
+"""
+
+# pylint: disable=duplicate-code, line-too-long
+
+from datetime import date
+
+from flask import Flask
+from flask.testing import FlaskClient
+
+from src.services.cert import CertService
+from src.services.planner import MAX_SCHEDULE_DAYS, PlannerService
+from src.services.resource import ResourceService
+from src.services.section import SectionService
+from src.services.snapshot import SnapshotService
+
+
+class TestPlanner:
+    """
+    Tests planning the study pace of Certs from their
+    progress counters and snapshots
+    """
+
+    @classmethod
+    def setup_class(cls) -> None:
+        """
+        Setup class before all tests run
+        """
+        cls.cert_data = None
+        cls.resource_data = None
+
+    def setup_method(self) -> None:
+        """
+        Setup class before all tests run
+        """
+        self.cert_data = {
+            "name": "Test",
+            "code": "tst-101",
+            "head_img": "test/test.jpg",
+            "badge_img": "test/BADGE_test.png",
+            "exam_date": "2024-01-31",
+            "tags": "test",
+        }
+        self.resource_data = {
+            "cert_id": 1,
+            "resource_type": "course",
+            "url": "http://test.test",
+            "title": "Test Course",
+            "image": "",
+            "description": "This is a test course",
+            "site_logo": "",
+            "site_name": "Test",
+            "has_og_data": False,
+            "complete": False,
+        }
+
+    def create_sections(self, count: int) -> None:
+        """
+        Creates a Cert with a course of the given number of Sections
+
+        Args:
+            count (int): number of Sections
+        """
+        CertService.create(self.cert_data)
+        ResourceService.create(self.resource_data)
+        SectionService.create_bulk([
+            {"cert_id": 1, "resource_id": 1, "number": i, "title": f"Section {i}"}
+            for i in range(1, count + 1)
+        ])
+
+    def test_plan_on_track_from_recent_velocity(self, app: Flask) -> None:
+        """
+        Asserts the pace since the snapshot starting the velocity
+        window projects completion before the exam
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            self.create_sections(20)
+            SnapshotService.take(date(2024, 1, 1))
+            for section_id in range(1, 11):
+                SectionService.patch(section_id, {"complete": True})
+            plan = PlannerService.get_all(today=date(2024, 1, 11))[1]
+        assert \
+            plan["remaining"] == 10 and \
+            plan["days_left"] == 20 and \
+            plan["required_per_day"] == 0.5 and \
+            plan["velocity"] == 1.0 and \
+            plan["projected_date"] == date(2024, 1, 21) and \
+            plan["status"] == "on track"
+
+    def test_plan_behind_without_progress(self, app: Flask) -> None:
+        """
+        Asserts a Cert with no recent progress is behind
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            self.create_sections(5)
+            SnapshotService.take(date(2024, 1, 1))
+            plan = PlannerService.get_all(today=date(2024, 1, 20))[1]
+        assert \
+            plan["velocity"] == 0.0 and \
+            plan["projected_date"] is None and \
+            plan["status"] == "behind"
+
+    def test_plan_statuses_without_exam_or_sections(self, app: Flask) -> None:
+        """
+        Asserts Certs without an exam date or Sections are not rated
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            CertService.create({**self.cert_data, "exam_date": ""})
+            CertService.create({**self.cert_data, "name": "Test2", "code": "tst-102"})
+            ResourceService.create(self.resource_data)
+            SectionService.create({"cert_id": 1, "resource_id": 1, "number": 1, "title": "Section"})
+            plans = PlannerService.get_all(today=date(2024, 1, 1))
+        assert \
+            plans[1]["status"] == "no exam date" and \
+            plans[2]["status"] == "no sections"
+
+    def test_schedule_spreads_incomplete_sections(self, app: Flask) -> None:
+        """
+        Asserts the incomplete Sections are spread evenly over
+        the days left in number order
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            self.create_sections(7)
+            SectionService.patch(1, {"complete": True})
+            plan = PlannerService.get(1, today=date(2024, 1, 28))
+        assert \
+            [day["day"] for day in plan["schedule"]] == [date(2024, 1, day) for day in (28, 29, 30)] and \
+            [[section["number"] for section in day["sections"]] for day in plan["schedule"]] == [[2, 3], [4, 5], [6, 7]]
+
+    def test_plan_without_snapshots_has_no_pace_yet(self, app: Flask) -> None:
+        """
+        Asserts a Cert without snapshot history is not rated behind
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            self.create_sections(5)
+            plan = PlannerService.get_all(today=date(2024, 1, 20))[1]
+        assert \
+            plan["velocity"] is None and \
+            plan["status"] == "no pace yet"
+
+    def test_schedule_is_capped_for_distant_exam(self, app: Flask) -> None:
+        """
+        Asserts only the first days of the schedule are listed
+        when the exam is years away
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            self.cert_data["exam_date"] = "2030-01-01"
+            self.create_sections(3)
+            plan = PlannerService.get(1, today=date(2024, 1, 1))
+        assert \
+            len(plan["schedule"]) == MAX_SCHEDULE_DAYS and \
+            plan["days_left"] > MAX_SCHEDULE_DAYS
+
+    def test_plan_api_returns_none(self, client: FlaskClient) -> None:
+        """
+        Asserts the API returns null if the Cert does not exist
+
+        Args:
+            client (FlaskClient): Flask app test client
+        """
+        response = client.get("/api/v1/cert/1/plan")
+        assert response.json is None
+
+    def test_certs_page_shows_status_badge(self, app: Flask, client: FlaskClient) -> None:
+        """
+        Asserts the certs overview shows the plan status of a Cert
+
+        Args:
+            app (Flask): Flask app instance
+            client (FlaskClient): Flask app test client
+        """
+        with app.app_context():
+            self.create_sections(3)
+        response = client.get("/certs")
+        assert b">overdue</p>" in response.data
@@ -2,13 +2,23 @@
 App routes test module
 """
 
+# pylint: disable=too-many-public-methods
+
 import json
 import os
 
+from datetime import timedelta
+
 import requests
 
+from flask import Flask
 from flask.testing import FlaskClient
 
+from src.db import db
+from src.models.og_cache import OpenGraphCache
+from src.models.og_job import OpenGraphJob
+from src.services.dates import utcnow
+
 API_URL = f"http://127.0.0.1:5000/api/v{os.environ["API_VERSION"]}"
 
 
@@ -199,27 +209,80 @@ class TestRoutes:
 
     # ===== /certs/data/<int:cert_id> =====
 
-    def test_certs_data_returns_200_with_og_data(self, client: FlaskClient) -> None:
+    def test_certs_data_returns_200_with_og_job(self, app: Flask, client: FlaskClient) -> None:
         """
-        Assert 200 is returned when fetching a cert with 
-        Open Graph protocol data
+        Assert 200 is returned when fetching a cert with the
+        token of an Open Graph lookup finished by any worker
+        process, and the resource form is filled from the
+        stored data
 
         Args:
+            app (Flask): Flask app instance
             client (FlaskClient): client returned by fixture
         """
         # create cert to fetch endpoint for
-        requests.post(
-            url=f"{API_URL}/cert",
-            data=json.dumps(self.cert_data),
-            headers={"Content-Type": "application/json"},
-            timeout=2
-        )
+        client.post("/api/v1/cert", json=self.cert_data)
+        with app.app_context():
+            expires = utcnow() + timedelta(minutes=5)
+            db.session.add(OpenGraphCache(
+                url="https://og.invalid/",
+                data=json.dumps({"title": "OG Title"}),
+                expires=expires,
+            ))
+            db.session.add(OpenGraphJob(
+                token="finished-job",
+                url="https://og.invalid",
+                key="https://og.invalid/",
+                status="done",
+                expires=expires,
+            ))
+            db.session.commit()
         # get the route for this cert
-        og_test = json.dumps([{"testing": True}])
-        response = client.get(f"/certs/data/1?og_data={og_test}")
+        response = client.get("/certs/data/1?og_job=finished-job")
         assert \
             response.status_code == 200 and \
-            b"Test" in response.data
+            b"Test" in response.data and \
+            b'value="OG Title"' in response.data
+
+    def test_certs_data_returns_200_with_og_url(self, app: Flask, client: FlaskClient) -> None:
+        """
+        Assert the resource form is filled from the cache for
+        the URL of a cached Open Graph lookup
+
+        Args:
+            app (Flask): Flask app instance
+            client (FlaskClient): client returned by fixture
+        """
+        # create cert to fetch endpoint for
+        client.post("/api/v1/cert", json=self.cert_data)
+        with app.app_context():
+            db.session.add(OpenGraphCache(
+                url="https://og.invalid/",
+                data=json.dumps({"title": "OG Title"}),
+                expires=utcnow() + timedelta(minutes=5),
+            ))
+            db.session.commit()
+        response = client.get("/certs/data/1?og_url=https://OG.invalid")
+        assert \
+            response.status_code == 200 and \
+            b'value="OG Title"' in response.data and \
+            b"data-og-job-url" not in response.data
+
+    def test_certs_data_ignores_unknown_og_job(self, client: FlaskClient) -> None:
+        """
+        Assert the resource form is left empty for an expired
+        or unknown Open Graph lookup token
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        # create cert to fetch endpoint for
+        client.post("/api/v1/cert", json=self.cert_data)
+        response = client.get("/certs/data/1?og_job=expired")
+        assert \
+            response.status_code == 200 and \
+            b"has_og_data" not in response.data and \
+            b"data-og-job-url" not in response.data
 
     def test_certs_data_returns_200_without_og_data(self, client: FlaskClient) -> None:
         """
@@ -242,6 +305,32 @@ class TestRoutes:
             response.status_code == 200 and \
             b"Test" in response.data
 
+    def test_certs_data_renders_statistics(self, client: FlaskClient) -> None:
+        """
+        Assert the statistics tab shows the Resource completion
+        rollups in place of the placeholder
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        client.post("/api/v1/cert", json=self.cert_data)
+        client.post("/api/v1/resource", json={
+            "cert_id": 1,
+            "resource_type": "video",
+            "url": "http://test.test",
+            "title": "Test video",
+            "image": "",
+            "description": "This is a test video",
+            "site_logo": "",
+            "site_name": "Test",
+            "has_og_data": False,
+            "complete": True,
+        })
+        response = client.get("/certs/data/1")
+        assert \
+            b"video (1/1)" in response.data and \
+            b"Plotly Dash" not in response.data
+
     def test_certs_data_returns_404(self, client: FlaskClient) -> None:
         """
         Assert 404 is returned if the cert doesn't exist
@@ -0,0 +1,235 @@
+"""
+Search index test module
+"""
+
+# pylint: disable=duplicate-code, line-too-long
+
+from flask import Flask
+from flask.testing import FlaskClient
+from sqlalchemy import insert
+
+from src.db import db
+from src.models.resource import Resource
+from src.services.cert import CertService
+from src.services.resource import ResourceService
+from src.services.search import search_index
+from src.services.section import SectionService
+
+
+class TestSearch:
+    """
+    Tests the inverted index searching across Certs,
+    Resources, and Sections
+    """
+
+    @classmethod
+    def setup_class(cls) -> None:
+        """
+        Setup class before all tests run
+        """
+        cls.cert_data = None
+        cls.resource_data = None
+        cls.section_data = None
+
+    def setup_method(self) -> None:
+        """
+        Setup class before all tests run
+        """
+        self.cert_data = {
+            "name": "Test",
+            "code": "tst-101",
+            "head_img": "test/test.jpg",
+            "badge_img": "test/BADGE_test.png",
+            "exam_date": "",
+            "tags": "test",
+        }
+        self.resource_data = {
+            "cert_id": 1,
+            "resource_type": "video",
+            "url": "http://test.test",
+            "title": "Networking Basics",
+            "image": "",
+            "description": "Subnets and routing tables explained",
+            "site_logo": "",
+            "site_name": "Tube",
+            "has_og_data": False,
+            "complete": False,
+        }
+        self.section_data = {
+            "cert_id": 1,
+            "resource_id": 1,
+            "number": 1,
+            "title": "Load balancers",
+        }
+
+    def test_search_returns_mixed_result_types(self, app: Flask) -> None:
+        """
+        Asserts Resources and Sections are found along with the
+        name of the Cert they belong to
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            CertService.create(self.cert_data)
+            ResourceService.create(self.resource_data)
+            SectionService.create(self.section_data)
+            videos = search_index.search("routing")
+            sections = search_index.search("balancers")
+        assert \
+            videos[0]["type"] == "video" and \
+            videos[0]["title"] == "Networking Basics" and \
+            videos[0]["cert_name"] == "Test" and \
+            sections[0]["type"] == "section" and \
+            sections[0]["cert_id"] == 1
+
+    def test_search_ranks_more_matching_terms_first(self, app: Flask) -> None:
+        """
+        Asserts a document matching more query terms scores higher
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            CertService.create(self.cert_data)
+            ResourceService.create(self.resource_data)
+            SectionService.create({**self.section_data, "title": "Routing"})
+            results = search_index.search("routing subnets")
+        assert \
+            [result["type"] for result in results] == ["video", "section"] and \
+            results[0]["score"] > results[1]["score"]
+
+    def test_search_reflects_updates(self, app: Flask) -> None:
+        """
+        Asserts the index is updated when a Resource is changed
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            CertService.create(self.cert_data)
+            ResourceService.create(self.resource_data)
+            ResourceService.patch(1, {"title": "Firewall Rules"})
+            old = search_index.search("networking")
+            new = search_index.search("firewall")
+        assert old == [] and new[0]["id"] == 1
+
+    def test_search_replaces_only_touched_document(self, app: Flask) -> None:
+        """
+        Asserts a Section write replaces that Section's document
+        and leaves the other documents of the Cert in place
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            CertService.create(self.cert_data)
+            ResourceService.create(self.resource_data)
+            SectionService.create(self.section_data)
+            search_index.search("test")
+            resource = search_index.docs[("resource", 1)]
+            section = search_index.docs[("section", 1)]
+            SectionService.patch(1, {"title": "Firewall rules"})
+            results = search_index.search("firewall")
+        assert \
+            search_index.docs[("resource", 1)] is resource and \
+            search_index.docs[("section", 1)] is not section and \
+            results[0]["title"] == "1. Firewall rules"
+
+    def test_search_forgets_deleted_course_sections(self, app: Flask) -> None:
+        """
+        Asserts deleting a Resource also removes its Sections
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            CertService.create(self.cert_data)
+            ResourceService.create(self.resource_data)
+            SectionService.create(self.section_data)
+            ResourceService.delete(1)
+            results = search_index.search("routing balancers")
+        assert results == []
+
+    def test_search_forgets_deleted_cert_content(self, app: Flask) -> None:
+        """
+        Asserts a deleted Cert's Resources and Sections are removed
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            CertService.create(self.cert_data)
+            ResourceService.create(self.resource_data)
+            SectionService.create(self.section_data)
+            CertService.delete(1)
+            results = search_index.search("test routing balancers")
+        assert results == []
+
+    def test_search_rebuilds_after_outside_write(self, app: Flask) -> None:
+        """
+        Asserts rows written without going through the services
+        are found once the table versions change
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            db.session.execute(insert(Resource), [{
+                **self.resource_data,
+                "image": "default_image.jpg",
+                "site_logo": "default_logo.png",
+            }])
+            db.session.commit()
+            results = search_index.search("subnets")
+        assert results[0]["title"] == "Networking Basics"
+
+    def test_search_keeps_outside_write_before_sync(self, app: Flask) -> None:
+        """
+        Asserts a row written without going through the services
+        is still found after a service write syncs another Cert
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            CertService.create(self.cert_data)
+            CertService.create({**self.cert_data, "name": "Other", "code": "tst-102"})
+            search_index.search("test")
+            db.session.execute(insert(Resource), [{
+                **self.resource_data,
+                "cert_id": 2,
+                "image": "default_image.jpg",
+                "site_logo": "default_logo.png",
+            }])
+            db.session.commit()
+            ResourceService.create({**self.resource_data, "url": "http://test.test2", "title": "Firewall Rules"})
+            outside = search_index.search("subnets")
+        assert {r["cert_id"] for r in outside} == {1, 2}
+
+    def test_search_returns_empty_list_for_blank_query(self, app: Flask) -> None:
+        """
+        Asserts a query without words returns no results
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            results = search_index.search(" ? ")
+        assert results == []
+
+    def test_results_all_mode_lists_matches(self, app: Flask, client: FlaskClient) -> None:
+        """
+        Asserts the results page lists Resources when searching everything
+
+        Args:
+            app (Flask): Flask app instance
+            client (FlaskClient): Flask app test client
+        """
+        with app.app_context():
+            CertService.create(self.cert_data)
+            ResourceService.create(self.resource_data)
+        response = client.post("/results?search=routing&mode=all")
+        assert \
+            response.status_code == 200 and \
+            b"Networking Basics" in response.data
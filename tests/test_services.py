@@ -0,0 +1,296 @@
+"""
+In-process service layer test module
+"""
+
+# pylint: disable=duplicate-code, line-too-long
+
+from flask import Flask
+from sqlalchemy import event
+
+from src.db import db
+
+from src.services.cert import CertService
+from src.services.resource import ResourceService
+from src.services.section import SectionService
+
+
+class TestServices:
+    """
+    Tests the Cert, Resource, and Section services
+    called by the API and the HTML views
+    """
+
+    @classmethod
+    def setup_class(cls) -> None:
+        """
+        Setup class before all tests run
+        """
+        cls.cert_data = None
+        cls.resource_data = None
+        cls.section_data = None
+
+    def setup_method(self) -> None:
+        """
+        Setup class before all tests run
+        """
+        self.cert_data = {
+            "name": "Test",
+            "code": "tst-101",
+            "head_img": "test/test.jpg",
+            "badge_img": "test/BADGE_test.png",
+            "exam_date": "",
+            "tags": "test",
+        }
+        self.resource_data = {
+            "cert_id": 1,
+            "resource_type": "course",
+            "url": "http://test.test",
+            "title": "Test Course",
+            "image": "",
+            "description": "This is a test course",
+            "site_logo": "",
+            "site_name": "Test",
+            "has_og_data": False,
+            "complete": False,
+        }
+        self.section_data = {
+            "cert_id": 1,
+            "resource_id": 1,
+            "number": 1,
+            "title": "Test section",
+        }
+
+    def test_cert_service_get_returns_dict(self, app: Flask) -> None:
+        """
+        Asserts a Cert is returned as plain data
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            CertService.create(self.cert_data)
+            cert = CertService.get(1)
+        assert isinstance(cert, dict) and cert["name"] == "Test"
+
+    def test_cert_service_get_returns_none(self, app: Flask) -> None:
+        """
+        Asserts None is returned if the Cert does not exist
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            cert = CertService.get(1)
+        assert cert is None
+
+    def test_resource_service_sets_default_images(self, app: Flask) -> None:
+        """
+        Asserts default images are set if none are provided
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            ResourceService.create(self.resource_data)
+            resource = ResourceService.get(1)
+        assert \
+            resource["image"] == "default_image.jpg" and \
+            resource["site_logo"] == "default_logo.png"
+
+    def test_resource_service_update_rolls_back_failed_update(self, app: Flask) -> None:
+        """
+        Asserts a failed update is rolled back and reported
+        with a 500 status
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            CertService.create(self.cert_data)
+            ResourceService.create(self.resource_data)
+            data = ResourceService.update(1, {**self.resource_data, "title": None})
+            resource = ResourceService.get(1)
+        assert \
+            data == {"message": "Resource update failed", "status": 500} and \
+            resource["title"] == "Test Course"
+
+    def test_cert_service_delete_removes_resources_and_sections(self, app: Flask) -> None:
+        """
+        Asserts deleting a Cert also deletes its Resources and Sections
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            CertService.create(self.cert_data)
+            ResourceService.create(self.resource_data)
+            SectionService.create(self.section_data)
+            result = CertService.delete(1)
+            resources = ResourceService.get_all()
+            sections = SectionService.get_all()
+        assert \
+            result["status"] == 200 and \
+            len(resources) == 0 and \
+            len(sections) == 0
+
+    def test_cert_service_delete_returns_404(self, app: Flask) -> None:
+        """
+        Asserts a 404 status is returned and nothing is deleted
+        if the Cert doesn't exist
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            ResourceService.create(self.resource_data)
+            result = CertService.delete(1)
+            resources = ResourceService.get_all()
+        assert \
+            result["message"] == "Cert not found" and \
+            result["status"] == 404 and \
+            len(resources) == 1
+
+    def test_resource_service_delete_course_removes_sections(self, app: Flask) -> None:
+        """
+        Asserts deleting a course Resource also deletes its Sections
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            ResourceService.create(self.resource_data)
+            SectionService.create(self.section_data)
+            result = ResourceService.delete(1)
+            sections = SectionService.get_all()
+        assert result["status"] == 200 and len(sections) == 0
+
+    def test_resource_service_delete_returns_404(self, app: Flask) -> None:
+        """
+        Asserts a 404 status is returned if the Resource doesn't exist
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            result = ResourceService.delete(1)
+        assert \
+            result["message"] == "Resource not found" and \
+            result["status"] == 404
+
+    def test_cert_service_get_bundle_uses_fixed_queries(self, app: Flask) -> None:
+        """
+        Asserts the Cert bundle is built with one query per table
+        regardless of the number of Resources and Sections
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        statements = []
+
+        def count(*_) -> None:
+            statements.append(1)
+
+        with app.app_context():
+            CertService.create(self.cert_data)
+            for i in range(1, 4):
+                self.resource_data["title"] = f"Test Course {i}"
+                self.resource_data["url"] = f"http://test.test/{i}"
+                ResourceService.create(self.resource_data)
+                self.section_data["resource_id"] = i
+                SectionService.create(self.section_data)
+            event.listen(db.engine, "before_cursor_execute", count)
+            try:
+                bundle = CertService.get_bundle(1)
+            finally:
+                event.remove(db.engine, "before_cursor_execute", count)
+        assert \
+            len(statements) == 3 and \
+            len(bundle["resources"]["course"]) == 3 and \
+            len(bundle["sections"]) == 3
+
+    def test_progress_counters_propagate_complete(self, app: Flask) -> None:
+        """
+        Asserts completing every Section of the only course marks
+        the course and its Cert complete
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            CertService.create(self.cert_data)
+            ResourceService.create(self.resource_data)
+            SectionService.create_bulk([
+                {**self.section_data, "number": 1},
+                {**self.section_data, "number": 2},
+            ])
+            SectionService.patch(1, {"complete": True, "cards_made": True})
+            partial = CertService.get(1)
+            SectionService.patch(2, {"complete": True})
+            course = ResourceService.get(1)
+            cert = CertService.get(1)
+        assert \
+            partial["section_count"] == 2 and \
+            partial["sections_complete"] == 1 and \
+            partial["sections_cards_made"] == 1 and \
+            not partial["complete"] and \
+            course["sections_complete"] == course["section_count"] == 2 and \
+            course["complete"] and \
+            cert["courses_complete"] == cert["course_count"] == 1 and \
+            cert["complete"]
+
+    def test_progress_counters_follow_deletes(self, app: Flask) -> None:
+        """
+        Asserts the counters drop when Sections and courses are deleted
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            CertService.create(self.cert_data)
+            ResourceService.create(self.resource_data)
+            SectionService.create(self.section_data)
+            SectionService.create({**self.section_data, "number": 2})
+            SectionService.delete(2)
+            course = ResourceService.get(1)
+            ResourceService.delete(1)
+            cert = CertService.get(1)
+        assert \
+            course["section_count"] == 1 and \
+            cert["section_count"] == 0 and \
+            cert["course_count"] == 0
+
+    def test_resource_service_patch_rejects_complete_for_course_with_sections(self, app: Flask) -> None:
+        """
+        Asserts complete cannot be patched on a course with
+        Sections since it is counted from them
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            CertService.create(self.cert_data)
+            ResourceService.create(self.resource_data)
+            SectionService.create(self.section_data)
+            result = ResourceService.patch(1, {"complete": True})
+            course = ResourceService.get(1)
+            cert = CertService.get(1)
+        assert \
+            result["status"] == 400 and \
+            not course["complete"] and \
+            not cert["complete"]
+
+    def test_progress_counters_reset_cert_without_courses(self, app: Flask) -> None:
+        """
+        Asserts a complete Cert is no longer complete once its
+        last course is deleted
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            CertService.create(self.cert_data)
+            ResourceService.create({**self.resource_data, "complete": True})
+            complete = CertService.get(1)
+            ResourceService.delete(1)
+            cert = CertService.get(1)
+        assert complete["complete"] and not cert["complete"]
@@ -0,0 +1,167 @@
+"""
+Progress snapshot test module
+"""
+
+# pylint: disable=duplicate-code, line-too-long
+
+from datetime import date
+
+from flask import Flask
+from flask.testing import FlaskClient
+
+from src.services.cert import CertService
+from src.services.resource import ResourceService
+from src.services.search import search_index
+from src.services.section import SectionService
+from src.services.snapshot import SnapshotService
+
+
+class TestSnapshots:
+    """
+    Tests taking daily progress snapshots and reading
+    them back as a time series
+    """
+
+    @classmethod
+    def setup_class(cls) -> None:
+        """
+        Setup class before all tests run
+        """
+        cls.cert_data = None
+        cls.resource_data = None
+        cls.section_data = None
+
+    def setup_method(self) -> None:
+        """
+        Setup class before all tests run
+        """
+        self.cert_data = {
+            "name": "Test",
+            "code": "tst-101",
+            "head_img": "test/test.jpg",
+            "badge_img": "test/BADGE_test.png",
+            "exam_date": "",
+            "tags": "test",
+        }
+        self.resource_data = {
+            "cert_id": 1,
+            "resource_type": "course",
+            "url": "http://test.test",
+            "title": "Test Course",
+            "image": "",
+            "description": "This is a test course",
+            "site_logo": "",
+            "site_name": "Test",
+            "has_og_data": False,
+            "complete": False,
+        }
+        self.section_data = {
+            "cert_id": 1,
+            "resource_id": 1,
+            "number": 1,
+            "title": "Test section",
+        }
+
+    def test_take_only_appends_changed_counters(self, app: Flask) -> None:
+        """
+        Asserts a Cert is only snapshotted when its counters change
+        and never twice for the same day
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            CertService.create(self.cert_data)
+            first = SnapshotService.take(date(2024, 1, 1))
+            again = SnapshotService.take(date(2024, 1, 1))
+            unchanged = SnapshotService.take(date(2024, 1, 2))
+            ResourceService.create(self.resource_data)
+            SectionService.create(self.section_data)
+            changed = SnapshotService.take(date(2024, 1, 3))
+        assert \
+            [first["taken"], again["taken"], unchanged["taken"], changed["taken"]] == [1, 0, 0, 1]
+
+    def test_get_series_carries_counters_forward(self, app: Flask) -> None:
+        """
+        Asserts every day in the range gets the counters of the
+        latest snapshot on or before it
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            CertService.create(self.cert_data)
+            ResourceService.create(self.resource_data)
+            SectionService.create(self.section_data)
+            SnapshotService.take(date(2024, 1, 2))
+            SectionService.patch(1, {"complete": True})
+            SnapshotService.take(date(2024, 1, 4))
+            result = SnapshotService.get_series(1, "2024-01-01", "2024-01-05")
+        series = result["series"]
+        assert \
+            [point["day"] for point in series] == [date(2024, 1, day) for day in range(1, 6)] and \
+            [point["sections_complete"] for point in series] == [None, 0, 0, 1, 1] and \
+            series[4]["courses_complete"] == 1 and \
+            series[4]["section_count"] == 1
+
+    def test_get_series_starts_from_earlier_snapshot(self, app: Flask) -> None:
+        """
+        Asserts a range starting after the latest snapshot uses it
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            CertService.create(self.cert_data)
+            SnapshotService.take(date(2024, 1, 1))
+            result = SnapshotService.get_series(1, "2024-02-01", "2024-02-02")
+        assert [point["section_count"] for point in result["series"]] == [0, 0]
+
+    def test_snapshots_api_rejects_invalid_range(self, app: Flask, client: FlaskClient) -> None:
+        """
+        Asserts a 400 status is returned if the range is backwards
+
+        Args:
+            app (Flask): Flask app instance
+            client (FlaskClient): Flask app test client
+        """
+        with app.app_context():
+            CertService.create(self.cert_data)
+        response = client.get("/api/v1/cert/1/snapshots?start=2024-02-01&end=2024-01-01")
+        assert response.json["status"] == 400
+
+    def test_snapshots_api_returns_none(self, client: FlaskClient) -> None:
+        """
+        Asserts the API returns null if the Cert does not exist
+
+        Args:
+            client (FlaskClient): Flask app test client
+        """
+        response = client.get("/api/v1/cert/1/snapshots")
+        assert response.json is None
+
+    def test_snapshot_command_takes_snapshots(self, app: Flask) -> None:
+        """
+        Asserts the CLI command snapshots every Cert
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        with app.app_context():
+            CertService.create(self.cert_data)
+        result = app.test_cli_runner().invoke(args=["snapshot", "--day", "2024-01-01"])
+        assert \
+            result.exit_code == 0 and \
+            "1 snapshots taken for 2024-01-01" in result.output
+
+    def test_snapshot_command_skips_search_index(self, app: Flask) -> None:
+        """
+        Asserts the CLI command does not build the search index
+
+        Args:
+            app (Flask): Flask app instance
+        """
+        result = app.test_cli_runner().invoke(args=["snapshot", "--day", "2024-01-01"])
+        assert \
+            result.exit_code == 0 and \
+            search_index.versions is None
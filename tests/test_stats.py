@@ -0,0 +1,214 @@
+"""
+Cert statistics test module
+"""
+
+# pylint: disable=duplicate-code, line-too-long
+
+import datetime
+
+from flask import Flask
+from flask.testing import FlaskClient
+from sqlalchemy import event
+
+from src.db import db
+
+
+class TestStats:
+    """
+    Tests the statistics served from the rollup tables
+    """
+
+    @classmethod
+    def setup_class(cls) -> None:
+        """
+        Setup class before all tests run
+        """
+        cls.api_url = "http://127.0.0.1:5000/api/v1"
+        cls.cert_data_1 = None
+        cls.cert_data_2 = None
+        cls.resource_data_1 = None
+        cls.resource_data_2 = None
+        cls.section_data_1 = None
+        cls.section_data_2 = None
+
+    def setup_method(self) -> None:
+        """
+        Setup class before all tests run
+        """
+        # create new cert from form
+        self.cert_data_1 = {
+            "name": "Test",
+            "code": "tst-101",
+            "date": "01/01/2000",
+            "head_img": "test/test.jpg",
+            "badge_img": "etest/BADGE_test.png",
+            "exam_date": "",
+            "complete": False,
+            "tags": "test",
+        }
+        self.cert_data_2 = {
+            "name": "Test2",
+            "code": "tst-102",
+            "date": "01/01/2000",
+            "head_img": "test2/test2.jpg",
+            "badge_img": "etest/BADGE_test2.png",
+            "exam_date": "",
+            "complete": False,
+            "tags": "test2",
+        }
+        # create a new resource on the cert
+        self.resource_data_1 = {
+            "cert_id": 1,
+            "resource_type": "course",
+            "url": "http://test.test",
+            "title": "Test course",
+            "image": "test/test.png",
+            "description": "This is a test course",
+            "site_logo": "test.svg",
+            "site_name": "Test",
+            "complete": False,
+            "has_og_data": False,
+        }
+        self.resource_data_2 = {
+            "cert_id": 1,
+            "resource_type": "article",
+            "url": "http://test.test2",
+            "title": "Test article",
+            "image": "test2/test2.png",
+            "description": "This is a test article",
+            "site_logo": "test2.svg",
+            "site_name": "Test 2",
+            "complete": False,
+            "has_og_data": False,
+        }
+        # create a new section on a course
+        self.section_data_1 = {
+            "cert_id": 1,
+            "resource_id": 1,
+            "number": 1,
+            "title": "Test section",
+            "cards_made": False,
+            "complete": False,
+        }
+        self.section_data_2 = {
+            "cert_id": 1,
+            "resource_id": 1,
+            "number": 2,
+            "title": "Test section 2",
+            "cards_made": False,
+            "complete": False,
+        }
+
+    def test_get_cert_stats_rolls_up_resources_and_sections(self, client: FlaskClient) -> None:
+        """
+        Asserts the Cert statistics reflect Resource and Section writes
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        client.post("/api/v1/cert", json=self.cert_data_1)
+        client.post("/api/v1/resource", json=self.resource_data_1)
+        client.post("/api/v1/resource", json=self.resource_data_2)
+        client.post("/api/v1/section/bulk", json=[self.section_data_1, self.section_data_2])
+        client.patch("/api/v1/section/1", json={"complete": True, "cards_made": True})
+        client.patch("/api/v1/resource/2", json={"complete": True})
+        stats = client.get("/api/v1/cert/1/stats").json
+        week = datetime.date.fromisoformat(stats["weeks"][0]["week"])
+        assert \
+            stats["sections"] == {
+                "total": 2,
+                "complete": 1,
+                "cards_made": 1,
+                "percent_complete": 50.0,
+                "percent_cards_made": 50.0,
+            } and \
+            stats["resource_types"] == [
+                {"resource_type": "article", "total": 1, "complete": 1, "percent_complete": 100.0},
+                {"resource_type": "course", "total": 1, "complete": 0, "percent_complete": 0.0},
+            ] and \
+            len(stats["weeks"]) == 1 and \
+            stats["weeks"][0]["added"] == 2 and \
+            week.weekday() == 0
+
+    def test_get_stats_totals_every_cert(self, client: FlaskClient) -> None:
+        """
+        Asserts the statistics across all Certs add up each Cert
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        client.post("/api/v1/cert", json=self.cert_data_1)
+        client.post("/api/v1/cert", json=self.cert_data_2)
+        client.post("/api/v1/resource", json=self.resource_data_2)
+        client.post("/api/v1/resource", json={**self.resource_data_2, "cert_id": 2})
+        client.delete("/api/v1/cert/1")
+        stats = client.get("/api/v1/stats").json
+        assert \
+            stats["cert_id"] is None and \
+            stats["resource_types"] == [
+                {"resource_type": "article", "total": 1, "complete": 0, "percent_complete": 0.0},
+            ] and \
+            stats["weeks"][0]["added"] == 1
+
+    def test_get_cert_stats_follows_course_completion_and_type_changes(self, client: FlaskClient) -> None:
+        """
+        Asserts the rollups follow a course completed through its
+        Sections, a Resource changing type, and a deleted Resource
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        client.post("/api/v1/cert", json=self.cert_data_1)
+        client.post("/api/v1/resource", json=self.resource_data_1)
+        client.post("/api/v1/resource", json=self.resource_data_2)
+        client.post("/api/v1/section", json=self.section_data_1)
+        client.patch("/api/v1/section/1", json={"complete": True})
+        client.patch("/api/v1/resource/2", json={"resource_type": "video"})
+        changed = client.get("/api/v1/cert/1/stats").json
+        client.delete("/api/v1/resource/2")
+        client.delete("/api/v1/resource/1")
+        deleted = client.get("/api/v1/cert/1/stats").json
+        assert \
+            changed["resource_types"] == [
+                {"resource_type": "course", "total": 1, "complete": 1, "percent_complete": 100.0},
+                {"resource_type": "video", "total": 1, "complete": 0, "percent_complete": 0.0},
+            ] and \
+            deleted["resource_types"] == [] and \
+            deleted["weeks"] == []
+
+    def test_section_write_leaves_rollups_alone(self, app: Flask, client: FlaskClient) -> None:
+        """
+        Asserts a Section write that does not change whether its
+        course is complete does not touch the rollup tables
+
+        Args:
+            app (Flask): Flask app instance
+            client (FlaskClient): client returned by fixture
+        """
+        statements = []
+
+        def record(*args) -> None:
+            statements.append(args[2])
+
+        client.post("/api/v1/cert", json=self.cert_data_1)
+        client.post("/api/v1/resource", json=self.resource_data_1)
+        client.post("/api/v1/section/bulk", json=[self.section_data_1, self.section_data_2])
+        with app.app_context():
+            event.listen(db.engine, "before_cursor_execute", record)
+            try:
+                client.patch("/api/v1/section/1", json={"complete": True, "title": "Renamed"})
+            finally:
+                event.remove(db.engine, "before_cursor_execute", record)
+        assert \
+            statements and \
+            not [statement for statement in statements if "resource_stats" in statement]
+
+    def test_get_cert_stats_returns_none(self, client: FlaskClient) -> None:
+        """
+        Asserts the API returns null if the Cert does not exist
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        response = client.get("/api/v1/cert/1/stats")
+        assert response.json is None
@@ -0,0 +1,97 @@
+"""
+Typeahead suggestion test module
+"""
+
+# pylint: disable=duplicate-code, line-too-long
+
+from flask.testing import FlaskClient
+
+
+class TestSuggest:
+    """
+    Tests prefix suggestions for the search box
+    """
+
+    @classmethod
+    def setup_class(cls) -> None:
+        """
+        Setup class before all tests run
+        """
+        cls.api_url = "http://127.0.0.1:5000/api/v1"
+        cls.cert_data_1 = None
+        cls.cert_data_2 = None
+
+    def setup_method(self) -> None:
+        """
+        Setup class before all tests run
+        """
+        # create new cert from form
+        self.cert_data_1 = {
+            "name": "Test",
+            "code": "tst-101",
+            "date": "01/01/2000",
+            "head_img": "test/test.jpg",
+            "badge_img": "etest/BADGE_test.png",
+            "exam_date": "",
+            "complete": False,
+            "tags": "test",
+        }
+        self.cert_data_2 = {
+            "name": "Test2",
+            "code": "tst-102",
+            "date": "01/01/2000",
+            "head_img": "test2/test2.jpg",
+            "badge_img": "etest/BADGE_test2.png",
+            "exam_date": "",
+            "complete": False,
+            "tags": "test2",
+        }
+
+    def test_suggest_matches_word_prefixes(self, client: FlaskClient) -> None:
+        """
+        Asserts names, codes, and tags with a word starting with
+        the query are suggested
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        client.post("/api/v1/cert", json={**self.cert_data_1, "name": "Solutions Architect"})
+        client.post("/api/v1/cert", json=self.cert_data_2)
+        architect = client.get("/api/v1/suggest?q=arch").json
+        code = client.get("/api/v1/suggest?q=TST-102").json
+        tags = client.get("/api/v1/suggest?q=test").json
+        assert \
+            architect == [{"text": "Solutions Architect", "type": "name", "cert_id": 1}] and \
+            code == [{"text": "tst-102", "type": "code", "cert_id": 2}] and \
+            [tag["text"] for tag in tags if tag["type"] == "tag"] == ["test", "test2"]
+
+    def test_suggest_reflects_cert_changes(self, client: FlaskClient) -> None:
+        """
+        Asserts suggestions change when a Cert is updated
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        client.post("/api/v1/cert", json=self.cert_data_1)
+        before = client.get("/api/v1/suggest?q=tes").json
+        client.patch("/api/v1/cert/1", json={"name": "Renamed"})
+        after = client.get("/api/v1/suggest?q=tes").json
+        renamed = client.get("/api/v1/suggest?q=ren").json
+        assert \
+            {"text": "Test", "type": "name", "cert_id": 1} in before and \
+            {"text": "Test", "type": "name", "cert_id": 1} not in after and \
+            renamed == [{"text": "Renamed", "type": "name", "cert_id": 1}]
+
+    def test_suggest_limits_results(self, client: FlaskClient) -> None:
+        """
+        Asserts no more than 'limit' suggestions are returned and an
+        empty query returns nothing
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        client.post("/api/v1/cert", json=self.cert_data_1)
+        client.post("/api/v1/cert", json=self.cert_data_2)
+        limited = client.get("/api/v1/suggest?q=t&limit=1").json
+        empty = client.get("/api/v1/suggest?q=").json
+        assert len(limited) == 1 and empty == []
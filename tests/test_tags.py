@@ -0,0 +1,98 @@
+"""
+Tag test module
+"""
+
+# pylint: disable=duplicate-code, line-too-long
+
+from flask.testing import FlaskClient
+
+
+class TestTags:
+    """
+    Tests tag counts and filtering Certs by tag
+    """
+
+    @classmethod
+    def setup_class(cls) -> None:
+        """
+        Setup class before all tests run
+        """
+        cls.api_url = "http://127.0.0.1:5000/api/v1"
+        cls.cert_data_1 = None
+        cls.cert_data_2 = None
+
+    def setup_method(self) -> None:
+        """
+        Setup class before all tests run
+        """
+        # create new cert from form
+        self.cert_data_1 = {
+            "name": "Test",
+            "code": "tst-101",
+            "date": "01/01/2000",
+            "head_img": "test/test.jpg",
+            "badge_img": "etest/BADGE_test.png",
+            "exam_date": "",
+            "complete": False,
+            "tags": "test",
+        }
+        self.cert_data_2 = {
+            "name": "Test2",
+            "code": "tst-102",
+            "date": "01/01/2000",
+            "head_img": "test2/test2.jpg",
+            "badge_img": "etest/BADGE_test2.png",
+            "exam_date": "",
+            "complete": False,
+            "tags": "test2",
+        }
+
+    def test_get_tags_returns_counts(self, client: FlaskClient) -> None:
+        """
+        Asserts each tag is listed once with the number of Certs
+        that have it, most used first
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        client.post("/api/v1/cert", json={**self.cert_data_1, "tags": "AWS, cloud"})
+        client.post("/api/v1/cert", json={**self.cert_data_2, "tags": "aws,aws-security"})
+        response = client.get("/api/v1/tag")
+        assert response.json == [
+            {"name": "aws", "count": 2},
+            {"name": "aws-security", "count": 1},
+            {"name": "cloud", "count": 1},
+        ]
+
+    def test_get_all_certs_filters_by_tags(self, client: FlaskClient) -> None:
+        """
+        Asserts only Certs with every requested tag are returned and
+        tags are matched whole rather than as substrings
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        client.post("/api/v1/cert", json={**self.cert_data_1, "tags": "aws,cloud"})
+        client.post("/api/v1/cert", json={**self.cert_data_2, "tags": "aws-security,cloud"})
+        aws = client.get("/api/v1/cert?tag=aws").json
+        cloud = client.get("/api/v1/cert?tag=cloud").json
+        both = client.get("/api/v1/cert?tag=cloud&tag=aws-security").json
+        missing = client.get("/api/v1/cert?tag=cloud&tag=azure").json
+        assert \
+            [cert["name"] for cert in aws] == ["Test"] and \
+            [cert["name"] for cert in cloud] == ["Test", "Test2"] and \
+            [cert["name"] for cert in both] == ["Test2"] and \
+            missing == []
+
+    def test_patch_cert_tags_replaces_tags(self, client: FlaskClient) -> None:
+        """
+        Asserts changing a Cert's tags updates the tag filter
+
+        Args:
+            client (FlaskClient): client returned by fixture
+        """
+        client.post("/api/v1/cert", json=self.cert_data_1)
+        client.patch("/api/v1/cert/1", json={"tags": "azure"})
+        old = client.get("/api/v1/cert?tag=test").json
+        new = client.get("/api/v1/cert?tag=azure").json
+        assert old == [] and new[0]["id"] == 1